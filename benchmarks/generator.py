@@ -0,0 +1,108 @@
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, NamedTuple
+
+
+class Reading(NamedTuple):
+    time: datetime
+    device_id: int
+    site: str
+    value: float
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """
+    Shape of the synthetic time series
+
+    Args:
+        devices: Number of series (device_id values)
+        interval_seconds: Seconds between two readings of a device
+        duration: Time range covered by the readings
+        cardinality: Number of distinct site labels the devices are spread over
+        out_of_order_fraction: Share of readings delivered late, after readings
+            with a later timestamp
+        max_delay_ticks: How many ticks a late reading is delayed at most
+        start: Timestamp of the first reading
+        seed: Seed of the random generator, the same config always produces
+            the same readings
+    """
+
+    devices: int = 50
+    interval_seconds: float = 60.0
+    duration: timedelta = timedelta(days=14)
+    cardinality: int = 10
+    out_of_order_fraction: float = 0.0
+    max_delay_ticks: int = 60
+    start: datetime = field(
+        default_factory=lambda: datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+    seed: int = 42
+
+    def __post_init__(self):
+        if self.devices < 1 or self.cardinality < 1:
+            raise ValueError("devices and cardinality must be at least 1")
+        if self.interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        if not 0 <= self.out_of_order_fraction <= 1:
+            raise ValueError("out_of_order_fraction must be between 0 and 1")
+
+    @property
+    def ticks(self) -> int:
+        return int(self.duration.total_seconds() // self.interval_seconds)
+
+    @property
+    def rows(self) -> int:
+        return self.ticks * self.devices
+
+    @property
+    def end(self) -> datetime:
+        return self.start + timedelta(seconds=self.ticks * self.interval_seconds)
+
+
+def generate_readings(config: GeneratorConfig) -> Iterator[Reading]:
+    """
+    Yield the readings of every device, tick by tick, as a random walk
+
+    Late readings are held back for 1 to max_delay_ticks ticks and then
+    delivered with their original timestamp, like a device that reconnects.
+    """
+    rng = random.Random(config.seed)
+    sites = [f"site-{index}" for index in range(config.cardinality)]
+    device_sites = [
+        sites[device % config.cardinality] for device in range(config.devices)
+    ]
+    values = [rng.uniform(0, 100) for _ in range(config.devices)]
+    step = timedelta(seconds=config.interval_seconds)
+    delayed: Dict[int, List[Reading]] = {}
+
+    for tick in range(config.ticks):
+        time = config.start + step * tick
+        yield from delayed.pop(tick, [])
+        for device in range(config.devices):
+            values[device] += rng.gauss(0, 1)
+            reading = Reading(
+                time, device, device_sites[device], round(values[device], 3)
+            )
+            if (
+                config.out_of_order_fraction
+                and rng.random() < config.out_of_order_fraction
+            ):
+                release = tick + rng.randint(1, config.max_delay_ticks)
+                delayed.setdefault(release, []).append(reading)
+            else:
+                yield reading
+    for tick in sorted(delayed):
+        yield from delayed[tick]
+
+
+def batched(readings: Iterator[Reading], size: int) -> Iterator[List[Reading]]:
+    batch = []
+    for reading in readings:
+        batch.append(reading)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
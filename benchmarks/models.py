@@ -0,0 +1,49 @@
+import types
+from typing import List, Optional, Type
+
+from sqlmodel import Field
+
+from timescaledb import TimescaleModel
+from timescaledb.indexes import composite_index
+
+
+class BenchReading(TimescaleModel, table=True):
+    """Hypertable the ingest and query benchmarks run against."""
+
+    __tablename__ = "bench_reading"
+
+    device_id: int
+    site: str
+    value: float
+
+    __chunk_time_interval__ = "INTERVAL 1 day"
+    __drop_after__ = None
+    __enable_compression__ = True
+    __compress_segmentby__ = "device_id"
+    __compress_orderby__ = "time DESC"
+    __time_series_indexes__ = [composite_index("device_id")]
+
+
+def make_models(count: int, prefix: str = "bench_model") -> List[Type[TimescaleModel]]:
+    """
+    Create `count` hypertable models for the metadata.create_all benchmark
+    """
+    models = []
+    for index in range(count):
+        namespace = {
+            "__module__": __name__,
+            "__tablename__": f"{prefix}_{index}",
+            "__annotations__": {"device_id": int, "value": Optional[float]},
+            "device_id": Field(index=True),
+            "value": None,
+            "__drop_after__": None,
+        }
+        models.append(
+            types.new_class(
+                f"BenchModel{index}",
+                (TimescaleModel,),
+                {"table": True},
+                lambda ns, namespace=namespace: ns.update(namespace),
+            )
+        )
+    return models
@@ -0,0 +1,156 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+
+import timescaledb
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark, in seconds."""
+
+    name: str
+    runs: List[float]
+    rows: Optional[int] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.runs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.runs)
+        data = asdict(self)
+        data.update(
+            min=ordered[0],
+            max=ordered[-1],
+            mean=statistics.fmean(ordered),
+            median=self.median,
+            p95=ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+        )
+        if self.rows:
+            data["rows_per_second"] = self.rows / self.median
+        return data
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = 5,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+    rows: Optional[int] = None,
+    **params: Any,
+) -> BenchmarkResult:
+    """
+    Time `func` `repeat` times after `warmup` untimed runs, calling `setup`
+    (untimed) before every run
+    """
+    runs = []
+    for iteration in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        if iteration >= warmup:
+            runs.append(elapsed)
+    result = BenchmarkResult(name=name, runs=runs, rows=rows, params=params)
+    print(f"{name:<40} median {result.median * 1000:10.2f}ms", flush=True)
+    return result
+
+
+def environment(engine: Engine) -> Dict[str, Any]:
+    """
+    Versions and settings that affect the results, stored with them
+    """
+    with engine.connect() as connection:
+        server = connection.execute(sqlalchemy.text("SHOW server_version")).scalar()
+        extension = connection.execute(
+            sqlalchemy.text(
+                "SELECT extversion FROM pg_extension WHERE extname = 'timescaledb'"
+            )
+        ).scalar()
+        shared_buffers = connection.execute(
+            sqlalchemy.text("SHOW shared_buffers")
+        ).scalar()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "library_version": timescaledb.__version__,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "driver": engine.dialect.driver,
+        "postgres": server,
+        "timescaledb": extension,
+        "shared_buffers": shared_buffers,
+        "platform": platform.platform(),
+    }
+
+
+def write_results(
+    path: str, env: Dict[str, Any], results: List[BenchmarkResult], config: Dict
+) -> None:
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "environment": env,
+                "config": config,
+                "results": [result.to_dict() for result in results],
+            },
+            f,
+            indent=2,
+            default=str,
+        )
+        f.write("\n")
+
+
+def compare(baseline_path: str, current_path: str, threshold: float = 0.1) -> int:
+    """
+    Print the median change of every benchmark between two result files
+
+    Returns:
+        The number of benchmarks that got slower by more than `threshold`
+    """
+    with open(baseline_path) as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+    with open(current_path) as f:
+        current = {r["name"]: r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for name, result in current.items():
+        if name not in baseline:
+            print(f"{name:<40} new")
+            continue
+        change = result["median"] / baseline[name]["median"] - 1
+        marker = ""
+        if change > threshold:
+            marker = "  SLOWER"
+            regressions += 1
+        elif change < -threshold:
+            marker = "  faster"
+        print(
+            f"{name:<40} {baseline[name]['median'] * 1000:10.2f}ms -> "
+            f"{result['median'] * 1000:10.2f}ms ({change:+.1%}){marker}"
+        )
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
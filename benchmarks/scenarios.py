@@ -0,0 +1,262 @@
+import csv
+import io
+from datetime import timedelta
+from typing import List, Optional
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+import timescaledb
+from timescaledb.compression import compress_chunks, enable_table_compression
+from timescaledb.hypertables import sync_all_hypertables
+from timescaledb.indexes import sync_time_series_indexes
+
+from benchmarks.generator import GeneratorConfig, Reading, batched, generate_readings
+from benchmarks.models import BenchReading, make_models
+from benchmarks.runner import BenchmarkResult, measure
+
+COPY_COLUMNS = ("time", "device_id", "site", "value")
+
+
+def reset_bench_table(engine: Engine) -> None:
+    """
+    Recreate the benchmark hypertable, empty and without policies (so no
+    background job runs during a benchmark)
+    """
+    BenchReading.__table__.drop(engine, checkfirst=True)
+    BenchReading.__table__.create(engine)
+    with Session(engine) as session:
+        sync_all_hypertables(session, BenchReading)
+        sync_time_series_indexes(session, BenchReading)
+        enable_table_compression(session, BenchReading)
+
+
+def ingest_orm(engine: Engine, readings: List[Reading], batch_size: int) -> None:
+    """One ORM object per row, committed per batch."""
+    with Session(engine) as session:
+        for batch in batched(iter(readings), batch_size):
+            session.add_all(BenchReading(**reading._asdict()) for reading in batch)
+            session.commit()
+
+
+def ingest_batched(engine: Engine, readings: List[Reading], batch_size: int) -> None:
+    """Core INSERT with a list of parameter sets per batch (insertmanyvalues)."""
+    statement = sqlalchemy.insert(BenchReading.__table__)
+    with engine.begin() as connection:
+        for batch in batched(iter(readings), batch_size):
+            connection.execute(statement, [reading._asdict() for reading in batch])
+
+
+def ingest_copy(engine: Engine, readings: List[Reading], batch_size: int) -> None:
+    """COPY FROM STDIN through the driver connection."""
+    copy_sql = (
+        f"COPY {BenchReading.__tablename__} ({', '.join(COPY_COLUMNS)}) FROM STDIN"
+    )
+    raw_connection = engine.raw_connection()
+    try:
+        cursor = raw_connection.cursor()
+        if hasattr(cursor, "copy"):
+            # psycopg 3
+            with cursor.copy(copy_sql) as copy:
+                for reading in readings:
+                    copy.write_row(reading)
+        else:
+            # psycopg2
+            for batch in batched(iter(readings), batch_size):
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(batch)
+                buffer.seek(0)
+                cursor.copy_expert(f"{copy_sql} WITH (FORMAT csv)", buffer)
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+
+
+INGEST_METHODS = {
+    "orm": ingest_orm,
+    "batched": ingest_batched,
+    "copy": ingest_copy,
+}
+
+
+def run_ingest_benchmarks(
+    engine: Engine,
+    config: GeneratorConfig,
+    batch_size: int,
+    repeat: int,
+    methods: List[str],
+) -> List[BenchmarkResult]:
+    readings = list(generate_readings(config))
+    results = []
+    for method in methods:
+        ingest = INGEST_METHODS[method]
+        results.append(
+            measure(
+                f"ingest_{method}",
+                lambda ingest=ingest: ingest(engine, readings, batch_size),
+                repeat=repeat,
+                warmup=0,
+                setup=lambda: reset_bench_table(engine),
+                rows=len(readings),
+                batch_size=batch_size,
+            )
+        )
+    return results
+
+
+def run_query_benchmarks(
+    engine: Engine, config: GeneratorConfig, repeat: int
+) -> List[BenchmarkResult]:
+    """
+    Bucket queries over the newest (uncompressed) half of the data and over
+    the oldest, compressed half, plus a gapfilled query
+    """
+    reset_bench_table(engine)
+    ingest_copy(engine, list(generate_readings(config)), batch_size=10_000)
+    midpoint = config.start + (config.end - config.start) / 2
+    compressed = compress_chunks(engine, BenchReading, older_than=midpoint)
+    with engine.begin() as connection:
+        connection.execute(sqlalchemy.text(f"ANALYZE {BenchReading.__tablename__}"))
+
+    hot_range = [BenchReading.time >= midpoint, BenchReading.time < config.end]
+    cold_range = [BenchReading.time >= config.start, BenchReading.time < midpoint]
+    week = timedelta(days=7)
+    params = {"compressed_chunks": len(compressed)}
+
+    results = []
+    with Session(engine) as session:
+        for name, filters in (("hot", hot_range), ("compressed", cold_range)):
+            results.append(
+                measure(
+                    f"time_bucket_{name}",
+                    lambda filters=filters: timescaledb.time_bucket_query(
+                        session,
+                        BenchReading,
+                        interval="1 hour",
+                        metric_field="value",
+                        filters=filters,
+                    ),
+                    repeat=repeat,
+                    **params,
+                )
+            )
+            results.append(
+                measure(
+                    f"time_bucket_{name}_one_device",
+                    lambda filters=filters: timescaledb.time_bucket_query(
+                        session,
+                        BenchReading,
+                        interval="1 hour",
+                        metric_field="value",
+                        filters=[*filters, BenchReading.device_id == 0],
+                    ),
+                    repeat=repeat,
+                    **params,
+                )
+            )
+        results.append(
+            measure(
+                "time_bucket_gapfill_locf",
+                lambda: timescaledb.time_bucket_gapfill_query(
+                    session,
+                    BenchReading,
+                    interval="15 minutes",
+                    metric_field="value",
+                    start=max(config.end - week, midpoint),
+                    finish=config.end,
+                    use_locf=True,
+                    filters=[BenchReading.device_id == 0],
+                ),
+                repeat=repeat,
+                **params,
+            )
+        )
+    return results
+
+
+def run_create_all_benchmarks(
+    engine: Engine, model_count: int, repeat: int
+) -> List[BenchmarkResult]:
+    """
+    metadata.create_all with `model_count` extra hypertable models: the first
+    run creates the hypertables, the following ones only sync them
+    """
+    models = make_models(model_count)
+    tables = [model.__table__ for model in models]
+
+    def drop_tables():
+        SQLModel.metadata.drop_all(engine, tables=tables)
+        SQLModel.metadata.create_all(engine, tables=tables)
+
+    results = [
+        measure(
+            "create_all_cold",
+            lambda: timescaledb.metadata.create_all(engine),
+            repeat=repeat,
+            warmup=0,
+            setup=drop_tables,
+            models=model_count,
+        ),
+        measure(
+            "create_all_warm",
+            lambda: timescaledb.metadata.create_all(engine),
+            repeat=repeat,
+            models=model_count,
+        ),
+    ]
+    SQLModel.metadata.drop_all(engine, tables=tables)
+    return results
+
+
+def run_pgbouncer_benchmarks(
+    engine: Engine,
+    config: GeneratorConfig,
+    repeat: int,
+    transactions: int,
+    pgbouncer_url: Optional[str] = None,
+) -> List[BenchmarkResult]:
+    """
+    Throughput of short transactions (one time_bucket_query each) with the
+    session settings sent as connection startup options vs. applied with
+    SET LOCAL in every transaction (PgBouncer mode). Without a PgBouncer URL
+    both run against the database directly, which isolates the cost of the
+    extra statement per transaction.
+    """
+    reset_bench_table(engine)
+    ingest_copy(engine, list(generate_readings(config)), batch_size=10_000)
+    day_range = [
+        BenchReading.time >= config.end - timedelta(days=1),
+        BenchReading.time < config.end,
+    ]
+    engines = {
+        "startup_options": timescaledb.create_engine(engine.url),
+        "set_local": timescaledb.create_engine(
+            pgbouncer_url or engine.url, profile="pgbouncer-transaction"
+        ),
+    }
+
+    def run_transactions(bench_engine: Engine) -> None:
+        for _ in range(transactions):
+            with Session(bench_engine) as session:
+                timescaledb.time_bucket_query(
+                    session,
+                    BenchReading,
+                    interval="1 hour",
+                    metric_field="value",
+                    filters=[*day_range, BenchReading.device_id == 0],
+                )
+
+    results = []
+    for mode, bench_engine in engines.items():
+        results.append(
+            measure(
+                f"transactions_{mode}",
+                lambda bench_engine=bench_engine: run_transactions(bench_engine),
+                repeat=repeat,
+                rows=transactions,
+                through_pgbouncer=mode == "set_local" and pgbouncer_url is not None,
+            )
+        )
+        bench_engine.dispose()
+    return results
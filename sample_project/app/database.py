@@ -9,7 +9,9 @@ from .config import (
 )
 
 # time zone focused wrapper for sqlmodel.create_engine/sqlalchemy.create_engine
-engine = timescaledb.create_engine(DATABASE_URL, timezone=TIME_ZONE, echo=ECHO_QUERIES)
+engine = timescaledb.create_engine(
+    DATABASE_URL, timezone=TIME_ZONE, profile="api", echo=ECHO_QUERIES
+)
 
 
 def init_db():
@@ -20,6 +22,9 @@ def init_db():
     print("Creating hypertables...")
     timescaledb.metadata.create_all(engine)
 
+    # Open the pool's connections before the first requests arrive
+    timescaledb.warm_up(engine)
+
 
 def get_session():
     with Session(engine) as session:
@@ -7,7 +7,7 @@ from timescaledb import TimescaleModel
 
 
 class Metric(TimescaleModel, table=True):
-    temp: float = Field(index=True)
+    temp: float
 
     __enable_compression__ = True
     __compress_orderby__ = "time"
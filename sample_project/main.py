@@ -1,14 +1,24 @@
 from datetime import datetime, timedelta, timezone
 
 from app import models
-from app.database import get_session, init_db
+from app.database import engine, get_session, init_db
 from fastapi import Depends, FastAPI, HTTPException
 from sqlmodel import Session, desc
 
-from timescaledb import list_hypertables
+from timescaledb import Page, list_hypertables, paginate
+from timescaledb.metrics import MetricsCollector
+from timescaledb.metrics.router import create_metrics_router
+from timescaledb.pagination import PageParams
+from timescaledb.pagination.dependencies import pagination_params
 from timescaledb.queries import time_bucket_gapfill_query
 
 app = FastAPI(title="FastAPI SQLModel Demo")
+# Prometheus scrape endpoint, /metrics/ is taken by the Metric API below
+app.include_router(
+    create_metrics_router(
+        MetricsCollector(engine, cache_seconds=15), path="/prometheus"
+    )
+)
 
 
 @app.on_event("startup")
@@ -42,10 +52,13 @@ def read_metric(metric_id: int, session: Session = Depends(get_session)):
     return metric
 
 
-@app.get("/metrics/", response_model=list[models.MetricRead])
-def list_metrics(session: Session = Depends(get_session)):
-    metrics = session.query(models.Metric).all()
-    return metrics
+@app.get("/metrics/", response_model=Page)
+def list_metrics(
+    page: PageParams = Depends(pagination_params(models.Metric, default_limit=100)),
+    session: Session = Depends(get_session),
+):
+    # Newest first, follow next_cursor for older metrics
+    return paginate(session, models.Metric, cursor=page.cursor, limit=page.limit)
 
 
 @app.get("/metrics/buckets/", response_model=list[dict])
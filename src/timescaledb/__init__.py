@@ -2,22 +2,160 @@ from __future__ import annotations
 
 __version__ = "0.0.4"
 
-from . import metadata
-from .activator import activate_timescaledb_extension
-from .compression import (
-    add_compression_policy,
-    enable_table_compression,
-    sync_compression_policies,
-)
-from .engine import create_engine
-from .hypertables import (
-    create_hypertable,
-    list_hypertables,
-    sync_all_hypertables,
-)
-from .models import TimescaleModel
-from .queries import time_bucket_gapfill_query, time_bucket_query
-from .retention import add_retention_policy, sync_retention_policies
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import defaults, metadata
+    from .activator import activate_timescaledb_extension
+    from .compression import (
+        add_compression_policy,
+        compress_chunks,
+        decompress_chunks,
+        enable_table_compression,
+        get_chunk_compression_stats,
+        get_hypertable_compression_stats,
+        migrate_compression_settings,
+        sync_compression_policies,
+    )
+    from .engine import create_engine, warm_up
+    from .hypertables import (
+        chunks_detailed_size,
+        create_hypertable,
+        drop_chunks,
+        list_chunks,
+        list_hypertables,
+        recommend_chunk_time_interval,
+        set_chunk_time_interval,
+        show_chunks,
+        sync_all_hypertables,
+    )
+    from .explain import (
+        disable_auto_explain,
+        enable_auto_explain,
+        explain_query,
+        explaining,
+    )
+    from .indexes import brin_index, composite_index, partial_index
+    from .instrumentation import (
+        HistogramCollector,
+        LoggingListener,
+        QueryEvent,
+        add_listener,
+        remove_listener,
+    )
+    from .jobs import alter_job, get_jobs_health, list_jobs, run_job
+    from .latest import LatestValueCache
+    from .models import TimescaleModel
+    from .pagination import Page, paginate
+    from .queries import (
+        candlestick_query,
+        counter_agg_query,
+        latest_per_series,
+        time_bucket_gapfill_query,
+        time_bucket_query,
+        time_weight_query,
+    )
+    from .reorder import (
+        add_reorder_policy,
+        reorder_chunk,
+        reorder_chunks,
+        sync_reorder_policies,
+    )
+    from .retention import add_retention_policy, sync_retention_policies
+    from .routing import EngineRouter
+    from .rows import row_class, select_rows, stream_rows
+
+# Public names and the submodule defining them. They are imported on first
+# access (PEP 562), so `import timescaledb` does not load SQLAlchemy, SQLModel
+# and pydantic until something is actually used.
+_LAZY_ATTRIBUTES = {
+    "activate_timescaledb_extension": "activator",
+    "add_compression_policy": "compression",
+    "compress_chunks": "compression",
+    "decompress_chunks": "compression",
+    "enable_table_compression": "compression",
+    "get_chunk_compression_stats": "compression",
+    "get_hypertable_compression_stats": "compression",
+    "migrate_compression_settings": "compression",
+    "sync_compression_policies": "compression",
+    "create_engine": "engine",
+    "warm_up": "engine",
+    "chunks_detailed_size": "hypertables",
+    "create_hypertable": "hypertables",
+    "drop_chunks": "hypertables",
+    "list_chunks": "hypertables",
+    "list_hypertables": "hypertables",
+    "recommend_chunk_time_interval": "hypertables",
+    "set_chunk_time_interval": "hypertables",
+    "show_chunks": "hypertables",
+    "sync_all_hypertables": "hypertables",
+    "disable_auto_explain": "explain",
+    "enable_auto_explain": "explain",
+    "explain_query": "explain",
+    "explaining": "explain",
+    "brin_index": "indexes",
+    "composite_index": "indexes",
+    "partial_index": "indexes",
+    "HistogramCollector": "instrumentation",
+    "LoggingListener": "instrumentation",
+    "QueryEvent": "instrumentation",
+    "add_listener": "instrumentation",
+    "remove_listener": "instrumentation",
+    "alter_job": "jobs",
+    "get_jobs_health": "jobs",
+    "list_jobs": "jobs",
+    "run_job": "jobs",
+    "TimescaleModel": "models",
+    "candlestick_query": "queries",
+    "counter_agg_query": "queries",
+    "time_bucket_gapfill_query": "queries",
+    "time_bucket_query": "queries",
+    "time_weight_query": "queries",
+    "latest_per_series": "queries",
+    "LatestValueCache": "latest",
+    "paginate": "pagination",
+    "Page": "pagination",
+    "add_reorder_policy": "reorder",
+    "reorder_chunk": "reorder",
+    "reorder_chunks": "reorder",
+    "sync_reorder_policies": "reorder",
+    "add_retention_policy": "retention",
+    "sync_retention_policies": "retention",
+    "EngineRouter": "routing",
+    "select_rows": "rows",
+    "stream_rows": "rows",
+    "row_class": "rows",
+}
+
+# Submodules and subpackages, loaded on first attribute access like the names
+# above (e.g., timescaledb.hypertables after import timescaledb)
+_LAZY_SUBMODULES = {
+    "activator",
+    "cleaners",
+    "compression",
+    "defaults",
+    "engine",
+    "exceptions",
+    "explain",
+    "hyperfunctions",
+    "hypertables",
+    "indexes",
+    "instrumentation",
+    "jobs",
+    "latest",
+    "metadata",
+    "metrics",
+    "models",
+    "pagination",
+    "queries",
+    "reorder",
+    "retention",
+    "routing",
+    "rows",
+    "testing",
+    "utils",
+}
 
 __all__ = [
     "metadata",
@@ -26,14 +164,72 @@ __all__ = [
     "sync_all_hypertables",
     "create_hypertable",
     "list_hypertables",
+    "show_chunks",
+    "list_chunks",
+    "drop_chunks",
+    "chunks_detailed_size",
+    "composite_index",
+    "partial_index",
+    "brin_index",
+    "list_jobs",
+    "run_job",
+    "alter_job",
+    "get_jobs_health",
+    "recommend_chunk_time_interval",
+    "set_chunk_time_interval",
     "create_engine",
+    "warm_up",
+    "explain_query",
+    "explaining",
+    "enable_auto_explain",
+    "disable_auto_explain",
+    "add_listener",
+    "remove_listener",
+    "QueryEvent",
+    "HistogramCollector",
+    "LoggingListener",
     "time_bucket_query",
     "time_bucket_gapfill_query",
+    "candlestick_query",
+    "counter_agg_query",
+    "time_weight_query",
+    "latest_per_series",
+    "LatestValueCache",
+    "select_rows",
+    "stream_rows",
+    "row_class",
+    "EngineRouter",
+    "paginate",
+    "Page",
     "defaults",
-    "get_defaults",
     "add_retention_policy",
     "sync_retention_policies",
+    "add_reorder_policy",
+    "sync_reorder_policies",
+    "reorder_chunk",
+    "reorder_chunks",
     "add_compression_policy",
     "enable_table_compression",
     "sync_compression_policies",
+    "compress_chunks",
+    "decompress_chunks",
+    "get_hypertable_compression_stats",
+    "get_chunk_compression_stats",
+    "migrate_compression_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,8 @@
+import re
 from datetime import timedelta
 
+INTERVAL_KEYWORD = re.compile(r"^\s*INTERVAL\b", re.IGNORECASE)
+
 
 def clean_interval(interval: str | int | timedelta) -> tuple[str | int, bool]:
     """
@@ -21,12 +24,17 @@ def clean_interval(interval: str | int | timedelta) -> tuple[str | int, bool]:
         cleaned_interval = interval
         return cleaned_interval, "INTEGER"
     elif isinstance(interval, str):
-        # Such as INTERVAL 1 day
-        # or INTERVAL '2 weeks'
-        # pop the term "INTERVAL"
-        cleaned_interval = interval.replace("INTERVAL", "").strip()
-        # remove any extra quotes
-        cleaned_interval = cleaned_interval.replace("'", "").replace('"', "")
-        return cleaned_interval, "INTERVAL"
+        return clean_interval_string(interval), "INTERVAL"
     else:
         return interval, "INVALID"
+
+
+def clean_interval_string(interval: str) -> str:
+    """
+    Strip the INTERVAL keyword (in any case) and quotes from an interval string
+
+    Such as INTERVAL 1 day, interval '2 weeks' or "3 months"
+    """
+    cleaned_interval = INTERVAL_KEYWORD.sub("", interval).strip()
+    # remove any extra quotes
+    return cleaned_interval.replace("'", "").replace('"', "")
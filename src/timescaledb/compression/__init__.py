@@ -1,9 +1,40 @@
 from .add import add_compression_policy
+from .advisor import check_compression_settings, recommend_compression_settings
+from .chunks import compress_chunks, decompress_chunks
 from .enable import enable_table_compression
+from .migrate import (
+    get_compression_settings,
+    get_outdated_compressed_chunks,
+    migrate_compression_settings,
+)
+from .schemas import (
+    ChunkCompressionResult,
+    ChunkCompressionStats,
+    CompressionMigrationResult,
+    CompressionRecommendation,
+    CompressionSettings,
+    HypertableCompressionStats,
+)
+from .stats import get_chunk_compression_stats, get_hypertable_compression_stats
 from .sync import sync_compression_policies
 
 __all__ = [
     "add_compression_policy",
     "enable_table_compression",
     "sync_compression_policies",
+    "compress_chunks",
+    "decompress_chunks",
+    "ChunkCompressionResult",
+    "get_hypertable_compression_stats",
+    "get_chunk_compression_stats",
+    "HypertableCompressionStats",
+    "ChunkCompressionStats",
+    "recommend_compression_settings",
+    "check_compression_settings",
+    "CompressionRecommendation",
+    "get_compression_settings",
+    "get_outdated_compressed_chunks",
+    "migrate_compression_settings",
+    "CompressionSettings",
+    "CompressionMigrationResult",
 ]
@@ -0,0 +1,240 @@
+from typing import Dict, List, Optional, Tuple, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb import exceptions
+from timescaledb.compression import sql, validators
+from timescaledb.compression.schemas import (
+    ColumnCompressionStats,
+    CompressionRecommendation,
+)
+from timescaledb.defaults import COMPRESS_MIN_ROWS_PER_SEGMENT, TIME_COLUMN
+from timescaledb.hypertables.chunks import list_chunks
+
+
+def recommend_compression_settings(
+    session: Session,
+    model: Type[SQLModel],
+    sample_chunk: bool = True,
+    min_rows_per_segment: int = COMPRESS_MIN_ROWS_PER_SEGMENT,
+) -> CompressionRecommendation:
+    """
+    Recommend compress_segmentby/compress_orderby settings for a hypertable
+
+    Column cardinality is read from pg_stats (run ANALYZE first) and, when
+    `sample_chunk` is True, measured exactly on the most recent complete chunk.
+    The recommended segmentby is the most selective column that still leaves
+    at least `min_rows_per_segment` rows per segment in each chunk.
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class of the hypertable
+        sample_chunk: Count distinct values in one chunk instead of relying
+            on pg_stats only
+        min_rows_per_segment: Fewest rows per segment per chunk considered
+            to compress well
+
+    Returns:
+        CompressionRecommendation with per-column estimates and warnings
+    """
+    time_column = getattr(model, "__time_column__", TIME_COLUMN)
+    candidates = _get_segmentby_candidates(model, time_column)
+    rows_per_chunk, columns = _get_column_stats(
+        session, model, candidates, sample_chunk=sample_chunk
+    )
+
+    warnings = []
+    if rows_per_chunk is None or not any(
+        column.rows_per_segment is not None for column in columns.values()
+    ):
+        warnings.append(
+            f"No statistics available for {model.__tablename__}, "
+            "load data and run ANALYZE before asking for a recommendation"
+        )
+
+    suitable = [
+        column
+        for column in columns.values()
+        if column.rows_per_segment is not None
+        and column.rows_per_segment >= min_rows_per_segment
+    ]
+    best = min(suitable, key=lambda column: column.rows_per_segment, default=None)
+
+    return CompressionRecommendation(
+        table_name=model.__tablename__,
+        compress_segmentby=best.column if best is not None else None,
+        compress_orderby=f"{time_column} DESC",
+        rows_per_segment=best.rows_per_segment if best is not None else None,
+        rows_per_chunk=rows_per_chunk,
+        columns=list(columns.values()),
+        warnings=warnings,
+    )
+
+
+def check_compression_settings(
+    session: Session,
+    model: Type[SQLModel],
+    compress_segmentby: Optional[str] = None,
+    compress_orderby: Optional[str] = None,
+    sample_chunk: bool = False,
+    min_rows_per_segment: int = COMPRESS_MIN_ROWS_PER_SEGMENT,
+) -> List[str]:
+    """
+    Check declared compression settings against column statistics
+
+    Defaults to the model's __compress_segmentby__/__compress_orderby__.
+    Settings that cannot be judged (e.g., no statistics yet) produce no warning.
+
+    Returns:
+        List[str]: Human readable warnings about settings likely to compress poorly
+    """
+    if compress_segmentby is None:
+        compress_segmentby = getattr(model, "__compress_segmentby__", None)
+    if compress_orderby is None:
+        compress_orderby = getattr(model, "__compress_orderby__", None)
+    time_column = getattr(model, "__time_column__", TIME_COLUMN)
+
+    warnings = []
+    if compress_orderby:
+        orderby_columns = [
+            spec.split()[0] for spec in compress_orderby.split(",") if spec.strip()
+        ]
+        if time_column not in orderby_columns:
+            warnings.append(
+                f"compress_orderby '{compress_orderby}' does not include the time "
+                f"column '{time_column}', time range filters on compressed chunks "
+                "will not be able to skip batches"
+            )
+
+    if not compress_segmentby:
+        return warnings
+
+    segmentby_columns = [
+        column.strip() for column in compress_segmentby.split(",") if column.strip()
+    ]
+    _, columns = _get_column_stats(
+        session, model, segmentby_columns, sample_chunk=sample_chunk
+    )
+    for name in segmentby_columns:
+        rows_per_segment = columns[name].rows_per_segment
+        if rows_per_segment is not None and rows_per_segment < min_rows_per_segment:
+            warnings.append(
+                f"compress_segmentby column '{name}' leaves about "
+                f"{rows_per_segment:.0f} rows per segment in each chunk "
+                f"(fewer than {min_rows_per_segment}), compression and queries "
+                "on compressed chunks will likely be poor"
+            )
+    return warnings
+
+
+def _get_segmentby_candidates(model: Type[SQLModel], time_column: str) -> List[str]:
+    candidates = []
+    for column in model.__table__.columns:
+        if column.name == time_column:
+            continue
+        try:
+            validators.validate_compress_segmentby_field(model, column.name)
+        except exceptions.InvalidSegmentByField:
+            continue
+        candidates.append(column.name)
+    return candidates
+
+
+def _get_column_stats(
+    session: Session,
+    model: Type[SQLModel],
+    columns: List[str],
+    sample_chunk: bool = False,
+) -> Tuple[Optional[float], Dict[str, ColumnCompressionStats]]:
+    """
+    Estimate rows per chunk and distinct values per chunk of the given columns.
+
+    Sources, from most to least precise: exact counts on a sample chunk,
+    pg_stats of that chunk (kept fresh by autovacuum) and pg_stats of the
+    hypertable itself (only present after ANALYZE on the hypertable).
+    """
+    chunks = list_chunks(session, model=model)
+    # The newest chunk is usually still filling up, prefer the one before it
+    reference_chunk = None
+    if chunks:
+        reference_chunk = chunks[-2] if len(chunks) > 1 else chunks[-1]
+
+    rows_per_chunk = None
+    distinct_per_chunk = {}
+    if sample_chunk and reference_chunk is not None and columns:
+        row = session.execute(
+            sqlalchemy.text(
+                sql.format_sample_chunk_sql(reference_chunk.qualified_name, columns)
+            )
+        ).fetchone()
+        if row is not None and row.row_count:
+            rows_per_chunk = row.row_count
+            distinct_per_chunk = {column: row._mapping[column] for column in columns}
+
+    pg_stats = {}
+    if reference_chunk is not None:
+        pg_stats = _get_pg_stats(session, reference_chunk.chunk_name)
+        if pg_stats and rows_per_chunk is None:
+            rows_per_chunk = (
+                session.execute(
+                    sqlalchemy.text(sql.CHUNK_ROW_ESTIMATE_SQL),
+                    {"chunk_name": reference_chunk.qualified_name},
+                ).scalar()
+                or None
+            )
+            distinct_per_chunk = {
+                column: _get_n_distinct(pg_stats.get(column), rows_per_chunk)
+                for column in columns
+            }
+
+    if not pg_stats:
+        pg_stats = _get_pg_stats(session, model.__tablename__)
+        total_rows = session.execute(
+            sqlalchemy.text(sql.APPROXIMATE_ROW_COUNT_SQL),
+            {"table_name": model.__tablename__},
+        ).scalar()
+        if rows_per_chunk is None and chunks and total_rows:
+            rows_per_chunk = total_rows / len(chunks)
+        if not distinct_per_chunk and rows_per_chunk:
+            for column in columns:
+                n_distinct = _get_n_distinct(pg_stats.get(column), total_rows)
+                if n_distinct is not None:
+                    # A chunk cannot hold more distinct values than rows
+                    n_distinct = min(n_distinct, rows_per_chunk)
+                distinct_per_chunk[column] = n_distinct
+
+    stats = {}
+    for column in columns:
+        column_stats = pg_stats.get(column)
+        n_distinct = distinct_per_chunk.get(column)
+        rows_per_segment = None
+        if rows_per_chunk and n_distinct:
+            rows_per_segment = rows_per_chunk / n_distinct
+        stats[column] = ColumnCompressionStats(
+            column=column,
+            n_distinct=n_distinct,
+            correlation=getattr(column_stats, "correlation", None),
+            null_frac=getattr(column_stats, "null_frac", None),
+            rows_per_segment=rows_per_segment,
+        )
+    return rows_per_chunk, stats
+
+
+def _get_pg_stats(session: Session, table_name: str) -> dict:
+    rows = session.execute(
+        sqlalchemy.text(sql.COLUMN_STATISTICS_SQL), {"table_name": table_name}
+    ).fetchall()
+    return {row.attname: row for row in rows}
+
+
+def _get_n_distinct(column_stats, row_count: Optional[float]) -> Optional[float]:
+    if column_stats is None or column_stats.n_distinct is None:
+        return None
+    n_distinct = column_stats.n_distinct
+    if n_distinct < 0:
+        # Negative values are a fraction of the number of rows
+        if not row_count:
+            return None
+        n_distinct = -n_distinct * row_count
+    return n_distinct
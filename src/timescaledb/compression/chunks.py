@@ -0,0 +1,281 @@
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Type, Union
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+from timescaledb.compression import sql
+from timescaledb.compression.schemas import ChunkCompressionResult
+from timescaledb.hypertables.chunks import (
+    chunks_detailed_size,
+    list_chunks,
+    show_chunks,
+)
+from timescaledb.hypertables.chunks.show import ChunkTimeArgument
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.instrumentation import instrumented
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[ChunkCompressionResult, int, int], None]
+
+# Statements run in a single transaction per chunk
+CHUNK_ACTION_SQL = {
+    "compress": (sql.COMPRESS_CHUNK_SQL,),
+    "decompress": (sql.DECOMPRESS_CHUNK_SQL,),
+    "recompress": (sql.DECOMPRESS_CHUNK_SQL, sql.COMPRESS_CHUNK_SQL),
+}
+
+
+@instrumented()
+def compress_chunks(
+    session_or_engine: Union[Session, Engine],
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    older_than: ChunkTimeArgument = None,
+    newer_than: ChunkTimeArgument = None,
+    workers: int = 1,
+    progress: Optional[ProgressCallback] = None,
+) -> List[ChunkCompressionResult]:
+    """
+    Compress the uncompressed chunks of a hypertable now, instead of waiting
+    for the compression policy.
+
+    Each chunk is compressed in its own transaction on a connection from the
+    engine's pool, so `workers` chunks are processed concurrently. Make sure
+    the pool allows at least `workers` connections.
+
+    Args:
+        session_or_engine: SQLModel session (its bind is used) or SQLAlchemy engine
+        model: SQLModel class of the hypertable
+        table_name: Name of the hypertable (alternative to model)
+        older_than: Only compress chunks older than this interval or timestamp
+        newer_than: Only compress chunks newer than this interval or timestamp
+        workers: Number of chunks to compress concurrently
+        progress: Optional callback called as progress(result, done, total)
+            after each chunk
+
+    Returns:
+        List[ChunkCompressionResult]: Per-chunk timing, size before/after and
+        error (if any), in the order the chunks finished
+    """
+    return _process_chunks(
+        "compress",
+        session_or_engine,
+        model=model,
+        table_name=table_name,
+        older_than=older_than,
+        newer_than=newer_than,
+        workers=workers,
+        progress=progress,
+    )
+
+
+@instrumented()
+def decompress_chunks(
+    session_or_engine: Union[Session, Engine],
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    older_than: ChunkTimeArgument = None,
+    newer_than: ChunkTimeArgument = None,
+    workers: int = 1,
+    progress: Optional[ProgressCallback] = None,
+) -> List[ChunkCompressionResult]:
+    """
+    Decompress the compressed chunks of a hypertable, for example before a
+    large correction or backfill in a time range.
+
+    Takes the same arguments as compress_chunks.
+
+    Returns:
+        List[ChunkCompressionResult]: Per-chunk timing, size before/after and
+        error (if any), in the order the chunks finished
+    """
+    return _process_chunks(
+        "decompress",
+        session_or_engine,
+        model=model,
+        table_name=table_name,
+        older_than=older_than,
+        newer_than=newer_than,
+        workers=workers,
+        progress=progress,
+    )
+
+
+def get_engine(session_or_engine: Union[Session, Engine]) -> Engine:
+    """
+    Return the engine behind a session, or the engine itself
+    """
+    if isinstance(session_or_engine, Engine):
+        return session_or_engine
+    return session_or_engine.get_bind()
+
+
+def select_chunks(
+    connection: sqlalchemy.Connection,
+    action: str,
+    hypertable_name: str,
+    older_than: ChunkTimeArgument = None,
+    newer_than: ChunkTimeArgument = None,
+) -> List[str]:
+    """
+    Find the chunks in range that still need the given action
+    """
+    in_range = set(
+        show_chunks(
+            connection,
+            table_name=hypertable_name,
+            older_than=older_than,
+            newer_than=newer_than,
+        )
+    )
+    want_compressed = action != "compress"
+    return [
+        chunk.qualified_name
+        for chunk in list_chunks(connection, table_name=hypertable_name)
+        if chunk.qualified_name in in_range and chunk.is_compressed == want_compressed
+    ]
+
+
+def process_chunk_list(
+    engine: Engine,
+    action: str,
+    hypertable_name: str,
+    chunk_names: List[str],
+    workers: int = 1,
+    progress: Optional[ProgressCallback] = None,
+    lock_timeout: Optional[str] = None,
+) -> List[ChunkCompressionResult]:
+    """
+    Compress, decompress or recompress the given chunks concurrently and report
+    their sizes
+
+    A `lock_timeout` (e.g., '5s') makes a chunk fail instead of waiting behind
+    (and blocking) other queries on it.
+    """
+    if action not in CHUNK_ACTION_SQL:
+        raise ValueError(f"Invalid chunk action '{action}'")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if not chunk_names:
+        return []
+
+    with engine.connect() as connection:
+        before_sizes = _get_chunk_sizes(connection, hypertable_name)
+
+    results = []
+    total = len(chunk_names)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Each task runs in a copy of the caller's context, so its statements
+        # are attributed to the instrumented call (and its route) in progress
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _run_chunk_action,
+                engine,
+                action,
+                chunk_name,
+                lock_timeout,
+            )
+            for chunk_name in chunk_names
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            result.before_bytes = before_sizes.get(result.chunk_name)
+            results.append(result)
+            if progress is not None:
+                progress(result, len(results), total)
+
+    # Sizes are read once after all chunks are done rather than per chunk,
+    # chunks_detailed_size walks every chunk of the hypertable.
+    with engine.connect() as connection:
+        after_sizes = _get_chunk_sizes(connection, hypertable_name)
+    for result in results:
+        result.after_bytes = after_sizes.get(result.chunk_name)
+    return results
+
+
+def _process_chunks(
+    action: str,
+    session_or_engine: Union[Session, Engine],
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    older_than: ChunkTimeArgument = None,
+    newer_than: ChunkTimeArgument = None,
+    workers: int = 1,
+    progress: Optional[ProgressCallback] = None,
+) -> List[ChunkCompressionResult]:
+    hypertable_name = get_chunk_table_name(model, table_name, f"{action} chunks")
+    engine = get_engine(session_or_engine)
+
+    with engine.connect() as connection:
+        compression_enabled = connection.execute(
+            sqlalchemy.text(sql.COMPRESSION_ENABLED_SQL),
+            {"hypertable_name": hypertable_name},
+        ).scalar()
+        if not compression_enabled:
+            raise ValueError(
+                f"Compression is not enabled for {hypertable_name}. "
+                "Use enable_table_compression first"
+            )
+        chunk_names = select_chunks(
+            connection,
+            action,
+            hypertable_name,
+            older_than=older_than,
+            newer_than=newer_than,
+        )
+
+    logger.info(
+        f"{action.capitalize()}ing {len(chunk_names)} chunks of {hypertable_name}"
+    )
+    return process_chunk_list(
+        engine,
+        action,
+        hypertable_name,
+        chunk_names,
+        workers=workers,
+        progress=progress,
+    )
+
+
+def _run_chunk_action(
+    engine: Engine, action: str, chunk_name: str, lock_timeout: Optional[str] = None
+) -> ChunkCompressionResult:
+    start = time.perf_counter()
+    error = None
+    try:
+        with engine.connect() as connection:
+            if lock_timeout is not None:
+                connection.execute(
+                    sqlalchemy.text(sql.SET_LOCAL_LOCK_TIMEOUT_SQL),
+                    {"lock_timeout": lock_timeout},
+                )
+            for statement in CHUNK_ACTION_SQL[action]:
+                connection.execute(
+                    sqlalchemy.text(statement), {"chunk_name": chunk_name}
+                )
+            connection.commit()
+    except Exception as e:
+        logger.error(f"Error running {action} on chunk {chunk_name}: {e}")
+        error = str(e)
+    return ChunkCompressionResult(
+        chunk_name=chunk_name,
+        action=action,
+        duration_seconds=time.perf_counter() - start,
+        error=error,
+    )
+
+
+def _get_chunk_sizes(
+    connection: sqlalchemy.Connection, hypertable_name: str
+) -> Dict[str, Optional[int]]:
+    return {
+        size.qualified_name: size.total_bytes
+        for size in chunks_detailed_size(connection, table_name=hypertable_name)
+    }
@@ -0,0 +1,309 @@
+import logging
+import time
+from typing import List, Optional, Tuple, Type, Union
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+from timescaledb.compression import extractors, sql
+from timescaledb.compression.chunks import (
+    ProgressCallback,
+    get_engine,
+    process_chunk_list,
+)
+from timescaledb.compression.enable import enable_table_compression
+from timescaledb.compression.schemas import (
+    ChunkCompressionResult,
+    CompressionMigrationResult,
+    CompressionSettings,
+)
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.instrumentation import instrumented
+from timescaledb.routing import on_primary
+
+logger = logging.getLogger(__name__)
+
+
+def get_compression_settings(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> Optional[CompressionSettings]:
+    """
+    Get the current compress_segmentby/compress_orderby settings of a hypertable
+
+    Returns:
+        CompressionSettings, or None if compression is not enabled on the table
+    """
+    hypertable_name = get_chunk_table_name(
+        model, table_name, "get compression settings"
+    )
+    row = session.execute(
+        sqlalchemy.text(sql.HYPERTABLE_COMPRESSION_SETTINGS_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchone()
+    if row is None:
+        return None
+    return CompressionSettings(**row._mapping)
+
+
+def get_outdated_compressed_chunks(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> List[str]:
+    """
+    List the compressed chunks that were compressed with settings other than
+    the hypertable's current ones (e.g., after __compress_segmentby__ changed)
+
+    Returns:
+        List[str]: Qualified chunk names, oldest first
+    """
+    hypertable_name = get_chunk_table_name(
+        model, table_name, "get outdated compressed chunks"
+    )
+    settings = get_compression_settings(session, table_name=hypertable_name)
+    if settings is None:
+        return []
+    return _get_outdated_chunks(session, hypertable_name, settings)
+
+
+@instrumented()
+@on_primary
+def migrate_compression_settings(
+    session_or_engine: Union[Session, Engine],
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    compress_segmentby: Optional[str] = None,
+    compress_orderby: Optional[str] = None,
+    batch_size: int = 10,
+    workers: int = 1,
+    pause_seconds: float = 1.0,
+    lock_timeout: Optional[str] = "10s",
+    progress: Optional[ProgressCallback] = None,
+    dry_run: bool = False,
+) -> CompressionMigrationResult:
+    """
+    Apply new compression settings to a hypertable and recompress the chunks
+    that were compressed with the old ones.
+
+    Chunks are recompressed in batches of `batch_size` (`workers` at a time),
+    sleeping `pause_seconds` between batches so the migration does not starve
+    other queries. Each chunk is decompressed and compressed again in a single
+    transaction, so an interrupted migration never leaves a chunk decompressed.
+    TimescaleDB records the settings each chunk was compressed with, which is
+    what makes the migration resumable: running it again only picks up the
+    chunks still in the old layout.
+
+    Args:
+        session_or_engine: SQLModel session (its bind is used) or SQLAlchemy engine
+        model: SQLModel class of the hypertable, its __compress_segmentby__ and
+            __compress_orderby__ are the new settings
+        table_name: Name of the hypertable (alternative to model)
+        compress_segmentby: New segmentby setting (overrides the model's)
+        compress_orderby: New orderby setting (overrides the model's)
+        batch_size: Number of chunks recompressed between pauses
+        workers: Number of chunks recompressed concurrently within a batch
+        pause_seconds: Time to sleep between batches
+        lock_timeout: Give up on a chunk instead of waiting longer than this for
+            its locks, None to wait indefinitely. Failed chunks are reported and
+            picked up by the next run
+        progress: Optional callback called as progress(result, done, total)
+            after each chunk
+        dry_run: Only report which chunks would be recompressed
+
+    Returns:
+        CompressionMigrationResult with the per-chunk results and the chunks
+        still using outdated settings
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    hypertable_name = get_chunk_table_name(
+        model, table_name, "migrate compression settings"
+    )
+    if model is not None:
+        params = extractors.extract_model_compression_params(model) or {}
+        if compress_segmentby is None:
+            compress_segmentby = params.get("compress_segmentby")
+        if compress_orderby is None:
+            compress_orderby = params.get("compress_orderby")
+    engine = get_engine(session_or_engine)
+
+    with engine.connect() as connection:
+        previous_settings = get_compression_settings(
+            connection, table_name=hypertable_name
+        )
+    if previous_settings is None:
+        raise ValueError(
+            f"Compression is not enabled for {hypertable_name}. "
+            "Use enable_table_compression first"
+        )
+
+    settings_changed = (
+        compress_segmentby is not None
+        and _normalize_segmentby(compress_segmentby)
+        != _normalize_segmentby(previous_settings.segmentby)
+    ) or (
+        compress_orderby is not None
+        and _normalize_orderby(compress_orderby)
+        != _normalize_orderby(previous_settings.orderby)
+    )
+    target_settings = CompressionSettings(
+        segmentby=(
+            compress_segmentby
+            if compress_segmentby is not None
+            else previous_settings.segmentby
+        ),
+        orderby=(
+            compress_orderby
+            if compress_orderby is not None
+            else previous_settings.orderby
+        ),
+    )
+
+    if dry_run:
+        with engine.connect() as connection:
+            outdated = _get_outdated_chunks(
+                connection, hypertable_name, target_settings
+            )
+        return CompressionMigrationResult(
+            hypertable_name=hypertable_name,
+            previous_settings=previous_settings,
+            settings=target_settings,
+            settings_changed=settings_changed,
+            remaining_chunks=outdated,
+        )
+
+    if settings_changed:
+        logger.info(
+            f"Changing compression settings of {hypertable_name} from "
+            f"{previous_settings} to {target_settings}"
+        )
+        with Session(engine) as session:
+            enable_table_compression(
+                session,
+                table_name=hypertable_name,
+                compress_orderby=compress_orderby,
+                compress_segmentby=compress_segmentby,
+            )
+
+    with engine.connect() as connection:
+        settings = get_compression_settings(connection, table_name=hypertable_name)
+        outdated = _get_outdated_chunks(connection, hypertable_name, settings)
+
+    results: List[ChunkCompressionResult] = []
+    attempted = set()
+    total = len(outdated)
+    while True:
+        batch = [chunk for chunk in outdated if chunk not in attempted][:batch_size]
+        if not batch:
+            break
+        if attempted and pause_seconds > 0:
+            time.sleep(pause_seconds)
+        attempted.update(batch)
+        logger.info(
+            f"Recompressing {len(batch)} chunks of {hypertable_name} "
+            f"({len(results)}/{total} done)"
+        )
+        results.extend(
+            process_chunk_list(
+                engine,
+                "recompress",
+                hypertable_name,
+                batch,
+                workers=workers,
+                progress=_offset_progress(progress, len(results), total),
+                lock_timeout=lock_timeout,
+            )
+        )
+        with engine.connect() as connection:
+            outdated = _get_outdated_chunks(connection, hypertable_name, settings)
+
+    if outdated:
+        logger.warning(
+            f"{len(outdated)} chunks of {hypertable_name} still use outdated "
+            "compression settings, run the migration again to retry them"
+        )
+    return CompressionMigrationResult(
+        hypertable_name=hypertable_name,
+        previous_settings=previous_settings,
+        settings=settings,
+        settings_changed=settings_changed,
+        chunks=results,
+        remaining_chunks=outdated,
+    )
+
+
+def _get_outdated_chunks(
+    connection: Union[Session, sqlalchemy.Connection],
+    hypertable_name: str,
+    settings: CompressionSettings,
+) -> List[str]:
+    rows = connection.execute(
+        sqlalchemy.text(sql.CHUNK_COMPRESSION_SETTINGS_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchall()
+    # Settings left unset on the hypertable are chosen per chunk by TimescaleDB,
+    # they never make a chunk outdated.
+    return [
+        row.chunk_name
+        for row in rows
+        if (
+            settings.segmentby is not None
+            and _normalize_segmentby(row.segmentby)
+            != _normalize_segmentby(settings.segmentby)
+        )
+        or (
+            settings.orderby is not None
+            and _normalize_orderby(row.orderby) != _normalize_orderby(settings.orderby)
+        )
+    ]
+
+
+def _offset_progress(
+    progress: Optional[ProgressCallback], offset: int, total: int
+) -> Optional[ProgressCallback]:
+    if progress is None:
+        return None
+    return lambda result, done, _: progress(result, offset + done, total)
+
+
+def _normalize_identifier(name: str) -> str:
+    if name.startswith('"') and name.endswith('"'):
+        return name[1:-1].replace('""', '"')
+    return name.lower()
+
+
+def _normalize_segmentby(value: Optional[str]) -> Tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(
+        _normalize_identifier(column.strip())
+        for column in value.split(",")
+        if column.strip()
+    )
+
+
+def _normalize_orderby(value: Optional[str]) -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Normalize an orderby setting so 'time' and '"time" DESC NULLS FIRST'-style
+    spellings of the same ordering compare equal
+    """
+    if not value:
+        return ()
+    normalized = []
+    for spec in value.split(","):
+        parts = spec.split()
+        if not parts:
+            continue
+        modifiers = [part.upper() for part in parts[1:]]
+        direction = "DESC" if "DESC" in modifiers else "ASC"
+        if "NULLS" in modifiers and "FIRST" in modifiers:
+            nulls = "FIRST"
+        elif "NULLS" in modifiers and "LAST" in modifiers:
+            nulls = "LAST"
+        else:
+            nulls = "FIRST" if direction == "DESC" else "LAST"
+        normalized.append((_normalize_identifier(parts[0]), direction, nulls))
+    return tuple(normalized)
@@ -0,0 +1,117 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ChunkCompressionResult(BaseModel):
+    """Outcome of compressing or decompressing a single chunk"""
+
+    chunk_name: str
+    action: str
+    duration_seconds: float
+    before_bytes: Optional[int] = None
+    after_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class CompressionSizes(BaseModel):
+    """Sizes before and after compression, in bytes"""
+
+    before_compression_table_bytes: Optional[int] = None
+    before_compression_index_bytes: Optional[int] = None
+    before_compression_toast_bytes: Optional[int] = None
+    before_compression_total_bytes: Optional[int] = None
+    after_compression_table_bytes: Optional[int] = None
+    after_compression_index_bytes: Optional[int] = None
+    after_compression_toast_bytes: Optional[int] = None
+    after_compression_total_bytes: Optional[int] = None
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """How many times smaller the data is after compression"""
+        before = self.before_compression_total_bytes
+        after = self.after_compression_total_bytes
+        if not before or not after:
+            return None
+        return before / after
+
+    @property
+    def bytes_saved(self) -> Optional[int]:
+        before = self.before_compression_total_bytes
+        after = self.after_compression_total_bytes
+        if before is None or after is None:
+            return None
+        return before - after
+
+
+class HypertableCompressionStats(CompressionSizes):
+    """Compression statistics of a hypertable, summed over compressed chunks"""
+
+    hypertable_name: str
+    total_chunks: Optional[int] = None
+    number_compressed_chunks: Optional[int] = None
+
+
+class ChunkCompressionStats(CompressionSizes):
+    """Compression statistics of a single chunk"""
+
+    chunk_schema: str
+    chunk_name: str
+    compression_status: Optional[str] = None
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.chunk_schema}.{self.chunk_name}"
+
+    @property
+    def is_compressed(self) -> bool:
+        return self.compression_status == "Compressed"
+
+
+class ColumnCompressionStats(BaseModel):
+    """Cardinality estimates of a column used to judge it as segmentby"""
+
+    column: str
+    n_distinct: Optional[float] = None
+    correlation: Optional[float] = None
+    null_frac: Optional[float] = None
+    rows_per_segment: Optional[float] = None
+
+
+class CompressionRecommendation(BaseModel):
+    """Recommended compression settings for a hypertable"""
+
+    table_name: str
+    compress_segmentby: Optional[str] = None
+    compress_orderby: str
+    rows_per_segment: Optional[float] = None
+    rows_per_chunk: Optional[float] = None
+    columns: List[ColumnCompressionStats] = []
+    warnings: List[str] = []
+
+
+class CompressionSettings(BaseModel):
+    """Compression settings of a hypertable as reported by TimescaleDB"""
+
+    segmentby: Optional[str] = None
+    orderby: Optional[str] = None
+
+
+class CompressionMigrationResult(BaseModel):
+    """Outcome of migrating a hypertable to new compression settings"""
+
+    hypertable_name: str
+    previous_settings: CompressionSettings
+    settings: CompressionSettings
+    settings_changed: bool = False
+    chunks: List[ChunkCompressionResult] = []
+    remaining_chunks: List[str] = []
+
+    @property
+    def completed(self) -> bool:
+        """Whether every compressed chunk now uses the new settings"""
+        return not self.remaining_chunks
@@ -4,6 +4,7 @@ import sqlalchemy
 from sqlalchemy.sql import quoted_name
 
 from timescaledb import cleaners
+from timescaledb.utils import quote_identifier
 
 COMPRESS_AFTER_SQL_VIA_INTERVAL = """
 SELECT add_compression_policy(:hypertable_name, compress_after => INTERVAL :compress_after);
@@ -86,3 +87,97 @@ def format_alter_compression_policy_sql(
     );
     """
     return sql
+
+
+COMPRESSION_ENABLED_SQL = """
+SELECT compression_enabled
+  FROM timescaledb_information.hypertables
+  WHERE hypertable_name = :hypertable_name;
+"""
+
+COMPRESS_CHUNK_SQL = """
+SELECT compress_chunk(CAST(:chunk_name AS regclass), if_not_compressed => true);
+"""
+
+DECOMPRESS_CHUNK_SQL = """
+SELECT decompress_chunk(CAST(:chunk_name AS regclass), if_compressed => true);
+"""
+
+SET_LOCAL_LOCK_TIMEOUT_SQL = """
+SELECT set_config('lock_timeout', :lock_timeout, true);
+"""
+
+HYPERTABLE_COMPRESSION_SETTINGS_SQL = """
+SELECT segmentby, orderby
+  FROM timescaledb_information.hypertable_compression_settings
+  WHERE hypertable = CAST(:hypertable_name AS regclass);
+"""
+
+# Compressed chunks keep the settings they were compressed with
+CHUNK_COMPRESSION_SETTINGS_SQL = """
+SELECT chunk::text AS chunk_name, segmentby, orderby
+  FROM timescaledb_information.chunk_compression_settings
+  WHERE hypertable = CAST(:hypertable_name AS regclass)
+  ORDER BY chunk;
+"""
+
+
+HYPERTABLE_COMPRESSION_STATS_SQL = """
+SELECT total_chunks,
+       number_compressed_chunks,
+       before_compression_table_bytes,
+       before_compression_index_bytes,
+       before_compression_toast_bytes,
+       before_compression_total_bytes,
+       after_compression_table_bytes,
+       after_compression_index_bytes,
+       after_compression_toast_bytes,
+       after_compression_total_bytes
+  FROM hypertable_compression_stats(CAST(:hypertable_name AS regclass));
+"""
+
+CHUNK_COMPRESSION_STATS_SQL = """
+SELECT chunk_schema,
+       chunk_name,
+       compression_status,
+       before_compression_table_bytes,
+       before_compression_index_bytes,
+       before_compression_toast_bytes,
+       before_compression_total_bytes,
+       after_compression_table_bytes,
+       after_compression_index_bytes,
+       after_compression_toast_bytes,
+       after_compression_total_bytes
+  FROM chunk_compression_stats(CAST(:hypertable_name AS regclass))
+  ORDER BY chunk_name;
+"""
+
+
+COLUMN_STATISTICS_SQL = """
+SELECT DISTINCT ON (attname) attname, n_distinct, correlation, null_frac
+  FROM pg_stats
+  WHERE tablename = :table_name
+  ORDER BY attname, inherited DESC;
+"""
+
+CHUNK_ROW_ESTIMATE_SQL = """
+SELECT reltuples FROM pg_class WHERE oid = CAST(:chunk_name AS regclass);
+"""
+
+APPROXIMATE_ROW_COUNT_SQL = """
+SELECT approximate_row_count(CAST(:table_name AS regclass));
+"""
+
+
+def format_sample_chunk_sql(chunk_name: str, columns: list) -> str:
+    """
+    Format a query counting the rows and distinct values of columns in one chunk
+    """
+    distinct_counts = "".join(
+        f",\n       count(DISTINCT {quote_identifier(column)}) AS {quote_identifier(column)}"
+        for column in columns
+    )
+    return f"""
+SELECT count(*) AS row_count{distinct_counts}
+  FROM {quote_identifier(chunk_name)};
+"""
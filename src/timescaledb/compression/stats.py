@@ -0,0 +1,66 @@
+from typing import List, Optional, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.compression import sql
+from timescaledb.compression.schemas import (
+    ChunkCompressionStats,
+    HypertableCompressionStats,
+)
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.routing import read_only
+
+
+@read_only
+def get_hypertable_compression_stats(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> Optional[HypertableCompressionStats]:
+    """
+    Get the before/after compression sizes of a hypertable
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class to get compression stats for
+        table_name: Name of the table (alternative to model)
+
+    Returns:
+        HypertableCompressionStats with the compression ratio, or None if
+        compression is not enabled on the table
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "get compression stats")
+    row = session.execute(
+        sqlalchemy.text(sql.HYPERTABLE_COMPRESSION_STATS_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchone()
+    if row is None:
+        return None
+    return HypertableCompressionStats(hypertable_name=hypertable_name, **row._mapping)
+
+
+@read_only
+def get_chunk_compression_stats(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> List[ChunkCompressionStats]:
+    """
+    Get the before/after compression sizes of every chunk of a hypertable
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class to get compression stats for
+        table_name: Name of the table (alternative to model)
+
+    Returns:
+        List[ChunkCompressionStats]: One entry per chunk, sizes are None for
+        chunks that are not compressed
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "get compression stats")
+    rows = session.execute(
+        sqlalchemy.text(sql.CHUNK_COMPRESSION_STATS_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchall()
+    return [ChunkCompressionStats(**row._mapping) for row in rows]
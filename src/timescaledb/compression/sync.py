@@ -1,15 +1,29 @@
+import logging
 from typing import Type
 
 from sqlmodel import Session, SQLModel
 
 from timescaledb.compression.add import add_compression_policy
+from timescaledb.compression.advisor import check_compression_settings
 from timescaledb.compression.enable import enable_table_compression
+from timescaledb.compression.migrate import get_outdated_compressed_chunks
+from timescaledb.instrumentation import instrumented
 from timescaledb.models import TimescaleModel
+from timescaledb.routing import on_primary
 
+logger = logging.getLogger(__name__)
 
+
+@instrumented()
+@on_primary
 def sync_compression_policies(session: Session, *models: Type[SQLModel]) -> None:
     """
     Enable compression for all hypertables
+
+    After the policies are in place, the declared segmentby/orderby settings are
+    checked against the table statistics and a warning is logged for settings
+    that are likely to compress poorly, or that changed while chunks compressed
+    with the old ones remain (see migrate_compression_settings).
     """
     if models:
         model_list = models
@@ -19,10 +33,30 @@ def sync_compression_policies(session: Session, *models: Type[SQLModel]) -> None
             for model in TimescaleModel.__subclasses__()
             if getattr(model, "__table__", None) is not None
         ]
+    compressed_models = []
     for model in model_list:
         compress_enabled = model.__enable_compression__
         if not compress_enabled:
             continue
         enable_table_compression(session, model, commit=False)
         add_compression_policy(session, model, commit=False)
+        compressed_models.append(model)
     session.commit()
+
+    for model in compressed_models:
+        try:
+            warnings = check_compression_settings(session, model)
+            outdated_chunks = get_outdated_compressed_chunks(session, model)
+        except Exception as e:
+            session.rollback()
+            logger.debug(
+                f"Could not check compression settings of {model.__name__}: {e}"
+            )
+            continue
+        if outdated_chunks:
+            warnings.append(
+                f"{len(outdated_chunks)} compressed chunks use outdated compression "
+                "settings, run migrate_compression_settings to recompress them"
+            )
+        for warning in warnings:
+            logger.warning(f"{model.__name__}: {warning}")
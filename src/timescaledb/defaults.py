@@ -4,3 +4,5 @@ COMPRESS_SEGMENTBY = "identifier"
 COMPRESS_AFTER = "INTERVAL 7 days"
 COMPRESS_ORDERBY = "time DESC"
 DROP_AFTER = "INTERVAL 3 months"
+COMPRESS_MIN_ROWS_PER_SEGMENT = 100
+MAX_HYPERTABLE_INDEXES = 5
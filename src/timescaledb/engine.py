@@ -1,24 +1,227 @@
+from typing import Callable, Dict, Optional, Union
+
 import sqlalchemy
+from pydantic import BaseModel
+from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from timescaledb.instrumentation import InstrumentedQueuePool
+
+
+class EngineProfile(BaseModel):
+    """
+    Connection pool and session settings for one kind of workload
+
+    Args:
+        pool_size: Connections kept open in the pool
+        max_overflow: Extra connections opened under load, closed when returned
+        pool_timeout: Seconds to wait for a connection before giving up
+        pool_recycle: Reconnect connections older than this many seconds, -1
+            keeps them forever
+        pool_pre_ping: Test connections on checkout, so connections closed by
+            the server or a proxy are replaced instead of failing a request
+        pool_use_lifo: Reuse the most recently returned connection, which lets
+            surplus idle connections age out through pool_recycle
+        statement_timeout: Server-side statement timeout (e.g., '30s'), None
+            keeps the server's setting
+        prepared_statements: Let the driver use server-side prepared
+            statements (psycopg prepares a query after 5 executions)
+        pgbouncer: PgBouncer transaction pooling compatibility, session
+            settings (timezone, statement_timeout) are applied to every
+            transaction with SET LOCAL instead of as connection startup
+            options, which PgBouncer drops
+        warm_up: Connections opened and primed by create_engine, see warm_up
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    pool_use_lifo: bool = False
+    statement_timeout: Optional[str] = None
+    prepared_statements: bool = True
+    pgbouncer: bool = False
+    warm_up: int = 0
+
 
+ENGINE_PROFILES: Dict[str, EngineProfile] = {
+    # SQLAlchemy's defaults
+    "default": EngineProfile(),
+    # Many short requests: fail fast when the pool is exhausted, bound slow
+    # queries and drop connections that went stale behind a load balancer
+    "api": EngineProfile(
+        pool_size=10,
+        max_overflow=10,
+        pool_timeout=5.0,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+        statement_timeout="30s",
+    ),
+    # Few long-lived writers: no overflow, no timeout on large COPY/INSERTs
+    "ingest": EngineProfile(
+        pool_size=4,
+        max_overflow=0,
+        pool_timeout=60.0,
+        pool_recycle=3600,
+    ),
+    # PgBouncer pools the server connections: every transaction may run on a
+    # different one, so neither session settings nor prepared statements
+    # outlive a transaction
+    "pgbouncer-transaction": EngineProfile(
+        pool_size=10,
+        max_overflow=10,
+        pool_timeout=5.0,
+        pool_recycle=300,
+        pool_pre_ping=True,
+        prepared_statements=False,
+        pgbouncer=True,
+    ),
+}
 
-def create_engine(url: str, timezone: str = "UTC", **kwargs) -> Engine:
+
+def get_engine_profile(profile: Union[str, EngineProfile, None]) -> EngineProfile:
+    """
+    Resolve a profile name from ENGINE_PROFILES, profiles are returned as is
+    """
+    if profile is None:
+        return ENGINE_PROFILES["default"]
+    if isinstance(profile, EngineProfile):
+        return profile
+    try:
+        return ENGINE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown engine profile {profile!r}, use one of {list(ENGINE_PROFILES)}"
+        )
+
+
+def create_engine(
+    url: str,
+    timezone: str = "UTC",
+    profile: Union[str, EngineProfile, None] = None,
+    **kwargs,
+) -> Engine:
     """Create a SQLAlchemy engine with TimescaleDB-specific configuration.
 
     Args:
         url: Database URL
         timezone: Timezone to use for the database connection
-        **kwargs: Additional arguments to pass to create_engine
+        profile: Pool and session settings, a name from ENGINE_PROFILES
+            ('api', 'ingest', 'pgbouncer-transaction') or an EngineProfile.
+            Keyword arguments (e.g., pool_size) override the profile.
+        **kwargs: Additional arguments to pass to create_engine, and
+            warm_up=N to open and prime N connections before returning
 
     Returns:
         SQLAlchemy Engine instance
     """
+    settings = get_engine_profile(profile)
+    warm_up_connections = kwargs.pop("warm_up", settings.warm_up)
     connect_args = kwargs.pop("connect_args", {})
-    connect_args["options"] = f"-c timezone={timezone}"
+    session_settings = {"timezone": timezone}
+    if settings.statement_timeout is not None:
+        session_settings["statement_timeout"] = settings.statement_timeout
+    if not settings.pgbouncer:
+        connect_args["options"] = " ".join(
+            f"-c {name}={value}" for name, value in session_settings.items()
+        )
 
-    return sqlalchemy.create_engine(
+    url = sqlalchemy.engine.make_url(url)
+    if not settings.prepared_statements and url.get_driver_name() == "psycopg":
+        connect_args.setdefault("prepare_threshold", None)
+
+    poolclass = kwargs.setdefault("poolclass", InstrumentedQueuePool)
+    if issubclass(poolclass, QueuePool):
+        kwargs.setdefault("pool_size", settings.pool_size)
+        kwargs.setdefault("max_overflow", settings.max_overflow)
+        kwargs.setdefault("pool_timeout", settings.pool_timeout)
+        kwargs.setdefault("pool_use_lifo", settings.pool_use_lifo)
+    kwargs.setdefault("pool_recycle", settings.pool_recycle)
+    kwargs.setdefault("pool_pre_ping", settings.pool_pre_ping)
+
+    engine = sqlalchemy.create_engine(
         url,
         connect_args=connect_args,
         execution_options={"isolation_level": "READ COMMITTED"},
         **kwargs,
     )
+    if settings.pgbouncer:
+        event.listen(
+            engine, "begin", _set_local_settings(format_set_local_sql(session_settings))
+        )
+    if warm_up_connections:
+        warm_up(engine, warm_up_connections)
+    return engine
+
+
+def warm_up(engine: Engine, connections: Optional[int] = None) -> int:
+    """
+    Open and prime pool connections ahead of the first requests
+
+    The connections are checked out at the same time, so the pool opens that
+    many distinct connections, each runs a first query (which also initializes
+    the dialect) and they are returned to the pool.
+
+    Args:
+        engine: Engine to warm up
+        connections: Number of connections, defaults to (and is capped at) the
+            pool size
+
+    Returns:
+        Number of connections opened and primed
+    """
+    if connections is not None and connections < 0:
+        raise ValueError("connections must not be negative")
+    size = getattr(engine.pool, "size", None)
+    pool_size = size() if callable(size) else None
+    if connections is None:
+        connections = pool_size or 1
+    elif pool_size is not None:
+        connections = min(connections, pool_size)
+
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(sqlalchemy.text("SELECT 1"))
+            connection.rollback()
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+def format_set_local_sql(settings: Dict[str, str]) -> str:
+    """
+    Single statement applying settings to the current transaction only, like
+    SET LOCAL (set_config with is_local)
+    """
+    return "SELECT " + ", ".join(
+        f"set_config('{_quote(name)}', '{_quote(str(value))}', true)"
+        for name, value in settings.items()
+    )
+
+
+def _quote(value: str) -> str:
+    return value.replace("'", "''")
+
+
+def _set_local_settings(statement: str) -> Callable:
+    def begin(connection: sqlalchemy.Connection) -> None:
+        pooled_connection = connection.connection
+        # Outside a transaction block a local setting would not last, and a
+        # session-level one would leak to other PgBouncer clients
+        if getattr(pooled_connection.dbapi_connection, "autocommit", False):
+            return
+        # The driver begins the transaction with this statement
+        cursor = pooled_connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    return begin
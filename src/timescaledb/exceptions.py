@@ -50,3 +50,35 @@ class InvalidCompressionFields(Exception):
     """
     Exception raised when the compression fields are invalid
     """
+
+
+class InvalidPartitionBy(Exception):
+    """
+    Exception raised when the partition by (hash dimension) settings are invalid
+    """
+
+    pass
+
+
+class InvalidReorderIndex(Exception):
+    """
+    Exception raised when the reorder index is invalid
+    """
+
+    pass
+
+
+class InvalidTimeSeriesIndex(Exception):
+    """
+    Exception raised when a declared time-series index is invalid
+    """
+
+    pass
+
+
+class InvalidCursor(Exception):
+    """
+    Exception raised when a pagination cursor cannot be decoded
+    """
+
+    pass
@@ -0,0 +1,276 @@
+import contextvars
+import json
+import logging
+import re
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+import sqlalchemy
+from pydantic import BaseModel, Field
+from sqlmodel import Session, SQLModel
+
+from timescaledb.hypertables.chunks import list_chunks
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+
+CHUNK_RELATION_PATTERN = re.compile(r"^_hyper_\d+_\d+_chunk$")
+
+# Custom scan nodes that read compressed chunks (renamed in newer releases)
+DECOMPRESSION_PROVIDERS = ("DecompressChunk", "ColumnarScan")
+
+ExplainCallback = Callable[["ExplainReport"], None]
+
+
+class ExplainReport(BaseModel):
+    """
+    What a query did to a hypertable, parsed from EXPLAIN (ANALYZE, BUFFERS)
+
+    scanned_chunks are the chunks the executor actually read, planned_chunks
+    also include the ones only excluded at run time (never executed).
+    """
+
+    operation: Optional[str] = None
+    hypertable_name: Optional[str] = None
+    statement: str
+    planning_time: Optional[float] = None
+    execution_time: Optional[float] = None
+    duration: Optional[float] = None
+    total_chunks: Optional[int] = None
+    planned_chunks: List[str] = Field(default_factory=list)
+    scanned_chunks: List[str] = Field(default_factory=list)
+    decompressed_chunks: List[str] = Field(default_factory=list)
+    excluded_at_startup: int = 0
+    excluded_at_runtime: int = 0
+    shared_hit_blocks: int = 0
+    shared_read_blocks: int = 0
+    plan: Dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def excluded_chunks(self) -> Optional[int]:
+        """Number of chunks of the hypertable the query did not read"""
+        if self.total_chunks is None:
+            return None
+        return self.total_chunks - len(self.scanned_chunks)
+
+    @property
+    def decompressed(self) -> bool:
+        return bool(self.decompressed_chunks)
+
+    @property
+    def buffer_hit_ratio(self) -> Optional[float]:
+        total = self.shared_hit_blocks + self.shared_read_blocks
+        if not total:
+            return None
+        return self.shared_hit_blocks / total
+
+    def summary(self) -> str:
+        target = self.hypertable_name or "query"
+        chunks = f"{len(self.scanned_chunks)}"
+        if self.total_chunks is not None:
+            chunks += f"/{self.total_chunks}"
+        return (
+            f"{self.operation or 'query'} on {target} scanned {chunks} chunks "
+            f"({len(self.decompressed_chunks)} decompressed, "
+            f"{self.excluded_at_startup} excluded at startup, "
+            f"{self.excluded_at_runtime} at runtime), "
+            f"shared buffers hit={self.shared_hit_blocks} "
+            f"read={self.shared_read_blocks}, "
+            f"execution {self.execution_time}ms"
+        )
+
+
+_auto_explain_threshold: Optional[float] = None
+_auto_explain_callback: Optional[ExplainCallback] = None
+_explaining: contextvars.ContextVar[Optional[List[ExplainReport]]] = (
+    contextvars.ContextVar("timescaledb_explain_reports", default=None)
+)
+
+
+def enable_auto_explain(
+    threshold: float = 1.0, callback: Optional[ExplainCallback] = None
+) -> None:
+    """
+    Explain every query helper call (time_bucket_query, candlestick_query, ...)
+    that takes longer than `threshold` seconds
+
+    The query is run again under EXPLAIN ANALYZE, so only use thresholds that
+    slow calls cross occasionally.
+
+    Args:
+        threshold: Latency in seconds above which a call is explained
+        callback: Receives the ExplainReport, defaults to logging a warning
+    """
+    global _auto_explain_threshold, _auto_explain_callback
+    if threshold < 0:
+        raise ValueError("threshold must not be negative")
+    _auto_explain_threshold = threshold
+    _auto_explain_callback = callback
+
+
+def disable_auto_explain() -> None:
+    """
+    Stop explaining slow query helper calls
+    """
+    global _auto_explain_threshold, _auto_explain_callback
+    _auto_explain_threshold = None
+    _auto_explain_callback = None
+
+
+@contextmanager
+def explaining() -> Iterator[List[ExplainReport]]:
+    """
+    Explain every query helper call inside the with block, regardless of its
+    latency
+
+    Yields:
+        The list the ExplainReports are appended to
+    """
+    reports: List[ExplainReport] = []
+    token = _explaining.set(reports)
+    try:
+        yield reports
+    finally:
+        _explaining.reset(token)
+
+
+def should_explain(duration: Optional[float] = None) -> bool:
+    """
+    Whether a query helper call should be explained, without a duration only
+    on demand (inside explaining())
+    """
+    if _explaining.get() is not None:
+        return True
+    return (
+        _auto_explain_threshold is not None
+        and duration is not None
+        and duration >= _auto_explain_threshold
+    )
+
+
+def auto_explain_enabled() -> bool:
+    return _auto_explain_threshold is not None or _explaining.get() is not None
+
+
+def report_explained(
+    session: Session,
+    query: Any,
+    model: Optional[Type[SQLModel]] = None,
+    operation: Optional[str] = None,
+    duration: Optional[float] = None,
+) -> None:
+    """
+    Explain a query helper call and hand the report to explaining() or the
+    auto explain callback. Failures are logged, they never fail the call.
+    """
+    try:
+        report = explain_query(session, query, model=model, operation=operation)
+    except Exception:
+        logger.exception(f"Could not explain {operation or 'query'}")
+        return
+    report.duration = duration
+    reports = _explaining.get()
+    if reports is not None:
+        reports.append(report)
+    elif _auto_explain_callback is not None:
+        _auto_explain_callback(report)
+    else:
+        logger.warning(f"Slow {report.summary()}")
+
+
+def explain_query(
+    session: Session,
+    query: Any,
+    model: Optional[Type[SQLModel]] = None,
+    table_name: Optional[str] = None,
+    operation: Optional[str] = None,
+) -> ExplainReport:
+    """
+    Run a query under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) and report the
+    chunks it scanned, whether it decompressed chunks and its buffer usage
+
+    The query is executed, inside the session's current transaction.
+
+    Args:
+        session: SQLAlchemy session
+        query: SQLAlchemy statement (e.g., a select) or a SQL string
+        model: Hypertable model, used to report how many chunks it has
+        table_name: Name of the hypertable (alternative to model)
+        operation: Name reported with the plan, e.g., 'time_bucket_query'
+
+    Returns:
+        ExplainReport
+    """
+    if isinstance(query, str):
+        statement = query
+        result = session.execute(sqlalchemy.text(EXPLAIN_PREFIX + statement))
+    else:
+        # Compile with the driver's parameter style so the statement runs as is
+        connection = session.connection()
+        compiled = query.compile(
+            dialect=connection.dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        statement = compiled.string
+        parameters = compiled.params
+        if compiled.positional:
+            parameters = tuple(parameters[name] for name in compiled.positiontup)
+        result = connection.exec_driver_sql(EXPLAIN_PREFIX + statement, parameters)
+    explained = result.scalar()
+    if isinstance(explained, str):
+        explained = json.loads(explained)
+
+    hypertable_name = table_name
+    if model is not None:
+        hypertable_name = model.__tablename__
+    report = parse_explain(explained, statement=statement)
+    report.operation = operation
+    report.hypertable_name = hypertable_name
+    if hypertable_name is not None:
+        report.total_chunks = len(list_chunks(session, table_name=hypertable_name))
+    return report
+
+
+def parse_explain(explained: Any, statement: str = "") -> ExplainReport:
+    """
+    Parse the output of EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+
+    Args:
+        explained: The decoded JSON, a list holding one plan document
+        statement: The explained statement, kept on the report
+    """
+    document = explained[0] if isinstance(explained, list) else explained
+    plan = document.get("Plan", {})
+    report = ExplainReport(
+        statement=statement,
+        planning_time=document.get("Planning Time"),
+        execution_time=document.get("Execution Time"),
+        shared_hit_blocks=plan.get("Shared Hit Blocks", 0),
+        shared_read_blocks=plan.get("Shared Read Blocks", 0),
+        plan=plan,
+    )
+    _walk_plan(plan, report, decompressing=False)
+    return report
+
+
+def _walk_plan(node: Dict[str, Any], report: ExplainReport, decompressing: bool):
+    provider = node.get("Custom Plan Provider")
+    if provider == "ChunkAppend":
+        report.excluded_at_startup += node.get("Chunks excluded during startup", 0)
+        report.excluded_at_runtime += node.get("Chunks excluded during runtime", 0)
+    if provider in DECOMPRESSION_PROVIDERS:
+        decompressing = True
+
+    relation = node.get("Relation Name")
+    if relation and CHUNK_RELATION_PATTERN.match(relation):
+        if relation not in report.planned_chunks:
+            report.planned_chunks.append(relation)
+        executed = node.get("Actual Loops", 1) > 0
+        if executed and relation not in report.scanned_chunks:
+            report.scanned_chunks.append(relation)
+        if executed and decompressing and relation not in report.decompressed_chunks:
+            report.decompressed_chunks.append(relation)
+
+    for child in node.get("Plans", []):
+        _walk_plan(child, report, decompressing)
@@ -1,3 +1,24 @@
-from .main import time_bucket, time_bucket_gapfill
+from .main import first, last, time_bucket, time_bucket_gapfill
+from .toolkit import (
+    average,
+    counter_agg,
+    delta,
+    extrapolated_rate,
+    rate,
+    time_weight,
+    with_bounds,
+)
 
-__all__ = ["time_bucket", "time_bucket_gapfill"]
+__all__ = [
+    "time_bucket",
+    "time_bucket_gapfill",
+    "first",
+    "last",
+    "counter_agg",
+    "with_bounds",
+    "rate",
+    "delta",
+    "extrapolated_rate",
+    "time_weight",
+    "average",
+]
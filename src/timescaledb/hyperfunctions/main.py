@@ -1,7 +1,11 @@
 from datetime import datetime
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
-from sqlalchemy import func, text
+from sqlalchemy import DateTime, func, text
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.functions import FunctionElement
+
+from timescaledb.utils import localize_datetime
 
 
 def time_bucket(
@@ -51,6 +55,33 @@ def time_bucket(
     return func.time_bucket(*args)
 
 
+def _format_gapfill_bound(
+    value: Union[datetime, int, str],
+    ts: Union[datetime, int],
+    timezone: Optional[str] = None,
+) -> TextClause:
+    """
+    Render a gapfill start/finish bound with the same type as the time column.
+
+    Naive datetimes are interpreted in `timezone` when one is given. Bounds
+    for timestamptz columns are kept as timestamptz (including their UTC
+    offset) so they compare against the column without per-row conversions.
+    """
+    if isinstance(value, int):
+        return text(str(value))
+    value = localize_datetime(value, timezone)
+
+    column_type = getattr(ts, "type", None)
+    if isinstance(column_type, DateTime):
+        with_timezone = column_type.timezone
+    elif isinstance(value, datetime):
+        with_timezone = value.tzinfo is not None or timezone is not None
+    else:
+        with_timezone = timezone is not None
+    timestamp_type = "timestamptz" if with_timezone else "timestamp"
+    return text(f"'{value}'::{timestamp_type}")
+
+
 def time_bucket_gapfill(
     bucket_width: Union[str, int],
     ts: Union[datetime, int],
@@ -95,13 +126,62 @@ def time_bucket_gapfill(
     # Handle start and finish timestamps with timezone awareness
     if start is not None and finish is not None:
         # For time_bucket_gapfill, start and finish must be provided together
-        timestamp_type = "timestamptz" if timezone is not None else "timestamp"
         args.extend(
             [
-                text(f"'{start}'::{timestamp_type}"),
-                text(f"'{finish}'::{timestamp_type}"),
+                _format_gapfill_bound(start, ts, timezone),
+                _format_gapfill_bound(finish, ts, timezone),
             ]
         )
 
     # Create the time_bucket_gapfill function call
     return func.time_bucket_gapfill(*args)
+
+
+def first(
+    value: Any,
+    time: Any,
+) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB's first function.
+    Returns the value of `value` at the earliest `time` within an aggregate group.
+
+    Args:
+        value: Column (or expression) whose first value should be returned
+        time: Column used to order the values, usually the time column
+
+    Returns:
+        SQLAlchemy function expression for first
+
+    Example:
+        bucket = time_bucket('1 hour', Model.time)
+        query = select(
+            bucket,
+            first(Model.price, Model.time)
+        ).group_by(bucket)
+    """
+    return func.first(value, time)
+
+
+def last(
+    value: Any,
+    time: Any,
+) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB's last function.
+    Returns the value of `value` at the latest `time` within an aggregate group.
+
+    Args:
+        value: Column (or expression) whose last value should be returned
+        time: Column used to order the values, usually the time column
+
+    Returns:
+        SQLAlchemy function expression for last
+
+    Example:
+        bucket = time_bucket('1 hour', Model.time)
+        query = select(
+            bucket,
+            last(Model.price, Model.time)
+        ).group_by(bucket)
+    """
+    return func.last(value, time)
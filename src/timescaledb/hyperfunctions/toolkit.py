@@ -0,0 +1,152 @@
+"""
+Builders for TimescaleDB Toolkit hyperfunctions.
+
+These require the `timescaledb_toolkit` extension
+(`CREATE EXTENSION IF NOT EXISTS timescaledb_toolkit;`), which ships with the
+`timescale/timescaledb-ha` images and Timescale Cloud.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import func
+from sqlalchemy.sql.functions import FunctionElement
+
+EXTRAPOLATION_METHODS = ("prometheus",)
+TIME_WEIGHT_METHODS = ("Linear", "LOCF")
+
+
+def counter_agg(
+    ts: Any,
+    value: Any,
+    bounds: Optional[Any] = None,
+) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB Toolkit's counter_agg function.
+    Aggregates a monotonically increasing counter, accounting for counter resets.
+
+    Args:
+        ts: Timestamp column of the samples
+        value: Counter column of the samples
+        bounds: Optional tstzrange expression bounding the aggregate, required
+            for extrapolated_rate
+
+    Returns:
+        SQLAlchemy function expression for counter_agg
+
+    Example:
+        bucket = time_bucket('5 minutes', Model.time)
+        query = select(
+            bucket,
+            rate(counter_agg(Model.time, Model.requests))
+        ).group_by(bucket)
+    """
+    args = [ts, value]
+    if bounds is not None:
+        args.append(bounds)
+    return func.counter_agg(*args)
+
+
+def with_bounds(summary: Any, bounds: Any) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB Toolkit's with_bounds function.
+
+    Args:
+        summary: A counter_agg expression
+        bounds: tstzrange expression to attach to the summary
+
+    Returns:
+        SQLAlchemy function expression for with_bounds
+    """
+    return func.with_bounds(summary, bounds)
+
+
+def rate(summary: Any) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB Toolkit's rate accessor.
+    Returns the per-second rate of change of a counter_agg summary.
+
+    Args:
+        summary: A counter_agg expression
+
+    Returns:
+        SQLAlchemy function expression for rate
+    """
+    return func.rate(summary)
+
+
+def delta(summary: Any) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB Toolkit's delta accessor.
+    Returns the change in the counter over the aggregate, adjusted for resets.
+
+    Args:
+        summary: A counter_agg expression
+
+    Returns:
+        SQLAlchemy function expression for delta
+    """
+    return func.delta(summary)
+
+
+def extrapolated_rate(summary: Any, method: str = "prometheus") -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB Toolkit's extrapolated_rate accessor.
+    Extrapolates the rate to the bounds of the summary, which must be set
+    through counter_agg(..., bounds=...) or with_bounds.
+
+    Args:
+        summary: A bounded counter_agg expression
+        method: Extrapolation method, currently only 'prometheus'
+
+    Returns:
+        SQLAlchemy function expression for extrapolated_rate
+    """
+    if method not in EXTRAPOLATION_METHODS:
+        raise ValueError(
+            f"Invalid extrapolation method '{method}'. "
+            f"Must be one of: {', '.join(EXTRAPOLATION_METHODS)}"
+        )
+    return func.extrapolated_rate(summary, method)
+
+
+def time_weight(method: str, ts: Any, value: Any) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB Toolkit's time_weight function.
+    Aggregates irregularly sampled gauges so each value is weighted by how
+    long it was in effect.
+
+    Args:
+        method: Weighting method, 'Linear' or 'LOCF'
+        ts: Timestamp column of the samples
+        value: Gauge column of the samples
+
+    Returns:
+        SQLAlchemy function expression for time_weight
+
+    Example:
+        bucket = time_bucket('1 hour', Model.time)
+        query = select(
+            bucket,
+            average(time_weight('Linear', Model.time, Model.temp))
+        ).group_by(bucket)
+    """
+    if method not in TIME_WEIGHT_METHODS:
+        raise ValueError(
+            f"Invalid time weight method '{method}'. "
+            f"Must be one of: {', '.join(TIME_WEIGHT_METHODS)}"
+        )
+    return func.time_weight(method, ts, value)
+
+
+def average(summary: Any) -> FunctionElement:
+    """
+    SQLModel implementation of TimescaleDB Toolkit's average accessor.
+    Returns the time-weighted average of a time_weight summary.
+
+    Args:
+        summary: A time_weight expression
+
+    Returns:
+        SQLAlchemy function expression for average
+    """
+    return func.average(summary)
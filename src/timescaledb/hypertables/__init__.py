@@ -1,6 +1,14 @@
+from .chunks import chunks_detailed_size, drop_chunks, list_chunks, show_chunks
 from .create import create_hypertable
+from .dimensions import add_hash_dimension, list_dimensions, sync_partition_dimensions
+from .interval import (
+    check_chunk_time_interval_drift,
+    get_chunk_time_interval,
+    recommend_chunk_time_interval,
+    set_chunk_time_interval,
+)
 from .list import is_hypertable, list_hypertables
-from .schemas import HyperTableSchema
+from .schemas import ChunkIntervalRecommendation, DimensionSchema, HyperTableSchema
 from .sync import sync_all_hypertables
 
 __all__ = [
@@ -9,4 +17,17 @@ __all__ = [
     "list_hypertables",
     "HyperTableSchema",
     "is_hypertable",
+    "show_chunks",
+    "list_chunks",
+    "drop_chunks",
+    "chunks_detailed_size",
+    "get_chunk_time_interval",
+    "set_chunk_time_interval",
+    "recommend_chunk_time_interval",
+    "check_chunk_time_interval_drift",
+    "ChunkIntervalRecommendation",
+    "list_dimensions",
+    "add_hash_dimension",
+    "sync_partition_dimensions",
+    "DimensionSchema",
 ]
@@ -0,0 +1,13 @@
+from .drop import drop_chunks
+from .schemas import ChunkSchema, ChunkSizeSchema
+from .show import list_chunks, show_chunks
+from .size import chunks_detailed_size
+
+__all__ = [
+    "show_chunks",
+    "list_chunks",
+    "drop_chunks",
+    "chunks_detailed_size",
+    "ChunkSchema",
+    "ChunkSizeSchema",
+]
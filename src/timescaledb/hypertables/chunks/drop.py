@@ -0,0 +1,51 @@
+from typing import List, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.hypertables.chunks import sql_statements as sql
+from timescaledb.hypertables.chunks.show import ChunkTimeArgument
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+
+
+def drop_chunks(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    older_than: ChunkTimeArgument = None,
+    newer_than: ChunkTimeArgument = None,
+    created_before: ChunkTimeArgument = None,
+    created_after: ChunkTimeArgument = None,
+    commit: bool = True,
+) -> List[str]:
+    """
+    Drop the chunks of a hypertable that match the given time filters
+
+    At least one time filter is required. Intervals are given as strings
+    (e.g., '3 months') or timedeltas, timestamps as datetimes.
+
+    Args:
+        session: SQLModel session
+        model: SQLModel class of the hypertable
+        table_name: Name of the hypertable (alternative to model)
+        older_than: Drop chunks whose data is older than this interval or timestamp
+        newer_than: Drop chunks whose data is newer than this interval or timestamp
+        created_before: Drop chunks created before this interval or timestamp
+        created_after: Drop chunks created after this interval or timestamp
+        commit: Whether to commit the transaction
+
+    Returns:
+        List[str]: Schema-qualified names of the dropped chunks
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "drop chunks")
+    query, params = sql.format_drop_chunks_sql(
+        hypertable_name,
+        older_than=older_than,
+        newer_than=newer_than,
+        created_before=created_before,
+        created_after=created_after,
+    )
+    rows = session.execute(sqlalchemy.text(query), params).fetchall()
+    if commit:
+        session.commit()
+    return [row[0] for row in rows]
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ChunkSchema(BaseModel):
+    """A chunk of a hypertable and the time range it covers"""
+
+    chunk_schema: str
+    chunk_name: str
+    range_start: Optional[datetime] = None
+    range_end: Optional[datetime] = None
+    range_start_integer: Optional[int] = None
+    range_end_integer: Optional[int] = None
+    is_compressed: bool = False
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.chunk_schema}.{self.chunk_name}"
+
+
+class ChunkSizeSchema(BaseModel):
+    """Disk usage of a single chunk, in bytes"""
+
+    chunk_schema: str
+    chunk_name: str
+    table_bytes: Optional[int] = None
+    index_bytes: Optional[int] = None
+    toast_bytes: Optional[int] = None
+    total_bytes: Optional[int] = None
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.chunk_schema}.{self.chunk_name}"
@@ -0,0 +1,70 @@
+from datetime import date, datetime, timedelta
+from typing import List, Type, Union
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.hypertables.chunks import sql_statements as sql
+from timescaledb.hypertables.chunks.schemas import ChunkSchema
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.routing import read_only
+
+ChunkTimeArgument = Union[str, int, timedelta, datetime, date, None]
+
+
+@read_only
+def show_chunks(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    older_than: ChunkTimeArgument = None,
+    newer_than: ChunkTimeArgument = None,
+    created_before: ChunkTimeArgument = None,
+    created_after: ChunkTimeArgument = None,
+) -> List[str]:
+    """
+    List the chunks of a hypertable, optionally filtered by time
+
+    Args:
+        session: SQLModel session
+        model: SQLModel class of the hypertable
+        table_name: Name of the hypertable (alternative to model)
+        older_than: Only chunks whose data is older than this interval
+            (e.g., '7 days' or timedelta) or timestamp (datetime)
+        newer_than: Only chunks whose data is newer than this interval or timestamp
+        created_before: Only chunks created before this interval or timestamp
+        created_after: Only chunks created after this interval or timestamp
+
+    Returns:
+        List[str]: Schema-qualified chunk names
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "show chunks")
+    query, params = sql.format_show_chunks_sql(
+        hypertable_name,
+        older_than=older_than,
+        newer_than=newer_than,
+        created_before=created_before,
+        created_after=created_after,
+    )
+    rows = session.execute(sqlalchemy.text(query), params).fetchall()
+    return [row[0] for row in rows]
+
+
+@read_only
+def list_chunks(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> List[ChunkSchema]:
+    """
+    List the chunks of a hypertable with their time ranges and compression state
+
+    Returns:
+        List[ChunkSchema]: Chunks ordered by the start of their time range
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "list chunks")
+    rows = session.execute(
+        sqlalchemy.text(sql.LIST_CHUNKS_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchall()
+    return [ChunkSchema(**dict(row._mapping)) for row in rows]
@@ -0,0 +1,29 @@
+from typing import List, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.hypertables.chunks import sql_statements as sql
+from timescaledb.hypertables.chunks.schemas import ChunkSizeSchema
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.routing import read_only
+
+
+@read_only
+def chunks_detailed_size(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> List[ChunkSizeSchema]:
+    """
+    Get the table, index, toast and total size of every chunk of a hypertable
+
+    Returns:
+        List[ChunkSizeSchema]: One entry per chunk, ordered by chunk name
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "get chunk sizes")
+    rows = session.execute(
+        sqlalchemy.text(sql.CHUNKS_DETAILED_SIZE_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchall()
+    return [ChunkSizeSchema(**dict(row._mapping)) for row in rows]
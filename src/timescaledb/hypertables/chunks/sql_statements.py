@@ -0,0 +1,116 @@
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Tuple
+
+from timescaledb.cleaners import clean_interval_string
+
+LIST_CHUNKS_SQL = """
+SELECT chunk_schema,
+       chunk_name,
+       range_start,
+       range_end,
+       range_start_integer,
+       range_end_integer,
+       is_compressed
+  FROM timescaledb_information.chunks
+  WHERE hypertable_name = :hypertable_name
+  ORDER BY range_start, range_start_integer;
+"""
+
+SHOW_CHUNKS_SQL = """
+SELECT chunk::text
+  FROM show_chunks(CAST(:hypertable_name AS regclass){arguments}) AS chunk;
+"""
+
+DROP_CHUNKS_SQL = """
+SELECT chunk
+  FROM drop_chunks(CAST(:hypertable_name AS regclass){arguments}) AS chunk;
+"""
+
+CHUNKS_DETAILED_SIZE_SQL = """
+SELECT chunk_schema,
+       chunk_name,
+       table_bytes,
+       index_bytes,
+       toast_bytes,
+       total_bytes
+  FROM chunks_detailed_size(CAST(:hypertable_name AS regclass))
+  ORDER BY chunk_name;
+"""
+
+# Named arguments accepted by show_chunks and drop_chunks
+CHUNK_TIME_ARGUMENTS = ("older_than", "newer_than", "created_before", "created_after")
+
+
+def get_time_argument_sql_type(value: Any) -> str:
+    """
+    Map a chunk time argument to the SQL type TimescaleDB expects.
+
+    Intervals are given as strings (e.g., '7 days') or timedeltas, timestamps
+    as datetimes or dates, and integer time values as ints.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return "BIGINT"
+    if isinstance(value, datetime):
+        return "TIMESTAMPTZ"
+    if isinstance(value, date):
+        return "DATE"
+    if isinstance(value, (str, timedelta)):
+        return "INTERVAL"
+    raise ValueError(
+        f"Invalid chunk time argument {value!r}. "
+        "Use an interval (str or timedelta), a datetime, a date or an integer"
+    )
+
+
+def format_chunk_time_arguments(**kwargs: Any) -> Tuple[str, Dict[str, Any]]:
+    """
+    Format the optional named time arguments of show_chunks/drop_chunks.
+
+    Returns:
+        A tuple of the SQL argument list (with a leading comma) and the bind
+        parameters. String intervals may be prefixed with INTERVAL.
+    """
+    clauses = []
+    params = {}
+    for name in CHUNK_TIME_ARGUMENTS:
+        value = kwargs.get(name)
+        if value is None:
+            continue
+        sql_type = get_time_argument_sql_type(value)
+        if isinstance(value, str):
+            value = clean_interval_string(value)
+        clauses.append(f"{name} => CAST(:{name} AS {sql_type})")
+        params[name] = value
+    arguments = "".join(f", {clause}" for clause in clauses)
+    return arguments, params
+
+
+def format_show_chunks_sql(
+    table_name: str, **kwargs: Any
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Format the show_chunks query and its bind parameters
+    """
+    arguments, params = format_chunk_time_arguments(**kwargs)
+    return SHOW_CHUNKS_SQL.format(arguments=arguments), {
+        "hypertable_name": table_name,
+        **params,
+    }
+
+
+def format_drop_chunks_sql(
+    table_name: str, **kwargs: Any
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Format the drop_chunks query and its bind parameters
+    """
+    arguments, params = format_chunk_time_arguments(**kwargs)
+    if not params:
+        raise ValueError(
+            "At least one of older_than, newer_than, created_before or "
+            "created_after is required to drop chunks"
+        )
+    return DROP_CHUNKS_SQL.format(arguments=arguments), {
+        "hypertable_name": table_name,
+        **params,
+    }
@@ -0,0 +1,18 @@
+from typing import Type
+
+from sqlmodel import SQLModel
+
+
+def get_chunk_table_name(
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    action: str = "list chunks",
+) -> str:
+    """
+    Resolve the hypertable name from a model or an explicit table name
+    """
+    if model is None and table_name is None:
+        raise ValueError(f"model or table_name is required to {action}")
+    if model is not None:
+        return model.__tablename__
+    return table_name
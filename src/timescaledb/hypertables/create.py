@@ -6,10 +6,14 @@ from sqlmodel import Session, SQLModel
 
 from timescaledb.hypertables.extractors import extract_model_hypertable_params
 from timescaledb.hypertables.schemas import HypertableCreateSchema
+from timescaledb.instrumentation import instrumented
+from timescaledb.routing import on_primary
 
 # from timescaledb.hypertables.schemas import HypertableParams
 
 
+@instrumented()
+@on_primary
 def create_hypertable(
     session: Session,
     commit: bool = True,
@@ -50,11 +54,14 @@ def create_hypertable(
         from timescaledb import TimescaleModel
 
         class Metrics(TimescaleModel, table=True):
-            sensor_id: int
+            # Partition columns must be part of the primary key
+            sensor_id: int = Field(primary_key=True)
             value: float
 
              __time_column__: ClassVar[str] = "time"
             __chunk_time_interval__: ClassVar[str] = "INTERVAL 7 Days"
+            # Optional hash dimension(s): (column, number_partitions)
+            __partition_by__: ClassVar[tuple] = ("sensor_id", 4)
             # ... model fields ...
 
         # Create hypertable using model parameters
@@ -88,5 +95,7 @@ def create_hypertable(
     schema = HypertableCreateSchema(**params)
     query = schema.to_sql_query()
     session.execute(sqlalchemy.text(query))
+    for dimension_query in schema.to_dimension_sql_queries():
+        session.execute(sqlalchemy.text(dimension_query))
     if commit:
         session.commit()
@@ -0,0 +1,144 @@
+import logging
+from typing import List, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.defaults import TIME_COLUMN
+from timescaledb.hypertables import sql_statements as sql
+from timescaledb.hypertables import validators
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.hypertables.schemas import DimensionSchema
+from timescaledb.routing import on_primary, read_only
+
+logger = logging.getLogger(__name__)
+
+
+@read_only
+def list_dimensions(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> List[DimensionSchema]:
+    """
+    List the time and space (hash) dimensions of a hypertable
+
+    Returns:
+        List[DimensionSchema]: Dimensions ordered by dimension_number
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "list dimensions")
+    rows = session.execute(
+        sqlalchemy.text(sql.LIST_DIMENSIONS_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchall()
+    return [DimensionSchema(**row._mapping) for row in rows]
+
+
+def add_hash_dimension(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    column_name: str = None,
+    number_partitions: int = None,
+    commit: bool = True,
+) -> None:
+    """
+    Add a space (hash) dimension to a hypertable
+
+    TimescaleDB only allows adding dimensions to hypertables without data.
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class of the hypertable
+        table_name: Name of the hypertable (alternative to model)
+        column_name: Column to hash partition on
+        number_partitions: Number of hash partitions
+        commit: Whether to commit the transaction
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "add a dimension")
+    time_column = getattr(model, "__time_column__", TIME_COLUMN)
+    [(column_name, number_partitions)] = validators.validate_partition_by(
+        model, time_column, (column_name, number_partitions)
+    )
+    session.execute(
+        sqlalchemy.text(sql.ADD_HASH_DIMENSION_SQL),
+        {
+            "table_name": hypertable_name,
+            "column_name": column_name,
+            "number_partitions": number_partitions,
+        },
+    )
+    if commit:
+        session.commit()
+
+
+@on_primary
+def sync_partition_dimensions(
+    session: Session, model: Type[SQLModel], commit: bool = True
+) -> List[str]:
+    """
+    Bring the hash dimensions of an existing hypertable in line with the model's
+    __partition_by__
+
+    Missing dimensions are added (only possible while the hypertable has no
+    data) and changed partition counts are applied with set_number_partitions,
+    which affects new chunks only. Hash dimensions cannot be removed, those
+    are reported instead.
+
+    Returns:
+        List[str]: Human readable warnings for differences that could not be applied
+    """
+    time_column = getattr(model, "__time_column__", TIME_COLUMN)
+    declared = validators.validate_partition_by(
+        model, time_column, getattr(model, "__partition_by__", None)
+    )
+    live = {
+        dimension.column_name: dimension
+        for dimension in list_dimensions(session, model=model)
+        if dimension.dimension_type == "Space"
+    }
+    hypertable_name = model.__tablename__
+
+    warnings = []
+    for column_name, number_partitions in declared:
+        dimension = live.pop(column_name, None)
+        if dimension is None:
+            try:
+                with session.begin_nested():
+                    add_hash_dimension(
+                        session,
+                        model,
+                        column_name=column_name,
+                        number_partitions=number_partitions,
+                        commit=False,
+                    )
+            except sqlalchemy.exc.DBAPIError as e:
+                warnings.append(
+                    f"Could not add hash dimension on {column_name} to "
+                    f"{hypertable_name}, dimensions can only be added to empty "
+                    f"hypertables: {e.orig}"
+                )
+                continue
+            logger.info(f"Added hash dimension on {column_name} to {hypertable_name}")
+        elif dimension.num_partitions != number_partitions:
+            session.execute(
+                sqlalchemy.text(sql.SET_NUMBER_PARTITIONS_SQL),
+                {
+                    "hypertable_name": hypertable_name,
+                    "number_partitions": number_partitions,
+                    "column_name": column_name,
+                },
+            )
+            logger.info(
+                f"Changed hash partitions on {column_name} of {hypertable_name} "
+                f"from {dimension.num_partitions} to {number_partitions}"
+            )
+
+    for column_name in live:
+        warnings.append(
+            f"{hypertable_name} has a hash dimension on {column_name} that is not "
+            "declared in __partition_by__, dimensions cannot be removed"
+        )
+    if commit:
+        session.commit()
+    return warnings
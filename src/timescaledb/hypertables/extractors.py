@@ -17,6 +17,7 @@ def extract_model_hypertable_params(
     table_name = getattr(model, "__tablename__", None)
     if_not_exists = getattr(model, "__if_not_exists__", False)
     migrate_data = getattr(model, "__migrate_data__", False)
+    partition_by = getattr(model, "__partition_by__", None)
     return {
         "model": model,
         "table_name": table_name,
@@ -24,4 +25,5 @@ def extract_model_hypertable_params(
         "chunk_time_interval": chunk_time_interval,
         "if_not_exists": if_not_exists,
         "migrate_data": migrate_data,
+        "partition_by": partition_by,
     }
@@ -0,0 +1,249 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Type, Union
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.cleaners import clean_interval_string
+from timescaledb.hypertables import sql_statements as sql
+from timescaledb.hypertables.chunks import (
+    ChunkSchema,
+    chunks_detailed_size,
+    list_chunks,
+)
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.hypertables.schemas import ChunkIntervalRecommendation
+from timescaledb.routing import on_primary
+
+ChunkTimeInterval = Union[str, timedelta, int]
+
+# Share of memory the active chunks (tables and indexes) should fit in
+CHUNK_MEMORY_FRACTION = 0.25
+
+
+def get_chunk_time_interval(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> Optional[Union[timedelta, int]]:
+    """
+    Get the chunk_time_interval new chunks of a hypertable are created with
+
+    Returns:
+        A timedelta for timestamp time columns, an int for integer time columns,
+        or None if the table is not a hypertable
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "get chunk time interval")
+    row = session.execute(
+        sqlalchemy.text(sql.CHUNK_TIME_INTERVAL_SQL),
+        {"hypertable_name": hypertable_name},
+    ).fetchone()
+    if row is None:
+        return None
+    if row.time_interval is not None:
+        return row.time_interval
+    return row.integer_interval
+
+
+@on_primary
+def set_chunk_time_interval(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    chunk_time_interval: ChunkTimeInterval = None,
+    commit: bool = True,
+) -> None:
+    """
+    Change the chunk_time_interval of a hypertable
+
+    Only chunks created afterwards use the new interval, existing chunks keep
+    their time ranges.
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class of the hypertable, its __chunk_time_interval__ is
+            used when chunk_time_interval is not given
+        table_name: Name of the hypertable (alternative to model)
+        chunk_time_interval: New interval, e.g., '1 day' or timedelta(days=1),
+            or an int for integer time columns
+        commit: Whether to commit the transaction
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "set chunk time interval")
+    if chunk_time_interval is None and model is not None:
+        chunk_time_interval = getattr(model, "__chunk_time_interval__", None)
+    if chunk_time_interval is None:
+        raise ValueError("chunk_time_interval is required")
+
+    value, interval_type = _format_interval(chunk_time_interval)
+    session.execute(
+        sqlalchemy.text(
+            sql.SET_CHUNK_TIME_INTERVAL_SQL.format(interval_type=interval_type)
+        ),
+        {"hypertable_name": hypertable_name, "chunk_time_interval": value},
+    )
+    if commit:
+        session.commit()
+
+
+def recommend_chunk_time_interval(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    memory_bytes: Optional[int] = None,
+    memory_fraction: float = CHUNK_MEMORY_FRACTION,
+    active_chunks: int = 1,
+) -> ChunkIntervalRecommendation:
+    """
+    Recommend a chunk_time_interval so the most recent chunk, indexes included,
+    fits in a quarter of the memory.
+
+    The ingest rate is measured from the uncompressed chunks in the catalog:
+    their total size divided by the time range they cover. Complete chunks are
+    preferred, the newest chunk is only used when nothing else is available.
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class of the hypertable
+        table_name: Name of the hypertable (alternative to model)
+        memory_bytes: Memory of the database server. Defaults to shared_buffers,
+            which is conventionally set to 25% of the memory already, so
+            memory_fraction is not applied to it
+        memory_fraction: Share of memory_bytes the active chunks may use
+        active_chunks: Number of chunks written to concurrently (e.g., one per
+            hash partition or per hypertable sharing the server)
+
+    Returns:
+        ChunkIntervalRecommendation, apply it with set_chunk_time_interval
+    """
+    hypertable_name = get_chunk_table_name(
+        model, table_name, "recommend chunk time interval"
+    )
+    if active_chunks < 1:
+        raise ValueError("active_chunks must be at least 1")
+    if memory_bytes is not None:
+        target_bytes = int(memory_bytes * memory_fraction)
+    else:
+        target_bytes = session.execute(
+            sqlalchemy.text(sql.SHARED_BUFFERS_BYTES_SQL)
+        ).scalar()
+    target_bytes = target_bytes // active_chunks
+
+    current_interval = get_chunk_time_interval(session, table_name=hypertable_name)
+    sizes = {
+        size.qualified_name: size.total_bytes
+        for size in chunks_detailed_size(session, table_name=hypertable_name)
+    }
+    chunks = [
+        chunk
+        for chunk in list_chunks(session, table_name=hypertable_name)
+        if not chunk.is_compressed and sizes.get(chunk.qualified_name)
+    ]
+
+    # The newest chunk is usually still filling up, prefer the ones before it
+    complete = chunks[:-1]
+    sampled = complete or chunks
+    recommendation = ChunkIntervalRecommendation(
+        hypertable_name=hypertable_name,
+        current_interval=current_interval,
+        target_bytes=target_bytes,
+        sampled_chunks=len(sampled),
+    )
+    if not sampled:
+        recommendation.warnings.append(
+            f"No uncompressed chunks with data in {hypertable_name}, "
+            "load data before asking for a recommendation"
+        )
+        return recommendation
+
+    total_bytes = sum(sizes[chunk.qualified_name] for chunk in sampled)
+    now = datetime.now(timezone.utc)
+    total_span = sum(_chunk_span(chunk, now) for chunk in sampled)
+    recommendation.bytes_per_chunk = total_bytes / len(sampled)
+    if total_span <= 0:
+        recommendation.warnings.append(
+            f"Chunks of {hypertable_name} cover no time range yet"
+        )
+        return recommendation
+    recommendation.bytes_per_second = total_bytes / total_span
+
+    recommended_span = target_bytes / recommendation.bytes_per_second
+    if isinstance(current_interval, int):
+        recommendation.recommended_interval = max(int(recommended_span), 1)
+    else:
+        recommendation.recommended_interval = _round_interval(recommended_span)
+    if not complete:
+        recommendation.warnings.append(
+            "Only the newest, still filling chunk was sampled, "
+            "the recommendation may be inaccurate"
+        )
+    return recommendation
+
+
+def check_chunk_time_interval_drift(
+    session: Session, model: Type[SQLModel]
+) -> Optional[str]:
+    """
+    Compare a model's __chunk_time_interval__ with the hypertable's live value
+
+    Returns:
+        A human readable warning when they disagree, None otherwise
+    """
+    declared = getattr(model, "__chunk_time_interval__", None)
+    live = get_chunk_time_interval(session, model=model)
+    if declared is None or live is None:
+        return None
+    if isinstance(declared, str) and not isinstance(live, int):
+        value, _ = _format_interval(declared)
+        declared_value = session.execute(
+            sqlalchemy.text(sql.CAST_INTERVAL_SQL), {"interval": value}
+        ).scalar()
+    elif isinstance(declared, int) and isinstance(live, timedelta):
+        # Integer intervals of timestamp columns are in microseconds
+        declared_value = timedelta(microseconds=declared)
+    else:
+        declared_value = declared
+    if declared_value == live:
+        return None
+    return (
+        f"__chunk_time_interval__ is {declared!r} but {model.__tablename__} "
+        f"creates chunks every {live}, use set_chunk_time_interval to apply "
+        "the model value to future chunks"
+    )
+
+
+def _chunk_span(chunk: ChunkSchema, now: datetime) -> float:
+    """
+    Length of the time range a chunk covers, up to now for the newest chunk
+    """
+    if chunk.range_start is not None and chunk.range_end is not None:
+        end = min(chunk.range_end, now)
+        return max((end - chunk.range_start).total_seconds(), 0)
+    if chunk.range_start_integer is not None and chunk.range_end_integer is not None:
+        return chunk.range_end_integer - chunk.range_start_integer
+    return 0
+
+
+def _round_interval(seconds: float) -> timedelta:
+    """
+    Round an interval down to whole days, hours or minutes depending on its size
+    """
+    if seconds >= timedelta(days=7).total_seconds():
+        unit = timedelta(days=1)
+    elif seconds >= timedelta(days=1).total_seconds():
+        unit = timedelta(hours=1)
+    else:
+        unit = timedelta(minutes=1)
+    return max(unit * int(seconds // unit.total_seconds()), timedelta(minutes=1))
+
+
+def _format_interval(interval: ChunkTimeInterval):
+    if isinstance(interval, int) and not isinstance(interval, bool):
+        return interval, "BIGINT"
+    if isinstance(interval, timedelta):
+        return interval, "INTERVAL"
+    if isinstance(interval, str):
+        return clean_interval_string(interval), "INTERVAL"
+    raise ValueError(
+        f"Invalid chunk time interval {interval!r}. "
+        "Use an interval (str or timedelta) or an integer"
+    )
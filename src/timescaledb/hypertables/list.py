@@ -5,8 +5,10 @@ from sqlmodel import Session
 
 from timescaledb.hypertables import sql_statements as sql
 from timescaledb.hypertables.schemas import HyperTableSchema
+from timescaledb.routing import read_only
 
 
+@read_only
 def list_hypertables(session: Session) -> List[HyperTableSchema]:
     """
     List all hypertables in the database
@@ -20,6 +22,7 @@ def list_hypertables(session: Session) -> List[HyperTableSchema]:
     return [HyperTableSchema(**dict(row._mapping)) for row in rows]
 
 
+@read_only
 def is_hypertable(session: Session, table_name: str) -> bool:
     """
     Check if a specific table is a hypertable
@@ -31,5 +34,8 @@ def is_hypertable(session: Session, table_name: str) -> bool:
     Returns:
         bool: True if the table is a hypertable, False otherwise
     """
-    hypertables = list_hypertables(session)
-    return any(h.hypertable_name == table_name for h in hypertables)
+    return bool(
+        session.execute(
+            sqlalchemy.text(sql.IS_HYPERTABLE_SQL), {"table_name": table_name}
+        ).scalar()
+    )
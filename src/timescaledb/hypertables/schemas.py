@@ -1,4 +1,5 @@
-from typing import Any, List, Optional, Type
+from datetime import timedelta
+from typing import Any, List, Optional, Type, Union
 
 import sqlalchemy
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -23,6 +24,7 @@ class HypertableCreateSchema(BaseModel):
     interval_type: str = Field(default="INVALID")
     if_not_exists: bool = Field(default=False)
     migrate_data: bool = Field(default=False)
+    partition_by: Any = Field(default=None)
 
     model: Optional[Type[SQLModel]] = Field(default=None)
 
@@ -36,6 +38,9 @@ class HypertableCreateSchema(BaseModel):
             validators.validate_chunk_time_interval(
                 self.model, self.time_column, self.chunk_time_interval
             )
+        self.partition_by = validators.validate_partition_by(
+            self.model, self.time_column, self.partition_by
+        )
         chunk_time_interval, chunk_time_interval_type = cleaners.clean_interval(
             self.chunk_time_interval
         )
@@ -45,7 +50,7 @@ class HypertableCreateSchema(BaseModel):
 
     def to_sql_params(self) -> dict:
         """Convert the hypertable parameters to a dictionary of SQL parameters."""
-        return self.model_dump(exclude=["model", "interval_type"])
+        return self.model_dump(exclude=["model", "interval_type", "partition_by"])
 
     def to_sql_query(self) -> str:
         """Convert the hypertable parameters to a SQL query."""
@@ -57,6 +62,18 @@ class HypertableCreateSchema(BaseModel):
         compiled_query = str(query.compile(compile_kwargs={"literal_binds": True}))
         return compiled_query
 
+    def to_dimension_sql_queries(self) -> List[str]:
+        """Convert the hash dimensions (partition_by) to add_dimension SQL queries."""
+        queries = []
+        for column_name, number_partitions in self.partition_by:
+            query = sqlalchemy.text(sql.ADD_HASH_DIMENSION_SQL).bindparams(
+                table_name=self.table_name,
+                column_name=column_name,
+                number_partitions=number_partitions,
+            )
+            queries.append(str(query.compile(compile_kwargs={"literal_binds": True})))
+        return queries
+
 
 class HyperTableSchema(BaseModel):
     """Base class for hypertables"""
@@ -68,3 +85,28 @@ class HyperTableSchema(BaseModel):
     num_chunks: int
     compression_enabled: bool
     tablespaces: Optional[List[str]] = None
+
+
+class DimensionSchema(BaseModel):
+    """A time (range) or space (hash) dimension of a hypertable"""
+
+    column_name: str
+    dimension_number: int
+    dimension_type: str
+    num_partitions: Optional[int] = None
+    time_interval: Optional[timedelta] = None
+    integer_interval: Optional[int] = None
+
+
+class ChunkIntervalRecommendation(BaseModel):
+    """Recommended chunk_time_interval of a hypertable, from its recent chunks"""
+
+    hypertable_name: str
+    current_interval: Optional[Union[timedelta, int]] = None
+    recommended_interval: Optional[Union[timedelta, int]] = None
+    target_bytes: int
+    bytes_per_chunk: Optional[float] = None
+    # Bytes ingested per second of data time (per unit for integer time columns)
+    bytes_per_second: Optional[float] = None
+    sampled_chunks: int = 0
+    warnings: List[str] = []
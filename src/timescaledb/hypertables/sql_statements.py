@@ -19,5 +19,77 @@ SELECT create_hypertable(
 
 
 LIST_AVAILABLE_HYPERTABLES_SQL = """
-SELECT * FROM timescaledb_information.hypertables;
+SELECT hypertable_schema,
+       hypertable_name,
+       owner,
+       num_dimensions,
+       num_chunks,
+       compression_enabled,
+       tablespaces
+  FROM timescaledb_information.hypertables;
+"""
+
+
+IS_HYPERTABLE_SQL = """
+SELECT EXISTS (
+    SELECT 1
+      FROM timescaledb_information.hypertables
+      WHERE hypertable_name = :table_name
+);
+"""
+
+
+CHUNK_TIME_INTERVAL_SQL = """
+SELECT time_interval, integer_interval
+  FROM timescaledb_information.dimensions
+  WHERE hypertable_name = :hypertable_name
+    AND dimension_type = 'Time'
+  ORDER BY dimension_number
+  LIMIT 1;
+"""
+
+SET_CHUNK_TIME_INTERVAL_SQL = """
+SELECT set_chunk_time_interval(
+    CAST(:hypertable_name AS regclass),
+    CAST(:chunk_time_interval AS {interval_type})
+);
+"""
+
+CAST_INTERVAL_SQL = """
+SELECT CAST(:interval AS INTERVAL);
+"""
+
+SHARED_BUFFERS_BYTES_SQL = """
+SELECT CAST(setting AS BIGINT) * pg_size_bytes(unit)
+  FROM pg_settings
+  WHERE name = 'shared_buffers';
+"""
+
+
+ADD_HASH_DIMENSION_SQL = """
+SELECT add_dimension(
+    :table_name,
+    by_hash(:column_name, :number_partitions),
+    if_not_exists => true
+);
+"""
+
+SET_NUMBER_PARTITIONS_SQL = """
+SELECT set_number_partitions(
+    CAST(:hypertable_name AS regclass),
+    :number_partitions,
+    dimension_name => :column_name
+);
+"""
+
+LIST_DIMENSIONS_SQL = """
+SELECT column_name,
+       dimension_number,
+       dimension_type,
+       num_partitions,
+       time_interval,
+       integer_interval
+  FROM timescaledb_information.dimensions
+  WHERE hypertable_name = :hypertable_name
+  ORDER BY dimension_number;
 """
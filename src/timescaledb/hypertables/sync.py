@@ -4,16 +4,25 @@ from typing import Type
 from sqlmodel import Session, SQLModel
 
 from timescaledb.hypertables.create import create_hypertable
+from timescaledb.hypertables.dimensions import sync_partition_dimensions
+from timescaledb.hypertables.interval import check_chunk_time_interval_drift
 from timescaledb.hypertables.list import list_hypertables
+from timescaledb.instrumentation import instrumented
 from timescaledb.models import TimescaleModel
+from timescaledb.routing import on_primary
 
 logger = logging.getLogger(__name__)
 
 
+@instrumented()
+@on_primary
 def sync_all_hypertables(session: Session, *models: Type[SQLModel]) -> None:
     """
     Set up hypertables for all models that inherit from TimescaleModel.
     If no models are provided, all SQLModel subclasses in the current SQLModel registry will be checked.
+    For existing hypertables, the hash dimensions are synced with __partition_by__ and a
+    warning is logged when the model's __chunk_time_interval__ differs from the live
+    chunk_time_interval.
 
     Args:
         session: SQLModel session
@@ -29,21 +38,46 @@ def sync_all_hypertables(session: Session, *models: Type[SQLModel]) -> None:
             if getattr(model, "__table__", None) is not None
         ]
     current_hypertables = [x.hypertable_name for x in list_hypertables(session)]
+    existing_models = []
     for model in model_list:
         if model.__tablename__ in current_hypertables:
             logger.info(f"Hypertable for `{model.__name__}` exists. Skipping...")
+            existing_models.append(model)
             continue
         try:
-            create_hypertable(
-                session,
-                commit=False,
-                model=model,
-                table_name=None,
-                hypertable_options={
-                    "if_not_exists": True,
-                    "migrate_data": True,
-                },
-            )
+            # A failed model only rolls back its savepoint, not the hypertables
+            # created before it in this transaction
+            with session.begin_nested():
+                create_hypertable(
+                    session,
+                    commit=False,
+                    model=model,
+                    table_name=None,
+                    hypertable_options={
+                        "if_not_exists": True,
+                        "migrate_data": True,
+                    },
+                )
         except Exception as e:
             logger.error(f"Error creating hypertable for {model.__name__}: {e}")
     session.commit()
+
+    for model in existing_models:
+        try:
+            warnings = sync_partition_dimensions(session, model)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error syncing dimensions for {model.__name__}: {e}")
+            warnings = []
+        try:
+            drift = check_chunk_time_interval_drift(session, model)
+        except Exception as e:
+            session.rollback()
+            logger.debug(
+                f"Could not check chunk time interval of {model.__name__}: {e}"
+            )
+            drift = None
+        if drift is not None:
+            warnings.append(drift)
+        for warning in warnings:
+            logger.warning(f"{model.__name__}: {warning}")
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Type
+from typing import List, Tuple, Type
 
 import sqlalchemy
 from sqlmodel import SQLModel
@@ -91,3 +91,116 @@ def validate_chunk_time_interval(
         raise exceptions.InvalidChunkTimeInterval(
             f"{model_class.__name__}: Unsupported time column type {column_type}"
         )
+
+
+def validate_partition_by(
+    model_class: Type[SQLModel], time_column: str, partition_by
+) -> List[Tuple[str, int]]:
+    """
+    Validate the hash dimensions declared in __partition_by__
+
+    Accepts a single (column, number_partitions) tuple or a list of them.
+
+    Returns:
+        List[Tuple[str, int]]: The hash dimensions as (column, number_partitions)
+
+    Raises:
+        InvalidPartitionBy: If a column does not exist, is the time column, is
+            repeated, is missing from the primary key or a unique constraint
+            (TimescaleDB requires every partitioning column in them) or
+            number_partitions is not a positive integer
+    """
+    dimensions = normalize_partition_by(partition_by)
+    seen = set()
+    for column_name, _ in dimensions:
+        if model_class is not None:
+            if model_class.__table__.columns.get(column_name) is None:
+                raise exceptions.InvalidPartitionBy(
+                    f"{model_class.__name__}: Partition column {column_name} not found"
+                )
+        if column_name == time_column:
+            raise exceptions.InvalidPartitionBy(
+                f"Partition column {column_name} is already the time column"
+            )
+        if column_name in seen:
+            raise exceptions.InvalidPartitionBy(
+                f"Partition column {column_name} is declared more than once"
+            )
+        seen.add(column_name)
+    if model_class is not None:
+        for name, columns in unique_column_sets(model_class):
+            missing = [column for column, _ in dimensions if column not in columns]
+            if missing:
+                raise exceptions.InvalidPartitionBy(
+                    f"{model_class.__name__}: Partition column(s) "
+                    f"{', '.join(missing)} missing from the {name} "
+                    f"({', '.join(columns)})"
+                )
+    return dimensions
+
+
+def unique_column_sets(model_class: Type[SQLModel]) -> List[Tuple[str, List[str]]]:
+    """
+    Columns of the primary key and of every unique constraint or unique index
+    of the model's table, as (description, column names)
+    """
+    table = model_class.__table__
+    column_sets = []
+    if table.primary_key.columns:
+        column_sets.append(
+            ("primary key", [column.name for column in table.primary_key.columns])
+        )
+    for constraint in table.constraints:
+        if isinstance(constraint, sqlalchemy.UniqueConstraint):
+            column_sets.append(
+                (
+                    f"unique constraint {constraint.name or ''}".strip(),
+                    [column.name for column in constraint.columns],
+                )
+            )
+    for index in table.indexes:
+        if index.unique:
+            column_sets.append(
+                (
+                    f"unique index {index.name or ''}".strip(),
+                    [column.name for column in index.columns],
+                )
+            )
+    return column_sets
+
+
+def normalize_partition_by(partition_by) -> List[Tuple[str, int]]:
+    """
+    Turn __partition_by__ into a list of (column, number_partitions) tuples
+    """
+    if partition_by is None:
+        return []
+    if (
+        isinstance(partition_by, tuple)
+        and partition_by
+        and isinstance(partition_by[0], str)
+    ):
+        partition_by = [partition_by]
+    dimensions = []
+    for dimension in partition_by:
+        if (
+            not isinstance(dimension, (tuple, list))
+            or len(dimension) != 2
+            or not isinstance(dimension[0], str)
+        ):
+            raise exceptions.InvalidPartitionBy(
+                f"Invalid partition by {dimension!r}, "
+                'use a (column, number_partitions) tuple such as ("device_id", 4)'
+            )
+        column_name, number_partitions = dimension
+        if (
+            not isinstance(number_partitions, int)
+            or isinstance(number_partitions, bool)
+            or number_partitions < 1
+        ):
+            raise exceptions.InvalidPartitionBy(
+                f"Invalid number of partitions {number_partitions!r} for "
+                f"{column_name}, use a positive integer"
+            )
+        dimensions.append((column_name, number_partitions))
+    return dimensions
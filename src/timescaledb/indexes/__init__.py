@@ -0,0 +1,15 @@
+from .builders import brin_index, composite_index, partial_index
+from .create import create_time_series_indexes
+from .schemas import TimeSeriesIndex
+from .sync import sync_time_series_indexes
+from .validators import check_index_patterns
+
+__all__ = [
+    "TimeSeriesIndex",
+    "composite_index",
+    "partial_index",
+    "brin_index",
+    "create_time_series_indexes",
+    "sync_time_series_indexes",
+    "check_index_patterns",
+]
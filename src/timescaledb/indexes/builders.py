@@ -0,0 +1,62 @@
+from typing import Optional
+
+from timescaledb.defaults import TIME_COLUMN
+from timescaledb.indexes.schemas import TimeSeriesIndex
+
+
+def composite_index(
+    *series_columns: str,
+    time_column: str = TIME_COLUMN,
+    name: Optional[str] = None,
+    where: Optional[str] = None,
+    include: tuple = (),
+) -> TimeSeriesIndex:
+    """
+    Index for "latest values of one series" queries: (series_columns..., time DESC)
+
+    Args:
+        *series_columns: Columns identifying a series, e.g., "device_id"
+        time_column: Time column, indexed in descending order
+        name: Index name, derived from the table and columns by default
+        where: Optional predicate making it a partial index
+        include: Extra columns stored in the index for index-only scans
+    """
+    if not series_columns:
+        raise ValueError("At least one series column is required")
+    return TimeSeriesIndex(
+        columns=(*series_columns, f"{time_column} DESC"),
+        name=name,
+        where=where,
+        include=include,
+    )
+
+
+def partial_index(
+    *columns: str,
+    where: str,
+    name: Optional[str] = None,
+) -> TimeSeriesIndex:
+    """
+    B-tree index over only the rows matching `where`, e.g., where="status = 'error'"
+    """
+    return TimeSeriesIndex(columns=columns, name=name, where=where)
+
+
+def brin_index(
+    column: str = TIME_COLUMN,
+    name: Optional[str] = None,
+    pages_per_range: Optional[int] = None,
+) -> TimeSeriesIndex:
+    """
+    BRIN index, a few pages in size, for columns that grow with insert order
+    such as the time column
+    """
+    storage_parameters = {}
+    if pages_per_range is not None:
+        storage_parameters["pages_per_range"] = pages_per_range
+    return TimeSeriesIndex(
+        columns=(column,),
+        name=name,
+        method="brin",
+        storage_parameters=storage_parameters,
+    )
@@ -0,0 +1,57 @@
+from typing import List, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.indexes import sql, validators
+from timescaledb.indexes.schemas import TimeSeriesIndex
+
+
+def create_time_series_indexes(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    indexes: List[TimeSeriesIndex] = None,
+    commit: bool = True,
+) -> List[str]:
+    """
+    Create the time-series indexes of a hypertable that do not exist yet
+
+    Indexes are created on the hypertable and propagate to every chunk.
+    Creating them on a hypertable that already holds data locks it while all
+    chunks are indexed, declare them before loading data.
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class with __time_series_indexes__ declared
+        table_name: Name of the hypertable (alternative to model)
+        indexes: Indexes to create (overrides the model's)
+        commit: Whether to commit the transaction
+
+    Returns:
+        List[str]: Names of the indexes that were created
+    """
+    if model is None and table_name is None:
+        raise ValueError("model or table_name is required to create indexes")
+    if model is not None:
+        table_name = model.__tablename__
+        if indexes is None:
+            indexes = getattr(model, "__time_series_indexes__", None) or []
+        validators.validate_time_series_indexes(model, indexes)
+
+    existing = {
+        row.indexname
+        for row in session.execute(
+            sqlalchemy.text(sql.LIST_TABLE_INDEXES_SQL), {"table_name": table_name}
+        ).fetchall()
+    }
+    created = []
+    for index in indexes or []:
+        name = index.get_name(table_name)
+        if name in existing:
+            continue
+        session.execute(sqlalchemy.text(sql.format_create_index_sql(table_name, index)))
+        created.append(name)
+    if commit:
+        session.commit()
+    return created
@@ -0,0 +1,77 @@
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, field_validator
+
+INDEX_METHODS = ("btree", "brin")
+COLUMN_ORDER_MODIFIERS = ("ASC", "DESC", "NULLS", "FIRST", "LAST")
+
+
+class TimeSeriesIndex(BaseModel):
+    """
+    An index declared on a TimescaleModel through __time_series_indexes__
+
+    Columns may carry an ordering, e.g., ("device_id", "time DESC").
+    """
+
+    columns: Tuple[str, ...]
+    name: Optional[str] = None
+    method: str = "btree"
+    where: Optional[str] = None
+    include: Tuple[str, ...] = ()
+    storage_parameters: Dict[str, Any] = {}
+    unique: bool = False
+
+    @field_validator("method")
+    @classmethod
+    def validate_method(cls, value: str) -> str:
+        value = value.lower()
+        if value not in INDEX_METHODS:
+            raise ValueError(
+                f"Invalid index method '{value}', use one of: {', '.join(INDEX_METHODS)}"
+            )
+        return value
+
+    @field_validator("columns")
+    @classmethod
+    def validate_columns(cls, value: Tuple[str, ...]) -> Tuple[str, ...]:
+        if not value:
+            raise ValueError("An index needs at least one column")
+        for column in value:
+            parts = column.split()
+            if not parts or any(
+                part.upper() not in COLUMN_ORDER_MODIFIERS for part in parts[1:]
+            ):
+                raise ValueError(
+                    f"Invalid index column '{column}', use a column name optionally "
+                    "followed by ASC/DESC and NULLS FIRST/LAST"
+                )
+        return value
+
+    @property
+    def column_names(self) -> List[str]:
+        """Column names without their ordering"""
+        return [column.split()[0] for column in self.columns]
+
+    def get_name(self, table_name: str) -> str:
+        """
+        The declared name, or one derived from the table and columns
+
+        Partial and covering indexes get a short hash of their predicate and
+        included columns, so indexes on the same columns get distinct names.
+        """
+        if self.name is not None:
+            return self.name
+        name = f"ix_{table_name}_{'_'.join(self.column_names)}"
+        if self.method != "btree":
+            name = f"{name}_{self.method}"
+        if self.where is not None:
+            name = f"{name}_partial"
+        if self.where is not None or self.include:
+            name = f"{name}_{self._digest()}"
+        return name
+
+    def _digest(self) -> str:
+        where = " ".join(self.where.split()) if self.where is not None else ""
+        key = f"{where}|{','.join(self.include)}"
+        return hashlib.sha1(key.encode()).hexdigest()[:8]
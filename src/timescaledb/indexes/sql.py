@@ -0,0 +1,38 @@
+from timescaledb.indexes.schemas import TimeSeriesIndex
+from timescaledb.utils import quote_identifier
+
+LIST_TABLE_INDEXES_SQL = """
+SELECT indexname
+  FROM pg_indexes
+  WHERE tablename = :table_name;
+"""
+
+
+def format_create_index_sql(table_name: str, index: TimeSeriesIndex) -> str:
+    """
+    Format the CREATE INDEX statement of a time-series index
+
+    The predicate of partial indexes is included as written in the declaration.
+    """
+    columns = ", ".join(_format_index_column(column) for column in index.columns)
+    unique = "UNIQUE " if index.unique else ""
+    sql = (
+        f"CREATE {unique}INDEX IF NOT EXISTS {quote_identifier(index.get_name(table_name))}"
+        f" ON {quote_identifier(table_name)} USING {index.method} ({columns})"
+    )
+    if index.include:
+        include = ", ".join(quote_identifier(column) for column in index.include)
+        sql = f"{sql} INCLUDE ({include})"
+    if index.storage_parameters:
+        parameters = ", ".join(
+            f"{key} = {value}" for key, value in index.storage_parameters.items()
+        )
+        sql = f"{sql} WITH ({parameters})"
+    if index.where is not None:
+        sql = f"{sql} WHERE {index.where}"
+    return f"{sql};"
+
+
+def _format_index_column(column: str) -> str:
+    name, *ordering = column.split()
+    return " ".join([quote_identifier(name), *(part.upper() for part in ordering)])
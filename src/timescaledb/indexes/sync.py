@@ -0,0 +1,36 @@
+import logging
+from typing import Type
+
+from sqlmodel import Session, SQLModel
+
+from timescaledb.indexes.create import create_time_series_indexes
+from timescaledb.indexes.validators import check_index_patterns
+from timescaledb.instrumentation import instrumented
+from timescaledb.models import TimescaleModel
+from timescaledb.routing import on_primary
+
+logger = logging.getLogger(__name__)
+
+
+@instrumented()
+@on_primary
+def sync_time_series_indexes(session: Session, *models: Type[SQLModel]) -> None:
+    """
+    Create the declared time-series indexes of all hypertables and log a
+    warning for index patterns that hurt ingest
+    """
+    if models:
+        model_list = models
+    else:
+        model_list = [
+            model
+            for model in TimescaleModel.__subclasses__()
+            if getattr(model, "__table__", None) is not None
+        ]
+    for model in model_list:
+        for warning in check_index_patterns(model):
+            logger.warning(f"{model.__name__}: {warning}")
+        created = create_time_series_indexes(session, model, commit=False)
+        if created:
+            logger.info(f"Created indexes {created} for {model.__name__}")
+    session.commit()
@@ -0,0 +1,139 @@
+from typing import List, Type
+
+import sqlalchemy
+from sqlmodel import SQLModel
+
+from timescaledb import exceptions
+from timescaledb.defaults import MAX_HYPERTABLE_INDEXES, TIME_COLUMN
+from timescaledb.hypertables.validators import normalize_partition_by
+from timescaledb.indexes.schemas import TimeSeriesIndex
+
+# Measurement columns, indexing them is expensive on ingest and rarely useful
+MEASUREMENT_TYPES = (sqlalchemy.Float, sqlalchemy.Numeric)
+
+
+def validate_time_series_index(model: Type[SQLModel], index: TimeSeriesIndex) -> None:
+    """
+    Verify a declared index only uses columns of the model and that unique
+    indexes include the time column and the __partition_by__ columns, as
+    TimescaleDB requires
+    """
+    time_column = getattr(model, "__time_column__", TIME_COLUMN)
+    for column in [*index.column_names, *index.include]:
+        if model.__table__.columns.get(column) is None:
+            raise exceptions.InvalidTimeSeriesIndex(
+                f"Index column '{column}' not found in model {model.__name__}"
+            )
+    if index.unique and time_column not in index.column_names:
+        raise exceptions.InvalidTimeSeriesIndex(
+            f"Unique index on {', '.join(index.column_names)} in model "
+            f"{model.__name__} must include the time column '{time_column}'"
+        )
+    if index.unique:
+        missing = [
+            column
+            for column, _ in normalize_partition_by(
+                getattr(model, "__partition_by__", None)
+            )
+            if column not in index.column_names
+        ]
+        if missing:
+            raise exceptions.InvalidTimeSeriesIndex(
+                f"Unique index on {', '.join(index.column_names)} in model "
+                f"{model.__name__} must include the partition column(s) "
+                f"{', '.join(missing)}"
+            )
+    if index.method == "brin" and any(
+        len(column.split()) > 1 for column in index.columns
+    ):
+        raise exceptions.InvalidTimeSeriesIndex(
+            f"BRIN index on {', '.join(index.columns)} in model {model.__name__} "
+            "cannot have an ordering"
+        )
+
+
+def validate_time_series_indexes(
+    model: Type[SQLModel], indexes: List[TimeSeriesIndex]
+) -> None:
+    """
+    Verify every declared index and that no two of them resolve to the same
+    name, the second one would never be created
+    """
+    names = {}
+    for index in indexes:
+        validate_time_series_index(model, index)
+        name = index.get_name(model.__tablename__)
+        if name in names:
+            raise exceptions.InvalidTimeSeriesIndex(
+                f"Indexes on {', '.join(names[name].columns)} and "
+                f"{', '.join(index.columns)} in model {model.__name__} are both "
+                f"named {name}, give one of them a name"
+            )
+        names[name] = index
+
+
+def check_index_patterns(
+    model: Type[SQLModel], indexes: List[TimeSeriesIndex] = None
+) -> List[str]:
+    """
+    Warn about indexes on a hypertable that slow down ingest for little benefit
+
+    Both the indexes of the model's table (e.g., Field(index=True)) and the
+    declared time-series indexes are checked.
+
+    Returns:
+        List[str]: Human readable warnings
+    """
+    if indexes is None:
+        indexes = getattr(model, "__time_series_indexes__", None) or []
+    time_column = getattr(model, "__time_column__", TIME_COLUMN)
+    table = model.__table__
+    warnings = []
+
+    for index in table.indexes:
+        columns = list(index.columns)
+        if len(columns) == 1 and isinstance(columns[0].type, MEASUREMENT_TYPES):
+            warnings.append(
+                f"Index {index.name} is on the measurement column {columns[0].name}, "
+                "it slows down every insert and rarely serves a query. "
+                "Remove Field(index=True) unless you filter on exact values"
+            )
+        if len(columns) == 1 and columns[0].name != time_column:
+            covering = [
+                declared
+                for declared in indexes
+                if declared.method == "btree"
+                and declared.where is None
+                and declared.column_names[0] == columns[0].name
+            ]
+            if covering:
+                warnings.append(
+                    f"Index {index.name} on {columns[0].name} is redundant with "
+                    f"{covering[0].get_name(table.name)}, which starts with the "
+                    "same column"
+                )
+
+    for index in indexes:
+        names = index.column_names
+        if index.method == "btree" and len(names) > 1 and names[0] == time_column:
+            warnings.append(
+                f"Index {index.get_name(table.name)} leads with the time column, "
+                "queries for one series scan every series in the time range. "
+                f"Put the series columns first: ({', '.join(names[1:])}, "
+                f"{time_column} DESC)"
+            )
+        if index.method == "brin" and names[0] != time_column:
+            warnings.append(
+                f"BRIN index {index.get_name(table.name)} is on {names[0]}, BRIN "
+                "only helps on columns that grow with insert order such as the "
+                "time column"
+            )
+
+    # The primary key and TimescaleDB's default time index come on top
+    total_indexes = len(table.indexes) + len(indexes) + 2
+    if total_indexes > MAX_HYPERTABLE_INDEXES:
+        warnings.append(
+            f"{table.name} has about {total_indexes} indexes, each of them is "
+            "updated on every insert. Keep hypertables to a few indexes"
+        )
+    return warnings
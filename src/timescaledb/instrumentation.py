@@ -0,0 +1,513 @@
+import bisect
+import contextvars
+import functools
+import hashlib
+import inspect
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("build", "compile", "execute", "fetch")
+
+POOL_CHECKOUT_OPERATION = "pool_checkout"
+
+# Prometheus' default latency buckets, in seconds
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class QueryEvent(BaseModel):
+    """
+    Timings of a single instrumented call
+
+    duration is the wall time of the whole call. It is broken down into:
+    build (constructing the statement), compile (SQL compilation and
+    connection checkout), execute (time spent in the database driver) and
+    fetch (turning the result into Python objects). Calls that do not mark
+    their phases only report execute, the rest of their duration is
+    bookkeeping between statements.
+
+    checkout_wait is the time spent waiting for a pooled connection (including
+    opening new ones) on engines using InstrumentedQueuePool, it is excluded
+    from compile. Every checkout is also reported on its own, as a
+    'pool_checkout' event whose duration is the wait.
+    """
+
+    operation: str
+    model: Optional[str] = None
+    duration: float
+    build: float = 0.0
+    compile: float = 0.0
+    execute: float = 0.0
+    fetch: float = 0.0
+    checkout_wait: float = 0.0
+    row_count: Optional[int] = None
+    statement_count: int = 0
+    fingerprint: Optional[str] = None
+    statement: Optional[str] = None
+    error: Optional[str] = None
+
+
+Listener = Callable[[QueryEvent], None]
+
+_listeners: List[Listener] = []
+_listeners_lock = threading.Lock()
+_current_call: contextvars.ContextVar[Optional["_Call"]] = contextvars.ContextVar(
+    "timescaledb_instrumented_call", default=None
+)
+
+
+def add_listener(listener: Listener) -> Listener:
+    """
+    Register a callable that receives a QueryEvent after every instrumented call
+
+    Nothing is measured while no listener is registered, e.g.:
+
+        add_listener(HistogramCollector())
+        add_listener(LoggingListener(slow_threshold=0.5))
+
+    Returns:
+        The listener, so add_listener can be used as a decorator
+    """
+    with _listeners_lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+        _register_cursor_events()
+    return listener
+
+
+def remove_listener(listener: Listener) -> None:
+    """
+    Unregister a listener added with add_listener
+    """
+    with _listeners_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+@contextmanager
+def listening(listener: Listener) -> Iterator[Listener]:
+    """
+    Register a listener for the duration of a with block
+    """
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+def fingerprint_sql(statement: str) -> str:
+    """
+    Fingerprint a SQL statement so calls with different literal values group
+    together
+
+    Returns:
+        A short hex digest of the normalized statement
+    """
+    return _digest(normalize_sql(statement))
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Replace literals and bind parameters with ? and collapse whitespace
+    """
+    statement = re.sub(r"'(?:[^']|'')*'", "?", statement)
+    statement = re.sub(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+", "?", statement)
+    statement = re.sub(r"(?<![\w\"])-?\d+(?:\.\d+)?\b", "?", statement)
+    return re.sub(r"\s+", " ", statement).strip()
+
+
+def instrumented(operation: Optional[str] = None):
+    """
+    Decorate a library entry point so it reports a QueryEvent to the listeners
+
+    The model of the event is taken from the call's `model` or `table_name`
+    argument. The function body can attribute its time to phases with
+    mark_phase, and its row count with set_row_count; without a row count,
+    the length of a list result is used.
+
+    Args:
+        operation: Name of the operation, defaults to the function name
+    """
+
+    def decorator(func):
+        name = operation or func.__name__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _listeners:
+                return func(*args, **kwargs)
+            call = _Call(name, _get_model_name(signature, args, kwargs))
+            token = _current_call.set(call)
+            error = None
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                _current_call.reset(token)
+                if call.row_count is None and isinstance(result, list):
+                    call.row_count = len(result)
+                _emit(call.finish(error))
+
+        return wrapper
+
+    return decorator
+
+
+def record_checkout_wait(seconds: float) -> None:
+    """
+    Report the time spent waiting for a pooled connection to the current
+    instrumented call(s) and to the listeners
+    """
+    call = _current_call.get()
+    while call is not None:
+        call.checkout_seconds += seconds
+        call = call.parent
+    _emit(
+        QueryEvent(
+            operation=POOL_CHECKOUT_OPERATION,
+            duration=seconds,
+            checkout_wait=seconds,
+        )
+    )
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool measuring how long checkouts wait for a connection
+
+    timescaledb.engine.create_engine uses it by default. Nothing is measured
+    while no listener is registered.
+    """
+
+    def _do_get(self):
+        if not _listeners:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            record_checkout_wait(time.perf_counter() - started)
+
+
+def mark_phase(phase: str) -> None:
+    """
+    Attribute the time since the previous mark of the current call to a phase
+
+    Marking "execute" covers everything up to the first result row: the time
+    spent in the database driver is reported as execute, the rest (SQL
+    compilation, connection checkout) as compile.
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.mark(phase)
+
+
+def set_row_count(row_count: int) -> None:
+    """
+    Set the row count reported for the current call
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.row_count = row_count
+
+
+class _Call:
+    __slots__ = (
+        "operation",
+        "model",
+        "parent",
+        "started",
+        "last_mark",
+        "phases",
+        "driver_seconds",
+        "checkout_seconds",
+        "row_count",
+        "statements",
+    )
+
+    def __init__(self, operation: str, model: Optional[str]):
+        self.operation = operation
+        self.model = model
+        self.parent = _current_call.get()
+        self.started = self.last_mark = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.driver_seconds = 0.0
+        self.checkout_seconds = 0.0
+        self.row_count: Optional[int] = None
+        self.statements: List[str] = []
+
+    def mark(self, phase: str) -> None:
+        if phase not in PHASES:
+            raise ValueError(f"Unknown phase {phase!r}, use one of {PHASES}")
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last_mark
+        self.last_mark = now
+
+    def finish(self, error: Optional[Exception]) -> QueryEvent:
+        duration = time.perf_counter() - self.started
+        statement = "; ".join(normalize_sql(s) for s in self.statements) or None
+        return QueryEvent(
+            operation=self.operation,
+            model=self.model,
+            duration=duration,
+            build=self.phases.get("build", 0.0),
+            compile=max(
+                self.phases.get("execute", 0.0)
+                - self.driver_seconds
+                - self.checkout_seconds,
+                0.0,
+            )
+            + self.phases.get("compile", 0.0),
+            execute=self.driver_seconds,
+            fetch=self.phases.get("fetch", 0.0),
+            checkout_wait=self.checkout_seconds,
+            row_count=self.row_count,
+            statement_count=len(self.statements),
+            fingerprint=_digest(statement) if statement else None,
+            statement=statement,
+            error=repr(error) if error is not None else None,
+        )
+
+
+def _digest(normalized_statement: str) -> str:
+    return hashlib.sha1(normalized_statement.encode()).hexdigest()[:16]
+
+
+def _get_model_name(signature: inspect.Signature, args, kwargs) -> Optional[str]:
+    try:
+        arguments = signature.bind_partial(*args, **kwargs).arguments
+    except TypeError:
+        return None
+    model = arguments.get("model")
+    if model is not None:
+        return getattr(model, "__tablename__", getattr(model, "__name__", None))
+    table_name = arguments.get("table_name")
+    if isinstance(table_name, str):
+        return table_name
+    models = arguments.get("models")
+    if isinstance(models, tuple) and len(models) == 1:
+        return getattr(models[0], "__tablename__", None)
+    return None
+
+
+def _emit(query_event: QueryEvent) -> None:
+    for listener in list(_listeners):
+        try:
+            listener(query_event)
+        except Exception:
+            logger.exception(f"Instrumentation listener {listener!r} failed")
+
+
+_cursor_events_registered = False
+
+
+def _register_cursor_events() -> None:
+    global _cursor_events_registered
+    if _cursor_events_registered:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _cursor_events_registered = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, which is discarded with the statement
+    # even when it raises, unlike conn.info which outlives pool checkouts
+    if _current_call.get() is not None and context is not None:
+        context._timescaledb_cursor_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    call = _current_call.get()
+    started = getattr(context, "_timescaledb_cursor_started", None)
+    if call is None or started is None:
+        return
+    elapsed = time.perf_counter() - started
+    call.statements.append(statement)
+    while call is not None:
+        call.driver_seconds += elapsed
+        call = call.parent
+
+
+class OperationHistogram(BaseModel):
+    """
+    Aggregated timings of one operation
+
+    buckets maps each upper bound (in seconds) to the number of calls that took
+    at most that long, cumulative like Prometheus histograms.
+    """
+
+    operation: str
+    count: int = 0
+    errors: int = 0
+    rows: int = 0
+    duration_sum: float = 0.0
+    checkout_wait_sum: float = 0.0
+    phase_sums: Dict[str, float] = Field(
+        default_factory=lambda: {phase: 0.0 for phase in PHASES}
+    )
+    buckets: Dict[float, int] = Field(default_factory=dict)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a duration quantile (e.g., 0.95) from the bucket counts
+
+        Returns:
+            The upper bound of the bucket the quantile falls in, None without
+            calls or when it falls past the largest bucket
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, count in self.buckets.items():
+            if count >= rank:
+                return bound
+        return None
+
+
+class HistogramCollector:
+    """
+    Listener that keeps in-memory duration histograms per operation
+
+    Args:
+        buckets: Upper bounds of the histogram buckets, in seconds
+        group_by_model: Keep separate histograms per model
+            ("time_bucket_query:metric")
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        group_by_model: bool = False,
+    ):
+        self.bounds = sorted(buckets)
+        self.group_by_model = group_by_model
+        self._lock = threading.Lock()
+        self._counts: Dict[str, List[int]] = {}
+        self._histograms: Dict[str, OperationHistogram] = {}
+
+    def __call__(self, query_event: QueryEvent) -> None:
+        key = query_event.operation
+        if self.group_by_model and query_event.model:
+            key = f"{key}:{query_event.model}"
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = OperationHistogram(operation=key)
+                self._counts[key] = [0] * len(self.bounds)
+            histogram.count += 1
+            histogram.errors += query_event.error is not None
+            histogram.rows += query_event.row_count or 0
+            histogram.duration_sum += query_event.duration
+            histogram.checkout_wait_sum += query_event.checkout_wait
+            for phase in PHASES:
+                histogram.phase_sums[phase] += getattr(query_event, phase)
+            index = bisect.bisect_left(self.bounds, query_event.duration)
+            if index < len(self.bounds):
+                self._counts[key][index] += 1
+
+    def snapshot(self) -> Dict[str, OperationHistogram]:
+        """
+        Copy the current histograms
+
+        Returns:
+            Dict[str, OperationHistogram]: Histograms keyed by operation
+        """
+        with self._lock:
+            snapshot = {}
+            for key, histogram in self._histograms.items():
+                copy = histogram.model_copy(deep=True)
+                cumulative = 0
+                for bound, count in zip(self.bounds, self._counts[key]):
+                    cumulative += count
+                    copy.buckets[bound] = cumulative
+                snapshot[key] = copy
+            return snapshot
+
+    def reset(self) -> None:
+        """
+        Forget all recorded calls
+        """
+        with self._lock:
+            self._histograms.clear()
+            self._counts.clear()
+
+
+class LoggingListener:
+    """
+    Listener that logs every call, or only calls slower than a threshold
+
+    Args:
+        logger: Logger to write to, defaults to this module's logger
+        level: Level of regular calls
+        slow_threshold: Only log calls that took at least this many seconds,
+            at WARNING level
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+        slow_threshold: Optional[float] = None,
+    ):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+        self.slow_threshold = slow_threshold
+
+    def __call__(self, query_event: QueryEvent) -> None:
+        if self.slow_threshold is not None:
+            if query_event.duration < self.slow_threshold:
+                return
+            level = logging.WARNING
+        else:
+            level = logging.ERROR if query_event.error else self.level
+        if not self.logger.isEnabledFor(level):
+            return
+        self.logger.log(level, self.format(query_event))
+
+    def format(self, query_event: QueryEvent) -> str:
+        target = f" on {query_event.model}" if query_event.model else ""
+        rows = (
+            f" rows={query_event.row_count}"
+            if query_event.row_count is not None
+            else ""
+        )
+        error = f" error={query_event.error}" if query_event.error else ""
+        return (
+            f"{query_event.operation}{target} took {query_event.duration * 1000:.1f}ms "
+            f"(build={query_event.build * 1000:.1f}ms "
+            f"compile={query_event.compile * 1000:.1f}ms "
+            f"execute={query_event.execute * 1000:.1f}ms "
+            f"fetch={query_event.fetch * 1000:.1f}ms "
+            f"checkout_wait={query_event.checkout_wait * 1000:.1f}ms)"
+            f"{rows} statements={query_event.statement_count} "
+            f"fingerprint={query_event.fingerprint}{error}"
+        )
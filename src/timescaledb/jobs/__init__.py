@@ -0,0 +1,18 @@
+from .health import get_jobs_health, summarize_jobs
+from .list import get_job, get_model_map, list_job_errors, list_jobs
+from .run import alter_job, run_job
+from .schemas import JobErrorSchema, JobSchema, JobsHealthSummary
+
+__all__ = [
+    "list_jobs",
+    "get_job",
+    "list_job_errors",
+    "get_model_map",
+    "run_job",
+    "alter_job",
+    "get_jobs_health",
+    "summarize_jobs",
+    "JobSchema",
+    "JobErrorSchema",
+    "JobsHealthSummary",
+]
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from sqlmodel import Session
+
+from timescaledb.instrumentation import instrumented
+from timescaledb.jobs import sql
+from timescaledb.jobs.list import list_jobs
+from timescaledb.jobs.schemas import JobSchema, JobsHealthSummary
+from timescaledb.routing import read_only
+
+
+@instrumented()
+@read_only
+def get_jobs_health(
+    session: Session,
+    overdue_after: timedelta = timedelta(minutes=5),
+    proc_names: Optional[Iterable[str]] = sql.POLICY_PROC_NAMES,
+) -> JobsHealthSummary:
+    """
+    Summarize the health of the background jobs with a single query
+
+    A job is failing when its last run failed and overdue when it is scheduled
+    but should have started more than `overdue_after` ago (e.g., the scheduler
+    is not running or all background workers are busy).
+
+    Args:
+        session: SQLAlchemy session
+        overdue_after: Grace period after next_start before a job is overdue
+        proc_names: Job procedures to include, defaults to the policies managed
+            by this library
+    """
+    return summarize_jobs(
+        list_jobs(session, proc_names=proc_names), overdue_after=overdue_after
+    )
+
+
+def summarize_jobs(
+    jobs: List[JobSchema],
+    overdue_after: timedelta = timedelta(minutes=5),
+    now: Optional[datetime] = None,
+) -> JobsHealthSummary:
+    """
+    Summarize the health of already listed jobs
+    """
+    now = now or datetime.now(timezone.utc)
+    summary = JobsHealthSummary(checked_at=now, total_jobs=len(jobs))
+    successes = []
+    for job in jobs:
+        summary.total_failures += job.total_failures or 0
+        if not job.scheduled:
+            continue
+        summary.scheduled_jobs += 1
+        if job.failed:
+            summary.failing_job_ids.append(job.job_id)
+        if job.next_start is not None and job.next_start < now - overdue_after:
+            summary.overdue_job_ids.append(job.job_id)
+        if job.last_successful_finish is None:
+            if job.total_runs:
+                summary.never_succeeded_job_ids.append(job.job_id)
+        else:
+            successes.append(job.last_successful_finish)
+    summary.oldest_success = min(successes, default=None)
+    return summary
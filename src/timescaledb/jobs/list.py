@@ -0,0 +1,109 @@
+from typing import Dict, Iterable, List, Optional, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.instrumentation import instrumented
+from timescaledb.jobs import sql
+from timescaledb.jobs.schemas import JobErrorSchema, JobSchema
+from timescaledb.models import TimescaleModel
+from timescaledb.routing import read_only
+
+
+@instrumented()
+@read_only
+def list_jobs(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    proc_names: Optional[Iterable[str]] = sql.POLICY_PROC_NAMES,
+    models: Optional[Iterable[Type[SQLModel]]] = None,
+) -> List[JobSchema]:
+    """
+    List background jobs with their run stats, mapped back to their models
+
+    Args:
+        session: SQLAlchemy session
+        model: Only list the jobs of this model's table
+        table_name: Only list the jobs of this hypertable or continuous aggregate
+        proc_names: Job procedures to include, defaults to the policies managed
+            by this library. None lists every job, including user-defined ones
+        models: Models to map jobs to, defaults to all TimescaleModel tables
+
+    Returns:
+        List[JobSchema]: Jobs ordered by job_id
+    """
+    if model is not None:
+        table_name = model.__tablename__
+    rows = session.execute(
+        sqlalchemy.text(sql.LIST_JOBS_SQL),
+        {
+            "job_id": None,
+            "hypertable_name": table_name,
+            "proc_names": list(proc_names) if proc_names is not None else None,
+        },
+    ).fetchall()
+    model_map = get_model_map(models)
+    if model is not None:
+        model_map[model.__tablename__] = model
+    jobs = []
+    for row in rows:
+        job = JobSchema(**row._mapping)
+        job.model = model_map.get(job.target_name)
+        jobs.append(job)
+    return jobs
+
+
+@read_only
+def get_job(session: Session, job_id: int) -> Optional[JobSchema]:
+    """
+    Get a background job with its run stats
+
+    Returns:
+        JobSchema, or None if there is no such job
+    """
+    row = session.execute(
+        sqlalchemy.text(sql.LIST_JOBS_SQL),
+        {"job_id": job_id, "hypertable_name": None, "proc_names": None},
+    ).fetchone()
+    if row is None:
+        return None
+    job = JobSchema(**row._mapping)
+    job.model = get_model_map().get(job.target_name)
+    return job
+
+
+@read_only
+def list_job_errors(
+    session: Session,
+    job_id: Optional[int] = None,
+    limit: int = 100,
+) -> List[JobErrorSchema]:
+    """
+    List the most recent failed job runs
+
+    Args:
+        session: SQLAlchemy session
+        job_id: Only list the errors of this job
+        limit: Maximum number of errors, most recent first
+    """
+    rows = session.execute(
+        sqlalchemy.text(sql.LIST_JOB_ERRORS_SQL),
+        {"job_id": job_id, "limit": limit},
+    ).fetchall()
+    return [JobErrorSchema(**row._mapping) for row in rows]
+
+
+def get_model_map(
+    models: Optional[Iterable[Type[SQLModel]]] = None,
+) -> Dict[str, Type[SQLModel]]:
+    """
+    Map table names to models, defaults to all TimescaleModel tables
+    """
+    if models is None:
+        models = [
+            model
+            for model in TimescaleModel.__subclasses__()
+            if getattr(model, "__table__", None) is not None
+        ]
+    return {model.__tablename__: model for model in models}
@@ -0,0 +1,81 @@
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Union
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timescaledb.compression.chunks import get_engine
+from timescaledb.jobs import sql
+from timescaledb.jobs.list import get_job
+from timescaledb.jobs.schemas import JobSchema
+from timescaledb.routing import on_primary
+
+
+def run_job(session_or_engine: Union[Session, Engine], job_id: int) -> None:
+    """
+    Run a background job now, in the foreground
+
+    Policies commit as they go, so run_job cannot run inside a transaction
+    block. It runs on its own autocommit connection from the engine and
+    raises the job's error if it fails.
+
+    Args:
+        session_or_engine: SQLModel session (its bind is used) or SQLAlchemy engine
+        job_id: The job to run
+    """
+    engine = get_engine(session_or_engine)
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.execute(sqlalchemy.text(sql.RUN_JOB_SQL), {"job_id": job_id})
+
+
+@on_primary
+def alter_job(
+    session: Session,
+    job_id: int,
+    schedule_interval: Optional[Union[str, timedelta]] = None,
+    max_runtime: Optional[Union[str, timedelta]] = None,
+    max_retries: Optional[int] = None,
+    retry_period: Optional[Union[str, timedelta]] = None,
+    scheduled: Optional[bool] = None,
+    config: Optional[Dict[str, Any]] = None,
+    next_start: Optional[datetime] = None,
+    commit: bool = True,
+) -> Optional[JobSchema]:
+    """
+    Change the schedule or settings of a background job
+
+    Only the given settings are changed. Setting scheduled=False pauses the job.
+
+    Args:
+        session: SQLAlchemy session
+        job_id: The job to alter
+        schedule_interval: How often the job runs, e.g., '1 hour'
+        max_runtime: How long a run may take before it is stopped
+        max_retries: How often a failed run is retried (-1 for forever)
+        retry_period: How long to wait before retrying a failed run
+        scheduled: Whether the job is scheduled at all
+        config: Replaces the job's configuration (e.g., the drop_after of a
+            retention policy)
+        next_start: When the job runs next
+        commit: Whether to commit the transaction
+
+    Returns:
+        The altered JobSchema
+    """
+    query, params = sql.format_alter_job_sql(
+        job_id,
+        schedule_interval=schedule_interval,
+        max_runtime=max_runtime,
+        max_retries=max_retries,
+        retry_period=retry_period,
+        scheduled=scheduled,
+        config=json.dumps(config) if config is not None else None,
+        next_start=next_start,
+    )
+    session.execute(sqlalchemy.text(query), params)
+    if commit:
+        session.commit()
+    return get_job(session, job_id)
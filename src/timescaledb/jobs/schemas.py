@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+from sqlmodel import SQLModel
+
+
+class JobSchema(BaseModel):
+    """A TimescaleDB background job with its run stats"""
+
+    job_id: int
+    application_name: Optional[str] = None
+    proc_schema: Optional[str] = None
+    proc_name: Optional[str] = None
+    hypertable_schema: Optional[str] = None
+    hypertable_name: Optional[str] = None
+    continuous_aggregate_name: Optional[str] = None
+    schedule_interval: Optional[timedelta] = None
+    max_runtime: Optional[timedelta] = None
+    max_retries: Optional[int] = None
+    retry_period: Optional[timedelta] = None
+    scheduled: Optional[bool] = None
+    config: Optional[Dict[str, Any]] = None
+    job_status: Optional[str] = None
+    last_run_status: Optional[str] = None
+    last_run_started_at: Optional[datetime] = None
+    last_successful_finish: Optional[datetime] = None
+    last_run_duration: Optional[timedelta] = None
+    next_start: Optional[datetime] = None
+    total_runs: Optional[int] = None
+    total_successes: Optional[int] = None
+    total_failures: Optional[int] = None
+
+    # The TimescaleModel whose table (or continuous aggregate) the job runs on
+    model: Optional[Type[SQLModel]] = None
+
+    @property
+    def target_name(self) -> Optional[str]:
+        """The table or continuous aggregate the job runs on"""
+        return self.continuous_aggregate_name or self.hypertable_name
+
+    @property
+    def failed(self) -> bool:
+        """Whether the last run failed"""
+        return self.last_run_status == "Failed"
+
+
+class JobErrorSchema(BaseModel):
+    """A failed run of a background job"""
+
+    job_id: int
+    proc_schema: Optional[str] = None
+    proc_name: Optional[str] = None
+    pid: Optional[int] = None
+    start_time: Optional[datetime] = None
+    finish_time: Optional[datetime] = None
+    sqlerrcode: Optional[str] = None
+    err_message: Optional[str] = None
+
+
+class JobsHealthSummary(BaseModel):
+    """Health of the background jobs, cheap enough to poll from a metrics endpoint"""
+
+    checked_at: datetime
+    total_jobs: int = 0
+    scheduled_jobs: int = 0
+    failing_job_ids: List[int] = []
+    overdue_job_ids: List[int] = []
+    never_succeeded_job_ids: List[int] = []
+    total_failures: int = 0
+    # Oldest last successful finish among scheduled jobs that have succeeded
+    oldest_success: Optional[datetime] = None
+
+    @property
+    def healthy(self) -> bool:
+        return not self.failing_job_ids and not self.overdue_job_ids
@@ -0,0 +1,109 @@
+# Background jobs of the policies managed by this library
+POLICY_PROC_NAMES = (
+    "policy_compression",
+    "policy_retention",
+    "policy_reorder",
+    "policy_refresh_continuous_aggregate",
+)
+
+# Jobs with their stats, optionally filtered by job, hypertable or procedure
+# (NULL = no filter). job_stats has no row until a job has been scheduled and
+# uses -infinity for runs that did not happen yet. Continuous aggregate jobs
+# run on the materialization hypertable, the view name is looked up.
+LIST_JOBS_SQL = """
+SELECT j.job_id,
+       j.application_name,
+       j.proc_schema,
+       j.proc_name,
+       j.hypertable_schema,
+       j.hypertable_name,
+       ca.view_name AS continuous_aggregate_name,
+       j.schedule_interval,
+       j.max_runtime,
+       j.max_retries,
+       j.retry_period,
+       j.scheduled,
+       j.config,
+       js.job_status,
+       js.last_run_status,
+       CASE WHEN isfinite(js.last_run_started_at)
+            THEN js.last_run_started_at END AS last_run_started_at,
+       CASE WHEN isfinite(js.last_successful_finish)
+            THEN js.last_successful_finish END AS last_successful_finish,
+       js.last_run_duration,
+       CASE WHEN isfinite(COALESCE(js.next_start, j.next_start))
+            THEN COALESCE(js.next_start, j.next_start) END AS next_start,
+       js.total_runs,
+       js.total_successes,
+       js.total_failures
+  FROM timescaledb_information.jobs j
+  LEFT JOIN timescaledb_information.job_stats js
+    ON j.job_id = js.job_id
+  LEFT JOIN timescaledb_information.continuous_aggregates ca
+    ON ca.materialization_hypertable_schema = j.hypertable_schema
+   AND ca.materialization_hypertable_name = j.hypertable_name
+  WHERE (CAST(:job_id AS INTEGER) IS NULL OR j.job_id = :job_id)
+    AND (CAST(:hypertable_name AS TEXT) IS NULL
+         OR j.hypertable_name = :hypertable_name
+         OR ca.view_name = :hypertable_name)
+    AND (CAST(:proc_names AS TEXT[]) IS NULL
+         OR j.proc_name = ANY(CAST(:proc_names AS TEXT[])))
+  ORDER BY j.job_id;
+"""
+
+LIST_JOB_ERRORS_SQL = """
+SELECT job_id,
+       proc_schema,
+       proc_name,
+       pid,
+       start_time,
+       finish_time,
+       sqlerrcode,
+       err_message
+  FROM timescaledb_information.job_errors
+  WHERE (CAST(:job_id AS INTEGER) IS NULL OR job_id = :job_id)
+  ORDER BY finish_time DESC NULLS LAST
+  LIMIT :limit;
+"""
+
+RUN_JOB_SQL = """
+CALL run_job(:job_id);
+"""
+
+ALTER_JOB_ARGUMENT_TYPES = {
+    "schedule_interval": "INTERVAL",
+    "max_runtime": "INTERVAL",
+    "max_retries": "INTEGER",
+    "retry_period": "INTERVAL",
+    "scheduled": "BOOLEAN",
+    "config": "JSONB",
+    "next_start": "TIMESTAMPTZ",
+}
+
+ALTER_JOB_SQL = """
+SELECT alter_job(CAST(:job_id AS INTEGER){arguments});
+"""
+
+
+def format_alter_job_sql(job_id: int, **kwargs) -> tuple:
+    """
+    Format the alter_job query with only the given named arguments
+
+    Returns:
+        A tuple of the SQL query and its bind parameters
+    """
+    clauses = []
+    params = {"job_id": job_id}
+    for name, sql_type in ALTER_JOB_ARGUMENT_TYPES.items():
+        value = kwargs.get(name)
+        if value is None:
+            continue
+        clauses.append(f"{name} => CAST(:{name} AS {sql_type})")
+        params[name] = value
+    if len(params) == 1:
+        raise ValueError(
+            "At least one of "
+            f"{', '.join(ALTER_JOB_ARGUMENT_TYPES)} is required to alter a job"
+        )
+    arguments = "".join(f", {clause}" for clause in clauses)
+    return ALTER_JOB_SQL.format(arguments=arguments), params
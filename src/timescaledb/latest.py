@@ -0,0 +1,170 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Type, Union
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+from timescaledb.compression.chunks import get_engine
+from timescaledb.queries import latest_per_series
+from timescaledb.utils import get_utc_now
+
+
+class LatestValueCache:
+    """
+    In-process cache of latest_per_series, keyed by series
+
+    The first refresh loads the latest row of every series. Later refreshes
+    only ask for rows at or after the newest time seen so far minus `grace`,
+    which touches the newest chunk(s) only, and update the series that
+    changed. Series without a row in the lookback window are dropped.
+
+    The grace window picks up rows that arrive late, of any series, as long
+    as their time is at most `grace` older than the newest row seen before
+    them. Rows older than that (backfilled data) are not picked up by
+    incremental refreshes; call reload() when that matters.
+
+    Args:
+        session_or_engine: SQLModel session (its bind is used) or SQLAlchemy engine
+        model: The SQLModel class to query
+        series_field: Field name(s) identifying a series, several fields make
+            tuple keys
+        value_fields: Field name(s) to cache with each series, defaults to all
+            other columns
+        lookback: Only cache series with a row newer than now - lookback
+        time_field: The timestamp field
+        refresh_seconds: How long the cached values are served before get()
+            refreshes them
+        grace: How far before the newest time seen refreshes look for late rows
+        filters: List of filter conditions to apply to the query
+    """
+
+    def __init__(
+        self,
+        session_or_engine: Union[Session, Engine],
+        model: Type[SQLModel],
+        series_field: Union[str, List] = "device_id",
+        value_fields: Union[str, List, None] = None,
+        lookback: Optional[timedelta] = timedelta(days=1),
+        time_field: str = "time",
+        refresh_seconds: float = 5.0,
+        filters: List = None,
+        grace: timedelta = timedelta(minutes=5),
+    ):
+        if refresh_seconds < 0:
+            raise ValueError("refresh_seconds must not be negative")
+        if grace < timedelta(0):
+            raise ValueError("grace must not be negative")
+        self.engine = get_engine(session_or_engine)
+        self.model = model
+        self.series_fields = (
+            list(series_field)
+            if isinstance(series_field, (list, tuple))
+            else [series_field]
+        )
+        self.value_fields = value_fields
+        self.lookback = lookback
+        self.time_field = self._field_name(time_field)
+        self.refresh_seconds = refresh_seconds
+        self.filters = filters
+        self.grace = grace
+        self._lock = threading.Lock()
+        self._values: Dict[Any, Dict] = {}
+        self._watermark: Optional[datetime] = None
+        self._refreshed_at_monotonic: Optional[float] = None
+
+    def get(self, force: bool = False) -> Dict[Any, Dict]:
+        """
+        Latest row per series, refreshed once the cached values are older than
+        refresh_seconds
+
+        Args:
+            force: Refresh even if the cached values are still fresh
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                force
+                or self._refreshed_at_monotonic is None
+                or now - self._refreshed_at_monotonic >= self.refresh_seconds
+            ):
+                self._refresh(now)
+            return dict(self._values)
+
+    def get_series(self, key: Any, force: bool = False) -> Optional[Dict]:
+        """
+        Latest row of one series, None if it has no row in the lookback window
+        """
+        return self.get(force=force).get(key)
+
+    def refresh(self) -> int:
+        """
+        Fetch the rows written since the last refresh, including late rows
+        within the grace window
+
+        Returns:
+            Number of series that were added or updated
+        """
+        with self._lock:
+            return self._refresh(time.monotonic())
+
+    def reload(self) -> None:
+        """
+        Discard the cached values and load the latest row of every series again
+        """
+        with self._lock:
+            self._values = {}
+            self._watermark = None
+            self._refresh(time.monotonic())
+
+    def _refresh(self, now: float) -> int:
+        with Session(self.engine) as session:
+            rows = latest_per_series(
+                session,
+                self.model,
+                series_field=self.series_fields,
+                value_fields=self.value_fields,
+                lookback=self.lookback,
+                time_field=self.time_field,
+                since=(
+                    self._watermark - self.grace
+                    if self._watermark is not None
+                    else None
+                ),
+                filters=self.filters,
+            )
+        updated = 0
+        for row in rows:
+            key = self._key(row)
+            cached = self._values.get(key)
+            # Rows in the grace window are fetched again by the next refresh,
+            # an older row never replaces a newer cached one
+            if cached is None or row[self.time_field] >= cached[self.time_field]:
+                if dict(row) != cached:
+                    updated += 1
+                self._values[key] = dict(row)
+            if self._watermark is None or row[self.time_field] > self._watermark:
+                self._watermark = row[self.time_field]
+        self._expire()
+        self._refreshed_at_monotonic = now
+        return updated
+
+    def _expire(self) -> None:
+        if self.lookback is None:
+            return
+        cutoff = get_utc_now() - self.lookback
+        self._values = {
+            key: row
+            for key, row in self._values.items()
+            if row[self.time_field] >= cutoff
+        }
+
+    def _key(self, row: Dict) -> Any:
+        if len(self.series_fields) == 1:
+            return row[self._field_name(self.series_fields[0])]
+        return tuple(row[self._field_name(field)] for field in self.series_fields)
+
+    @staticmethod
+    def _field_name(field: Any) -> str:
+        return getattr(field, "key", field)
@@ -0,0 +1,12 @@
+from .collector import MetricsCollector, collect_hypertable_metrics
+from .prometheus import CONTENT_TYPE, render_prometheus
+from .schemas import HypertableMetrics, MetricsSnapshot
+
+__all__ = [
+    "MetricsCollector",
+    "collect_hypertable_metrics",
+    "render_prometheus",
+    "CONTENT_TYPE",
+    "HypertableMetrics",
+    "MetricsSnapshot",
+]
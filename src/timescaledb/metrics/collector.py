@@ -0,0 +1,136 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+from timescaledb.compression.chunks import get_engine
+from timescaledb.instrumentation import instrumented
+from timescaledb.metrics import sql
+from timescaledb.metrics.prometheus import render_prometheus
+from timescaledb.metrics.schemas import HypertableMetrics, MetricsSnapshot
+from timescaledb.routing import read_only
+
+
+@instrumented()
+@read_only
+def collect_hypertable_metrics(
+    session: Session,
+    models: Optional[Iterable[Type[SQLModel]]] = None,
+    table_names: Optional[Iterable[str]] = None,
+) -> List[HypertableMetrics]:
+    """
+    Collect size, chunk, compression and job metrics of hypertables in a single
+    statement
+
+    Args:
+        session: SQLAlchemy session
+        models: Only collect these models' hypertables
+        table_names: Only collect these hypertables (alternative to models)
+
+    Returns:
+        List[HypertableMetrics]: One entry per hypertable
+    """
+    names = None
+    if models is not None or table_names is not None:
+        names = [model.__tablename__ for model in models or []]
+        names.extend(table_names or [])
+    rows = session.execute(
+        sqlalchemy.text(sql.HYPERTABLE_METRICS_SQL), {"hypertable_names": names}
+    ).fetchall()
+    return [HypertableMetrics(**row._mapping) for row in rows]
+
+
+class MetricsCollector:
+    """
+    Collects hypertable metrics at most once per `cache_seconds` and renders
+    them for Prometheus
+
+    Scrapes within the cache interval are served from the previous collection,
+    so several scrapers (or a scraper and a dashboard) do not multiply the load
+    on the catalog. The ingest rate is the change of the estimated row count
+    between two collections, it is only available from the second one on.
+
+    Args:
+        session_or_engine: SQLModel session (its bind is used) or SQLAlchemy engine
+        cache_seconds: How long a collection is reused
+        models: Only collect these models' hypertables
+        table_names: Only collect these hypertables (alternative to models)
+    """
+
+    def __init__(
+        self,
+        session_or_engine: Union[Session, Engine],
+        cache_seconds: float = 30.0,
+        models: Optional[Iterable[Type[SQLModel]]] = None,
+        table_names: Optional[Iterable[str]] = None,
+    ):
+        if cache_seconds < 0:
+            raise ValueError("cache_seconds must not be negative")
+        self.engine = get_engine(session_or_engine)
+        self.cache_seconds = cache_seconds
+        self.models = list(models) if models is not None else None
+        self.table_names = list(table_names) if table_names is not None else None
+        self._lock = threading.Lock()
+        self._snapshot: Optional[MetricsSnapshot] = None
+        self._collected_at_monotonic: Optional[float] = None
+        self._previous_rows: Dict[Tuple[str, str], Tuple[float, int]] = {}
+
+    def collect(self, force: bool = False) -> MetricsSnapshot:
+        """
+        Return the cached snapshot, collecting a new one once it expired
+
+        Args:
+            force: Collect even if the cached snapshot is still fresh
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._snapshot is not None
+                and now - self._collected_at_monotonic < self.cache_seconds
+            ):
+                return self._snapshot
+
+            started = time.perf_counter()
+            with Session(self.engine) as session:
+                hypertables = collect_hypertable_metrics(
+                    session, models=self.models, table_names=self.table_names
+                )
+            collect_seconds = time.perf_counter() - started
+            self._set_ingest_rates(hypertables, now)
+
+            self._snapshot = MetricsSnapshot(
+                collected_at=datetime.now(timezone.utc),
+                collect_seconds=collect_seconds,
+                hypertables=hypertables,
+            )
+            self._collected_at_monotonic = now
+            return self._snapshot
+
+    def render(self, force: bool = False) -> str:
+        """
+        Render the (cached) metrics in the Prometheus text exposition format
+        """
+        return render_prometheus(self.collect(force=force))
+
+    def _set_ingest_rates(self, hypertables: List[HypertableMetrics], now: float):
+        previous_rows = self._previous_rows
+        self._previous_rows = {}
+        for metrics in hypertables:
+            if metrics.approximate_row_count is None:
+                continue
+            key = (metrics.hypertable_schema, metrics.hypertable_name)
+            self._previous_rows[key] = (now, metrics.approximate_row_count)
+            if key not in previous_rows:
+                continue
+            previous_time, previous_count = previous_rows[key]
+            if now > previous_time:
+                metrics.ingest_rows_per_second = max(
+                    (metrics.approximate_row_count - previous_count)
+                    / (now - previous_time),
+                    0.0,
+                )
@@ -0,0 +1,129 @@
+from typing import Callable, List, Optional, Tuple
+
+from timescaledb.metrics.schemas import HypertableMetrics, MetricsSnapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (name, help, value getter) of the per hypertable gauges
+HYPERTABLE_GAUGES: List[
+    Tuple[str, str, Callable[[HypertableMetrics], Optional[float]]]
+] = [
+    (
+        "timescaledb_hypertable_total_bytes",
+        "Total disk space used by the hypertable, indexes and TOAST included.",
+        lambda m: m.total_bytes,
+    ),
+    (
+        "timescaledb_hypertable_table_bytes",
+        "Disk space used by the hypertable's chunk tables.",
+        lambda m: m.table_bytes,
+    ),
+    (
+        "timescaledb_hypertable_index_bytes",
+        "Disk space used by the hypertable's indexes.",
+        lambda m: m.index_bytes,
+    ),
+    (
+        "timescaledb_hypertable_toast_bytes",
+        "Disk space used by the hypertable's TOAST tables.",
+        lambda m: m.toast_bytes,
+    ),
+    (
+        "timescaledb_hypertable_chunks",
+        "Number of chunks of the hypertable.",
+        lambda m: m.num_chunks,
+    ),
+    (
+        "timescaledb_hypertable_compressed_chunks",
+        "Number of compressed chunks of the hypertable.",
+        lambda m: m.compressed_chunks,
+    ),
+    (
+        "timescaledb_hypertable_compression_ratio",
+        "Size of the compressed chunks before compression divided by their size after.",
+        lambda m: m.compression_ratio,
+    ),
+    (
+        "timescaledb_hypertable_approximate_rows",
+        "Estimated number of rows of the hypertable, from planner statistics.",
+        lambda m: m.approximate_row_count,
+    ),
+    (
+        "timescaledb_hypertable_ingest_rows_per_second",
+        "Change of the estimated row count per second since the previous collection.",
+        lambda m: m.ingest_rows_per_second,
+    ),
+    (
+        "timescaledb_hypertable_jobs",
+        "Number of background jobs (policies) working on the hypertable.",
+        lambda m: m.jobs,
+    ),
+    (
+        "timescaledb_hypertable_failing_jobs",
+        "Number of the hypertable's jobs whose last run failed.",
+        lambda m: m.failing_jobs,
+    ),
+    (
+        "timescaledb_hypertable_job_lag_seconds",
+        "Seconds since the least recently successful job of the hypertable succeeded.",
+        lambda m: m.seconds_since_last_success,
+    ),
+    (
+        "timescaledb_hypertable_job_overdue_seconds",
+        "Seconds the most overdue scheduled job of the hypertable is late.",
+        lambda m: m.overdue_seconds,
+    ),
+]
+
+
+def render_prometheus(snapshot: MetricsSnapshot) -> str:
+    """
+    Render a metrics snapshot in the Prometheus text exposition format
+
+    Gauges without a value (e.g., the compression ratio of an uncompressed
+    hypertable) are left out rather than reported as 0.
+    """
+    lines = []
+    for name, help_text, getter in HYPERTABLE_GAUGES:
+        samples = []
+        for metrics in snapshot.hypertables:
+            value = getter(metrics)
+            if value is None:
+                continue
+            labels = format_labels(
+                schema=metrics.hypertable_schema, hypertable=metrics.hypertable_name
+            )
+            samples.append(f"{name}{labels} {format_value(value)}")
+        if samples:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(samples)
+    lines.append(
+        "# HELP timescaledb_metrics_collect_seconds "
+        "Time spent collecting the hypertable metrics."
+    )
+    lines.append("# TYPE timescaledb_metrics_collect_seconds gauge")
+    lines.append(
+        f"timescaledb_metrics_collect_seconds {format_value(snapshot.collect_seconds)}"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def format_labels(**labels: str) -> str:
+    return (
+        "{"
+        + ",".join(
+            f'{key}="{escape_label_value(value)}"' for key, value in labels.items()
+        )
+        + "}"
+    )
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
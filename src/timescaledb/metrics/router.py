@@ -0,0 +1,40 @@
+from typing import Optional
+
+try:
+    from fastapi import APIRouter
+    from fastapi.responses import PlainTextResponse
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The metrics router requires FastAPI, install it with "
+        "pip install 'timescaledb[fastapi]'"
+    ) from e
+
+from timescaledb.metrics.collector import MetricsCollector
+from timescaledb.metrics.prometheus import CONTENT_TYPE
+
+
+def create_metrics_router(
+    collector: MetricsCollector,
+    path: str = "/metrics",
+    router: Optional[APIRouter] = None,
+) -> APIRouter:
+    """
+    FastAPI router serving the collector's metrics for Prometheus to scrape
+
+        app.include_router(create_metrics_router(MetricsCollector(engine)))
+
+    The endpoint is a plain (non-async) route, FastAPI runs it in its thread
+    pool so collecting does not block the event loop.
+
+    Args:
+        collector: MetricsCollector to render
+        path: Path of the scrape endpoint
+        router: Existing router to add the endpoint to
+    """
+    router = router or APIRouter()
+
+    @router.get(path, response_class=PlainTextResponse, include_in_schema=False)
+    def metrics() -> PlainTextResponse:
+        return PlainTextResponse(collector.render(), media_type=CONTENT_TYPE)
+
+    return router
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class HypertableMetrics(BaseModel):
+    """Operational metrics of a hypertable, collected in one statement."""
+
+    hypertable_schema: str
+    hypertable_name: str
+    num_chunks: int
+    compression_enabled: bool = False
+    table_bytes: Optional[int] = None
+    index_bytes: Optional[int] = None
+    toast_bytes: Optional[int] = None
+    total_bytes: Optional[int] = None
+    compressed_chunks: int = 0
+    before_compression_total_bytes: Optional[int] = None
+    after_compression_total_bytes: Optional[int] = None
+    approximate_row_count: Optional[int] = None
+    ingest_rows_per_second: Optional[float] = None
+    jobs: int = 0
+    failing_jobs: int = 0
+    seconds_since_last_success: Optional[float] = None
+    overdue_seconds: Optional[float] = None
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """Size before compression divided by size after, for compressed chunks"""
+        if not self.before_compression_total_bytes:
+            return None
+        if not self.after_compression_total_bytes:
+            return None
+        return self.before_compression_total_bytes / self.after_compression_total_bytes
+
+
+class MetricsSnapshot(BaseModel):
+    """Metrics of all collected hypertables at one point in time."""
+
+    collected_at: datetime
+    collect_seconds: float
+    hypertables: List[HypertableMetrics] = Field(default_factory=list)
@@ -0,0 +1,61 @@
+# One statement for every hypertable: sizes, chunk counts, compression,
+# estimated rows and the state of the policy jobs working on it.
+HYPERTABLE_METRICS_SQL = """
+SELECT h.hypertable_schema,
+       h.hypertable_name,
+       h.num_chunks,
+       h.compression_enabled,
+       size.table_bytes,
+       size.index_bytes,
+       size.toast_bytes,
+       size.total_bytes,
+       chunks.compressed_chunks,
+       compression.before_compression_total_bytes,
+       compression.after_compression_total_bytes,
+       approximate_row_count(
+           format('%I.%I', h.hypertable_schema, h.hypertable_name)::regclass
+       ) AS approximate_row_count,
+       COALESCE(jobs.jobs, 0) AS jobs,
+       COALESCE(jobs.failing_jobs, 0) AS failing_jobs,
+       jobs.seconds_since_last_success,
+       jobs.overdue_seconds
+  FROM timescaledb_information.hypertables h
+  CROSS JOIN LATERAL hypertable_detailed_size(
+      format('%I.%I', h.hypertable_schema, h.hypertable_name)::regclass
+  ) size
+  LEFT JOIN LATERAL (
+      SELECT count(*) FILTER (WHERE c.is_compressed) AS compressed_chunks
+        FROM timescaledb_information.chunks c
+       WHERE c.hypertable_schema = h.hypertable_schema
+         AND c.hypertable_name = h.hypertable_name
+  ) chunks ON true
+  LEFT JOIN LATERAL (
+      SELECT sum(s.before_compression_total_bytes) AS before_compression_total_bytes,
+             sum(s.after_compression_total_bytes) AS after_compression_total_bytes
+        FROM hypertable_compression_stats(
+            format('%I.%I', h.hypertable_schema, h.hypertable_name)::regclass
+        ) s
+       WHERE h.compression_enabled
+  ) compression ON true
+  LEFT JOIN LATERAL (
+      SELECT count(*) AS jobs,
+             count(*) FILTER (WHERE js.last_run_status = 'Failed') AS failing_jobs,
+             max(
+                 extract(epoch FROM now() - CASE
+                     WHEN isfinite(js.last_successful_finish)
+                     THEN js.last_successful_finish END)
+             ) AS seconds_since_last_success,
+             max(
+                 greatest(extract(epoch FROM now() - CASE
+                     WHEN j.scheduled AND isfinite(js.next_start)
+                     THEN js.next_start END), 0)
+             ) AS overdue_seconds
+        FROM timescaledb_information.jobs j
+        LEFT JOIN timescaledb_information.job_stats js ON js.job_id = j.job_id
+       WHERE j.hypertable_schema = h.hypertable_schema
+         AND j.hypertable_name = h.hypertable_name
+  ) jobs ON true
+ WHERE CAST(:hypertable_names AS TEXT[]) IS NULL
+    OR h.hypertable_name = ANY(CAST(:hypertable_names AS TEXT[]))
+ ORDER BY h.hypertable_schema, h.hypertable_name;
+"""
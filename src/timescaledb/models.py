@@ -29,7 +29,13 @@ class TimescaleModel(SQLModel):
     # Required TimescaleDB configuration class variables
     __time_column__: ClassVar[str] = TIME_COLUMN
     __chunk_time_interval__: ClassVar[str] = CHUNK_TIME_INTERVAL
+    # Extra hash dimension(s) as (column, number_partitions), e.g. ("device_id", 4)
+    __partition_by__: ClassVar[Optional[tuple]] = None
     __drop_after__: ClassVar[str] = DROP_AFTER
     __enable_compression__: ClassVar[bool] = False
     __compress_orderby__: ClassVar[Optional[str]] = None
     __compress_segmentby__: ClassVar[Optional[str]] = None
+    # Indexes built with timescaledb.indexes (composite_index, brin_index, ...)
+    __time_series_indexes__: ClassVar[Optional[list]] = None
+    # Index (name, or the column(s) of an index) to physically order chunks by
+    __reorder_index__: ClassVar[Optional[str]] = None
@@ -0,0 +1,12 @@
+from .cursor import decode_cursor, encode_cursor
+from .paginate import paginate
+from .schemas import Cursor, Page, PageParams
+
+__all__ = [
+    "paginate",
+    "encode_cursor",
+    "decode_cursor",
+    "Cursor",
+    "Page",
+    "PageParams",
+]
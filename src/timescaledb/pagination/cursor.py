@@ -0,0 +1,81 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from timescaledb.exceptions import InvalidCursor
+from timescaledb.pagination.schemas import Cursor
+
+DIRECTIONS = {"next": "n", "previous": "p"}
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """
+    Encode a cursor as an opaque, URL safe string
+    """
+    payload = [
+        DIRECTIONS[cursor.direction],
+        _encode_value(cursor.time),
+        _encode_value(cursor.key),
+    ]
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode_cursor(value: str, time_type: type = None, key_type: type = None) -> Cursor:
+    """
+    Decode a cursor created with encode_cursor
+
+    Args:
+        value: The encoded cursor
+        time_type: Python type of the time column, used to restore the value
+        key_type: Python type of the tie-breaker column
+
+    Raises:
+        InvalidCursor: When the cursor was not created by encode_cursor
+    """
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        direction, time, key = json.loads(base64.urlsafe_b64decode(padded))
+        direction = {code: name for name, code in DIRECTIONS.items()}[direction]
+        return Cursor(
+            time=_decode_value(time, time_type),
+            key=_decode_value(key, key_type),
+            direction=direction,
+        )
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        ArithmeticError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as e:
+        raise InvalidCursor(f"Invalid pagination cursor {value!r}") from e
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any, python_type: type = None) -> Any:
+    if value is None or python_type is None:
+        return value
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise ValueError("Expected a timestamp")
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type in (uuid.UUID, Decimal):
+        return python_type(value)
+    if python_type is int and not isinstance(value, int):
+        raise ValueError("Expected an integer")
+    return value
@@ -0,0 +1,63 @@
+from typing import Callable, Optional, Type
+
+try:
+    from fastapi import HTTPException, Query
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The pagination dependency requires FastAPI, install it with "
+        "pip install 'timescaledb[fastapi]'"
+    ) from e
+
+from sqlmodel import SQLModel
+
+from timescaledb.exceptions import InvalidCursor
+from timescaledb.pagination.cursor import decode_cursor
+from timescaledb.pagination.paginate import decode_page_cursor
+from timescaledb.pagination.schemas import PageParams
+
+
+def pagination_params(
+    model: Type[SQLModel] = None,
+    default_limit: int = 100,
+    max_limit: int = 1000,
+    tie_breaker: Optional[str] = None,
+) -> Callable[..., PageParams]:
+    """
+    FastAPI dependency reading ?cursor=...&limit=... into PageParams
+
+        @app.get("/metrics/", response_model=Page)
+        def list_metrics(
+            page: PageParams = Depends(pagination_params(Metric)),
+            session: Session = Depends(get_session),
+        ):
+            return paginate(session, Metric, cursor=page.cursor, limit=page.limit)
+
+    Malformed cursors are rejected with a 400 response before the endpoint
+    runs. With the model, cursors are decoded exactly the way paginate will,
+    so cursor values that do not fit its time or tie-breaker column are
+    rejected too.
+
+    Args:
+        model: The SQLModel class the endpoint pages through
+        default_limit: Page size when the client does not ask for one
+        max_limit: Largest page size a client may ask for
+        tie_breaker: The tie_breaker passed to paginate, if any
+    """
+
+    def dependency(
+        cursor: Optional[str] = Query(
+            default=None, description="next_cursor or previous_cursor of a page"
+        ),
+        limit: int = Query(default=default_limit, ge=1, le=max_limit),
+    ) -> PageParams:
+        if cursor is not None:
+            try:
+                if model is not None:
+                    decode_page_cursor(model, cursor, tie_breaker=tie_breaker)
+                else:
+                    decode_cursor(cursor)
+            except InvalidCursor as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        return PageParams(cursor=cursor, limit=limit)
+
+    return dependency
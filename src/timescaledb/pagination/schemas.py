@@ -0,0 +1,27 @@
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Cursor(BaseModel):
+    """Position of a page boundary: the time and tie-breaker of a row."""
+
+    time: Any
+    key: Any
+    direction: Literal["next", "previous"] = "next"
+
+
+class PageParams(BaseModel):
+    """Cursor and page size requested by a client."""
+
+    cursor: Optional[str] = None
+    limit: int = Field(default=100, ge=1)
+
+
+class Page(BaseModel):
+    """One page of rows with the cursors of the neighbouring pages."""
+
+    items: List[Any] = Field(default_factory=list)
+    limit: int
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
@@ -1,12 +1,89 @@
-from typing import Any, Dict, List
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Union
 
-from sqlalchemy import Float, Numeric, text
+from sqlalchemy import ColumnElement, Float, Interval, Numeric, literal_column, text
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlmodel import Session, func, select
 
-from timescaledb.hyperfunctions import time_bucket, time_bucket_gapfill
+from timescaledb import explain
+from timescaledb.hyperfunctions import (
+    average,
+    counter_agg,
+    delta,
+    extrapolated_rate,
+    first,
+    last,
+    rate,
+    time_bucket,
+    time_bucket_gapfill,
+    time_weight,
+)
+from timescaledb.instrumentation import instrumented, mark_phase, set_row_count
+from timescaledb.routing import read_only
+from timescaledb.utils import get_utc_now, localize_datetime
 
 
+def _get_model_field(model: Any, field: Any) -> InstrumentedAttribute:
+    """
+    Resolve a field name (or an instrumented attribute) to the model column.
+    """
+    if isinstance(field, InstrumentedAttribute):
+        field = field.key
+    try:
+        return getattr(model, field)
+    except AttributeError as e:
+        raise ValueError(
+            f"Column {str(e).split()[-1]} not found in model {model.__name__}"
+        )
+
+
+def _get_group_by_fields(
+    model: Any, group_by: Union[str, List, None]
+) -> List[InstrumentedAttribute]:
+    """
+    Resolve a field name or a list of field names to model columns.
+    """
+    if group_by is None:
+        return []
+    if not isinstance(group_by, (list, tuple)):
+        group_by = [group_by]
+    return [_get_model_field(model, field) for field in group_by]
+
+
+def _fetch_mappings(
+    session: Session, query: Any, model: Any, operation: str
+) -> List[Dict]:
+    """
+    Execute a built query and fetch its rows as mappings, reporting the
+    build/compile/execute/fetch phases to the instrumentation listeners and
+    explaining the call when auto explain asks for it.
+    """
+    mark_phase("build")
+    started = time.perf_counter()
+    result = session.exec(query)
+    mark_phase("execute")
+    rows = list(result.mappings().all())
+    mark_phase("fetch")
+    set_row_count(len(rows))
+    if explain.auto_explain_enabled():
+        duration = time.perf_counter() - started
+        if explain.should_explain(duration):
+            explain.report_explained(session, query, model, operation, duration)
+    return rows
+
+
+def _interval_literal(interval: Union[str, int]) -> ColumnElement:
+    """
+    Render an interval the same way time_bucket does, as an INTERVAL literal.
+    """
+    if isinstance(interval, int):
+        interval = f"{interval} seconds"
+    return literal_column(f"'{interval}'::interval", type_=Interval)
+
+
+@instrumented()
+@read_only
 def time_bucket_query(
     session: Session,
     model: Any,
@@ -17,6 +94,7 @@ def time_bucket_query(
     round_to_nearest: bool = True,
     annotations: Dict = None,
     filters: List = None,
+    timezone: Optional[str] = None,
 ) -> List[Dict]:
     """
     SQLModel implementation of TimescaleDB time_bucket function.
@@ -31,21 +109,13 @@ def time_bucket_query(
         round_to_nearest: Whether to round the average
         annotations: Additional annotations to add to the query
         filters: List of filter conditions to apply to the query
+        timezone: Optional timezone (e.g., 'Europe/Berlin') so buckets follow
+            local day boundaries
     """
-    if isinstance(time_field, InstrumentedAttribute):
-        time_field = time_field.key
-    if isinstance(metric_field, InstrumentedAttribute):
-        metric_field = metric_field.key
+    model_timescale_field_value = _get_model_field(model, time_field)
+    metric_field_value = _get_model_field(model, metric_field)
 
-    try:
-        model_timescale_field_value = getattr(model, time_field)
-        metric_field_value = getattr(model, metric_field)
-    except AttributeError as e:
-        raise ValueError(
-            f"Column {str(e).split()[-1]} not found in model {model.__name__}"
-        )
-
-    bucket = time_bucket(interval, model_timescale_field_value)
+    bucket = time_bucket(interval, model_timescale_field_value, timezone=timezone)
     avg_func = func.avg(metric_field_value)
     if round_to_nearest:
         avg_func = func.cast(
@@ -66,11 +136,11 @@ def time_bucket_query(
         for filter_condition in filters:
             query = query.where(filter_condition)
 
-    result = session.exec(query)
-    result = result.mappings().all()
-    return list(result)
+    return _fetch_mappings(session, query, model, "time_bucket_query")
 
 
+@instrumented()
+@read_only
 def time_bucket_gapfill_query(
     session: Session,
     model: Any,
@@ -84,6 +154,7 @@ def time_bucket_gapfill_query(
     bucket_label: str = "bucket",
     value_label: str = "avg",
     filters: List = None,
+    timezone: Optional[str] = None,
 ) -> List[Dict]:
     """
     SQLModel implementation of TimescaleDB time_bucket_gapfill function.
@@ -101,33 +172,25 @@ def time_bucket_gapfill_query(
         bucket_label: Label for the bucket column
         value_label: Label for the value column
         filters: List of filter conditions to apply to the query
+        timezone: Optional timezone (e.g., 'Europe/Berlin') so buckets follow
+            local day boundaries. Naive start/finish values are interpreted in
+            this timezone.
     """
-    if isinstance(time_field, InstrumentedAttribute):
-        time_field = time_field.key
-    if isinstance(metric_field, InstrumentedAttribute):
-        metric_field = metric_field.key
-
-    try:
-        model_timescale_field_value = getattr(model, time_field)
-        metric_field_value = getattr(model, metric_field)
-    except AttributeError as e:
-        raise ValueError(
-            f"Column {str(e).split()[-1]} not found in model {model.__name__}"
-        )
+    model_timescale_field_value = _get_model_field(model, time_field)
+    metric_field_value = _get_model_field(model, metric_field)
 
+    # Keep start/finish timezone-aware so the range predicates stay typed as
+    # timestamptz and TimescaleDB can exclude chunks
+    start = localize_datetime(start, timezone)
+    finish = localize_datetime(finish, timezone)
     if start and finish and finish <= start:
         raise ValueError("Finish time must be after start time")
 
-    # Remove any timezone info from start/finish if present
-    if start and start.tzinfo:
-        start = start.replace(tzinfo=None)
-    if finish and finish.tzinfo:
-        finish = finish.replace(tzinfo=None)
-
     # Create the gapfill bucket
     bucket = time_bucket_gapfill(
         interval,
         model_timescale_field_value,
+        timezone=timezone,
         start=start,
         finish=finish,
     )
@@ -163,6 +226,300 @@ def time_bucket_gapfill_query(
         for filter_condition in filters:
             query = query.where(filter_condition)
 
-    result = session.exec(query)
-    result = result.mappings().all()
-    return list(result)
+    return _fetch_mappings(session, query, model, "time_bucket_gapfill_query")
+
+
+@instrumented()
+@read_only
+def candlestick_query(
+    session: Session,
+    model: Any,
+    interval: str = "1 hour",
+    price_field: str = "price",
+    volume_field: Optional[str] = None,
+    time_field: str = "time",
+    group_by: Union[str, List, None] = None,
+    start: Any = None,
+    finish: Any = None,
+    use_locf: bool = False,
+    filters: List = None,
+    timezone: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Open/high/low/close (and optional volume) per time bucket, in one pass.
+
+    When both `start` and `finish` are provided the buckets are produced with
+    time_bucket_gapfill so charts get a continuous series. Combine with
+    `use_locf` to carry the last known open/high/low/close forward into empty
+    buckets (volume is left NULL for empty buckets).
+
+    Args:
+        session: SQLModel session
+        model: The SQLModel class to query
+        interval: Time interval (e.g., '1 minute', '1 hour')
+        price_field: The price field used for open/high/low/close
+        volume_field: Optional volume field to sum per bucket
+        time_field: The timestamp field to bucket
+        group_by: Field name(s) to compute separate candles for (e.g., 'symbol')
+        start: Start time for gap filling
+        finish: End time for gap filling
+        use_locf: Use last observation carried forward for empty buckets
+        filters: List of filter conditions to apply to the query
+        timezone: Optional timezone (e.g., 'America/New_York') so buckets follow
+            local day boundaries. Naive start/finish values are interpreted in
+            this timezone.
+    """
+    model_timescale_field_value = _get_model_field(model, time_field)
+    price_field_value = _get_model_field(model, price_field)
+    volume_field_value = None
+    if volume_field is not None:
+        volume_field_value = _get_model_field(model, volume_field)
+
+    group_by_values = _get_group_by_fields(model, group_by)
+
+    start = localize_datetime(start, timezone)
+    finish = localize_datetime(finish, timezone)
+    if start and finish and finish <= start:
+        raise ValueError("Finish time must be after start time")
+
+    use_gapfill = start is not None and finish is not None
+    if use_gapfill:
+        bucket = time_bucket_gapfill(
+            interval,
+            model_timescale_field_value,
+            timezone=timezone,
+            start=start,
+            finish=finish,
+        )
+    else:
+        bucket = time_bucket(interval, model_timescale_field_value, timezone=timezone)
+
+    ohlc = {
+        "open": first(price_field_value, model_timescale_field_value),
+        "high": func.max(price_field_value),
+        "low": func.min(price_field_value),
+        "close": last(price_field_value, model_timescale_field_value),
+    }
+    if use_gapfill and use_locf:
+        ohlc = {label: func.locf(agg) for label, agg in ohlc.items()}
+
+    columns = [bucket.label("bucket")]
+    columns.extend(field.label(field.key) for field in group_by_values)
+    columns.extend(agg.label(label) for label, agg in ohlc.items())
+    if volume_field_value is not None:
+        columns.append(func.sum(volume_field_value).label("volume"))
+
+    query = (
+        select(*columns)
+        .group_by(bucket, *group_by_values)
+        .order_by(text("bucket ASC"), *group_by_values)
+    )
+
+    # Apply time range filters
+    if start:
+        query = query.filter(model_timescale_field_value >= start)
+    if finish:
+        query = query.filter(model_timescale_field_value <= finish)
+
+    # Apply additional filters if provided
+    if filters:
+        for filter_condition in filters:
+            query = query.where(filter_condition)
+
+    return _fetch_mappings(session, query, model, "candlestick_query")
+
+
+@instrumented()
+@read_only
+def counter_agg_query(
+    session: Session,
+    model: Any,
+    interval: str = "5 minutes",
+    time_field: str = "time",
+    metric_field: str = "metric",
+    group_by: Union[str, List, None] = None,
+    filters: List = None,
+    timezone: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Per-bucket rate, delta and extrapolated rate of a monotonically increasing
+    counter, computed server-side with counter_agg (handles counter resets).
+
+    Requires the timescaledb_toolkit extension.
+
+    Args:
+        session: SQLModel session
+        model: The SQLModel class to query
+        interval: Time interval (e.g., '5 minutes', '1 hour')
+        time_field: The timestamp field to bucket
+        metric_field: The counter field to aggregate
+        group_by: Field name(s) identifying a series (e.g., 'device_id')
+        filters: List of filter conditions to apply to the query
+        timezone: Optional timezone so buckets follow local day boundaries
+    """
+    model_timescale_field_value = _get_model_field(model, time_field)
+    metric_field_value = _get_model_field(model, metric_field)
+    group_by_values = _get_group_by_fields(model, group_by)
+
+    bucket = time_bucket(interval, model_timescale_field_value, timezone=timezone)
+    # Bound every summary to its bucket so extrapolated_rate can be computed;
+    # identical aggregate calls are only evaluated once by PostgreSQL.
+    bounds = func.tstzrange(bucket, bucket + _interval_literal(interval))
+    summary = counter_agg(model_timescale_field_value, metric_field_value, bounds)
+
+    query = (
+        select(
+            bucket.label("bucket"),
+            *[field.label(field.key) for field in group_by_values],
+            rate(summary).label("rate"),
+            delta(summary).label("delta"),
+            extrapolated_rate(summary).label("extrapolated_rate"),
+        )
+        .group_by(bucket, *group_by_values)
+        .order_by(text("bucket ASC"), *group_by_values)
+    )
+
+    # Apply filters if provided
+    if filters:
+        for filter_condition in filters:
+            query = query.where(filter_condition)
+
+    return _fetch_mappings(session, query, model, "counter_agg_query")
+
+
+@instrumented()
+@read_only
+def time_weight_query(
+    session: Session,
+    model: Any,
+    interval: str = "1 hour",
+    time_field: str = "time",
+    metric_field: str = "metric",
+    method: str = "Linear",
+    group_by: Union[str, List, None] = None,
+    filters: List = None,
+    timezone: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Per-bucket time-weighted average of an irregularly sampled gauge,
+    computed server-side with time_weight.
+
+    Requires the timescaledb_toolkit extension.
+
+    Args:
+        session: SQLModel session
+        model: The SQLModel class to query
+        interval: Time interval (e.g., '1 hour', '1 day')
+        time_field: The timestamp field to bucket
+        metric_field: The gauge field to average
+        method: Weighting method, 'Linear' or 'LOCF'
+        group_by: Field name(s) identifying a series (e.g., 'device_id')
+        filters: List of filter conditions to apply to the query
+        timezone: Optional timezone so buckets follow local day boundaries
+    """
+    model_timescale_field_value = _get_model_field(model, time_field)
+    metric_field_value = _get_model_field(model, metric_field)
+    group_by_values = _get_group_by_fields(model, group_by)
+
+    bucket = time_bucket(interval, model_timescale_field_value, timezone=timezone)
+    summary = time_weight(method, model_timescale_field_value, metric_field_value)
+
+    query = (
+        select(
+            bucket.label("bucket"),
+            *[field.label(field.key) for field in group_by_values],
+            average(summary).label("average"),
+        )
+        .group_by(bucket, *group_by_values)
+        .order_by(text("bucket ASC"), *group_by_values)
+    )
+
+    # Apply filters if provided
+    if filters:
+        for filter_condition in filters:
+            query = query.where(filter_condition)
+
+    return _fetch_mappings(session, query, model, "time_weight_query")
+
+
+@instrumented()
+@read_only
+def latest_per_series(
+    session: Session,
+    model: Any,
+    series_field: Union[str, List] = "device_id",
+    value_fields: Union[str, List, None] = None,
+    lookback: Optional[timedelta] = timedelta(days=1),
+    time_field: str = "time",
+    since: Optional[datetime] = None,
+    filters: List = None,
+) -> List[Dict]:
+    """
+    Most recent row of every series (e.g., the current value per device).
+
+    The query is a DISTINCT ON (series) ordered by series, time DESC, which
+    TimescaleDB runs as a SkipScan (one index probe per series instead of
+    reading every row) when the table has a (series, time DESC) index, see
+    timescaledb.indexes.composite_index. The lookback is a plain range
+    predicate on the time column with a bound parameter: chunks older than it
+    are excluded at planning time, or at executor startup once the driver
+    prepared the statement and PostgreSQL switched to a generic plan. Series
+    without a row in the lookback window are not returned.
+
+    Args:
+        session: SQLModel session
+        model: The SQLModel class to query
+        series_field: Field name(s) identifying a series (e.g., 'device_id')
+        value_fields: Field name(s) to return with each series, defaults to all
+            other columns
+        lookback: Only consider rows newer than now - lookback, None scans the
+            whole table
+        time_field: The timestamp field
+        since: Only consider rows at or after this time (combined with
+            lookback), naive datetimes are taken as UTC
+        filters: List of filter conditions to apply to the query
+
+    Returns:
+        One mapping per series with the series, time and value fields
+    """
+    model_timescale_field_value = _get_model_field(model, time_field)
+    series_values = _get_group_by_fields(model, series_field)
+    if not series_values:
+        raise ValueError("At least one series field is required")
+    if value_fields is None:
+        keys = {field.key for field in series_values}
+        keys.add(model_timescale_field_value.key)
+        value_fields = [
+            column.key for column in model.__table__.columns if column.key not in keys
+        ]
+    value_field_values = _get_group_by_fields(model, value_fields)
+
+    # Naive bounds are taken as UTC, like the other helpers do
+    since = localize_datetime(since, "UTC")
+    lower_bound = since
+    if lookback is not None:
+        if lookback <= timedelta(0):
+            raise ValueError("lookback must be positive")
+        cutoff = get_utc_now() - lookback
+        lower_bound = cutoff if since is None else max(cutoff, since)
+
+    query = (
+        select(
+            *[field.label(field.key) for field in series_values],
+            model_timescale_field_value.label(model_timescale_field_value.key),
+            *[field.label(field.key) for field in value_field_values],
+        )
+        .distinct(*series_values)
+        .order_by(*series_values, model_timescale_field_value.desc())
+    )
+
+    # A plain range predicate on the time column, for chunk exclusion
+    if lower_bound is not None:
+        query = query.where(model_timescale_field_value >= lower_bound)
+
+    # Apply filters if provided
+    if filters:
+        for filter_condition in filters:
+            query = query.where(filter_condition)
+
+    return _fetch_mappings(session, query, model, "latest_per_series")
@@ -0,0 +1,16 @@
+from .add import add_reorder_policy
+from .chunk import reorder_chunk, reorder_chunks
+from .drop import drop_reorder_policy
+from .list import list_reorder_policies
+from .schemas import ReorderPolicySchema
+from .sync import sync_reorder_policies
+
+__all__ = [
+    "add_reorder_policy",
+    "sync_reorder_policies",
+    "list_reorder_policies",
+    "drop_reorder_policy",
+    "reorder_chunk",
+    "reorder_chunks",
+    "ReorderPolicySchema",
+]
@@ -0,0 +1,43 @@
+from typing import Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb.reorder import extractors, sql
+
+
+def add_reorder_policy(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    index_name: str = None,
+    commit: bool = True,
+) -> None:
+    """
+    Add a reorder policy to a hypertable
+
+    The policy rewrites each chunk, once it is no longer written to, in the
+    order of the index so range scans on it read neighbouring pages.
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class with __reorder_index__ declared
+        table_name: Name of the hypertable (alternative to model)
+        index_name: Index to order chunks by (overrides the model's)
+        commit: Whether to commit the transaction
+    """
+    if all([model is None, table_name is None]):
+        raise ValueError("model or table_name is required to add a reorder policy")
+
+    if model is not None:
+        policy_params = extractors.extract_model_reorder_policy_params(model)
+        table_name = policy_params["table_name"]
+        index_name = index_name or policy_params.get("index_name")
+
+    sql_query = sql.format_reorder_policy_sql_query(
+        table_name=table_name,
+        index_name=index_name,
+    )
+    session.execute(sqlalchemy.text(sql_query))
+    if commit:
+        session.commit()
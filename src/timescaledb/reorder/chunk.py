@@ -0,0 +1,94 @@
+import logging
+from typing import List, Optional, Type, Union
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel
+
+from timescaledb.compression.chunks import get_engine
+from timescaledb.hypertables.chunks import list_chunks, show_chunks
+from timescaledb.hypertables.chunks.show import ChunkTimeArgument
+from timescaledb.hypertables.chunks.utils import get_chunk_table_name
+from timescaledb.instrumentation import instrumented
+from timescaledb.reorder import extractors, sql
+
+logger = logging.getLogger(__name__)
+
+
+def reorder_chunk(
+    session_or_engine: Union[Session, Engine],
+    chunk_name: str,
+    index_name: Optional[str] = None,
+) -> None:
+    """
+    Rewrite a single chunk in the order of an index, e.g., after a backfill
+
+    reorder_chunk cannot run inside a transaction block, it runs on its own
+    autocommit connection from the engine. The chunk is locked exclusively
+    while it is rewritten.
+
+    Args:
+        session_or_engine: SQLModel session (its bind is used) or SQLAlchemy engine
+        chunk_name: Qualified name of the chunk
+        index_name: Index of the hypertable to order by. Defaults to the index
+            the chunk was last reordered by
+    """
+    engine = get_engine(session_or_engine)
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.execute(
+            sqlalchemy.text(sql.REORDER_CHUNK_SQL),
+            {"chunk_name": chunk_name, "index_name": index_name},
+        )
+
+
+@instrumented()
+def reorder_chunks(
+    session_or_engine: Union[Session, Engine],
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    index_name: Optional[str] = None,
+    older_than: ChunkTimeArgument = None,
+    newer_than: ChunkTimeArgument = None,
+) -> List[str]:
+    """
+    Reorder the uncompressed chunks of a hypertable in a time range, one chunk
+    at a time
+
+    Args:
+        session_or_engine: SQLModel session (its bind is used) or SQLAlchemy engine
+        model: SQLModel class of the hypertable, its __reorder_index__ is used
+            when index_name is not given
+        table_name: Name of the hypertable (alternative to model)
+        index_name: Index of the hypertable to order by
+        older_than: Only reorder chunks older than this interval or timestamp
+        newer_than: Only reorder chunks newer than this interval or timestamp
+
+    Returns:
+        List[str]: Names of the reordered chunks
+    """
+    hypertable_name = get_chunk_table_name(model, table_name, "reorder chunks")
+    if index_name is None and model is not None:
+        index_name = extractors.extract_model_reorder_policy_params(model)["index_name"]
+    engine = get_engine(session_or_engine)
+
+    with engine.connect() as connection:
+        in_range = set(
+            show_chunks(
+                connection,
+                table_name=hypertable_name,
+                older_than=older_than,
+                newer_than=newer_than,
+            )
+        )
+        # Compressed chunks are stored in compressed batches, they cannot be reordered
+        chunk_names = [
+            chunk.qualified_name
+            for chunk in list_chunks(connection, table_name=hypertable_name)
+            if chunk.qualified_name in in_range and not chunk.is_compressed
+        ]
+
+    for chunk_name in chunk_names:
+        logger.info(f"Reordering chunk {chunk_name} by {index_name}")
+        reorder_chunk(engine, chunk_name, index_name=index_name)
+    return chunk_names
@@ -0,0 +1,22 @@
+import sqlalchemy
+from sqlmodel import Session
+
+from timescaledb.reorder import sql
+
+
+def drop_reorder_policy(
+    session: Session,
+    table_name: str,
+    commit: bool = True,
+) -> None:
+    """
+    Drop the reorder policy of a hypertable
+
+    Args:
+        session: SQLAlchemy session
+        table_name: Name of the table to drop the reorder policy for
+        commit: Whether to commit the transaction
+    """
+    session.execute(sqlalchemy.text(sql.get_drop_reorder_policy_sql_query(table_name)))
+    if commit:
+        session.commit()
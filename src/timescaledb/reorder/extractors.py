@@ -0,0 +1,26 @@
+from typing import Type
+
+from sqlmodel import SQLModel
+
+from timescaledb.reorder import validators
+
+
+def extract_model_reorder_policy_params(
+    model: Type[SQLModel],
+) -> dict:
+    """
+    Extract the reorder policy parameters from the model
+
+    Returns:
+        dict: The table name and the resolved index name (None if the model
+        does not declare __reorder_index__)
+    """
+    table_name = model.__tablename__
+    reorder_index = getattr(model, "__reorder_index__", None)
+    index_name = None
+    if reorder_index is not None:
+        index_name = validators.resolve_reorder_index(model, reorder_index)
+    return {
+        "table_name": table_name,
+        "index_name": index_name,
+    }
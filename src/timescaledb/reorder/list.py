@@ -0,0 +1,20 @@
+from typing import List
+
+import sqlalchemy
+from sqlmodel import Session
+
+from timescaledb.reorder import sql
+from timescaledb.reorder.schemas import ReorderPolicySchema
+from timescaledb.routing import read_only
+
+
+@read_only
+def list_reorder_policies(session: Session) -> List[ReorderPolicySchema]:
+    """
+    List the reorder policies of all hypertables
+
+    Returns:
+        List[ReorderPolicySchema]: One entry per hypertable with a reorder policy
+    """
+    rows = session.execute(sqlalchemy.text(sql.LIST_REORDER_POLICIES_SQL)).fetchall()
+    return [ReorderPolicySchema(**row._mapping) for row in rows]
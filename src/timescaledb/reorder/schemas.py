@@ -0,0 +1,14 @@
+from datetime import timedelta
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ReorderPolicySchema(BaseModel):
+    """A reorder policy job and the index it orders chunks by"""
+
+    job_id: int
+    hypertable_schema: str
+    hypertable_name: str
+    index_name: Optional[str] = None
+    schedule_interval: Optional[timedelta] = None
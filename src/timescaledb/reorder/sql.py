@@ -0,0 +1,44 @@
+import sqlalchemy
+
+ADD_REORDER_POLICY_SQL = """
+SELECT add_reorder_policy(:hypertable_name, :index_name, if_not_exists => true);
+"""
+
+DROP_REORDER_POLICY_SQL = """
+SELECT remove_reorder_policy(:hypertable_name, if_exists => true);
+"""
+
+LIST_REORDER_POLICIES_SQL = """
+SELECT job_id,
+       hypertable_schema,
+       hypertable_name,
+       config->>'index_name' AS index_name,
+       schedule_interval
+  FROM timescaledb_information.jobs
+  WHERE proc_name = 'policy_reorder'
+  ORDER BY hypertable_name;
+"""
+
+REORDER_CHUNK_SQL = """
+SELECT reorder_chunk(CAST(:chunk_name AS regclass), CAST(:index_name AS regclass));
+"""
+
+
+def format_reorder_policy_sql_query(table_name: str, index_name: str) -> str:
+    """
+    Format the SQL query adding a reorder policy to a hypertable
+    """
+    if not index_name:
+        raise ValueError("index_name is required to add a reorder policy")
+    query = sqlalchemy.text(ADD_REORDER_POLICY_SQL).bindparams(
+        hypertable_name=table_name,
+        index_name=index_name,
+    )
+    return str(query.compile(compile_kwargs={"literal_binds": True}))
+
+
+def get_drop_reorder_policy_sql_query(table_name: str) -> str:
+    query = sqlalchemy.text(DROP_REORDER_POLICY_SQL).bindparams(
+        hypertable_name=table_name,
+    )
+    return str(query.compile(compile_kwargs={"literal_binds": True}))
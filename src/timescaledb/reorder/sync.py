@@ -0,0 +1,57 @@
+import logging
+from typing import Type
+
+from sqlmodel import Session, SQLModel
+
+from timescaledb.instrumentation import instrumented
+from timescaledb.models import TimescaleModel
+from timescaledb.reorder import extractors
+from timescaledb.reorder.add import add_reorder_policy
+from timescaledb.reorder.drop import drop_reorder_policy
+from timescaledb.reorder.list import list_reorder_policies
+from timescaledb.routing import on_primary
+
+logger = logging.getLogger(__name__)
+
+
+@instrumented()
+@on_primary
+def sync_reorder_policies(session: Session, *models: Type[SQLModel]) -> None:
+    """
+    Create reorder policies for all models that declare __reorder_index__
+
+    A policy ordering by a different index than the declared one is replaced.
+    Policies of models without __reorder_index__ are left untouched.
+    """
+    if models:
+        model_list = models
+    else:
+        model_list = [
+            model
+            for model in TimescaleModel.__subclasses__()
+            if getattr(model, "__table__", None) is not None
+        ]
+
+    current_policies = {
+        policy.hypertable_name: policy for policy in list_reorder_policies(session)
+    }
+    for model in model_list:
+        policy_params = extractors.extract_model_reorder_policy_params(model)
+        index_name = policy_params["index_name"]
+        if index_name is None:
+            continue
+        table_name = policy_params["table_name"]
+        policy = current_policies.get(table_name)
+        if policy is not None:
+            if policy.index_name == index_name:
+                logger.info(f"Reorder policy for {model.__name__} already exists")
+                continue
+            logger.info(
+                f"Replacing reorder policy of {model.__name__} on "
+                f"{policy.index_name} with {index_name}"
+            )
+            drop_reorder_policy(session, table_name, commit=False)
+        else:
+            logger.info(f"Adding reorder policy for {model.__name__}")
+        add_reorder_policy(session, model, commit=False)
+    session.commit()
@@ -0,0 +1,49 @@
+from typing import Tuple, Type, Union
+
+from sqlmodel import SQLModel
+
+from timescaledb import exceptions
+
+
+def resolve_reorder_index(
+    model: Type[SQLModel], reorder_index: Union[str, Tuple[str, ...]]
+) -> str:
+    """
+    Resolve __reorder_index__ to the name of an index on the model's table.
+
+    The value may be an index name, or the column (or tuple of columns) of an
+    index declared on the model, e.g., Field(index=True) or an Index in
+    __table_args__. Names that match neither are assumed to be indexes created
+    outside the model (e.g., in a migration) and are returned unchanged.
+
+    Raises:
+        InvalidReorderIndex: If the value names columns that no index on the
+            model covers, in that order
+    """
+    if isinstance(reorder_index, str):
+        columns = tuple(column.strip() for column in reorder_index.split(","))
+    else:
+        columns = tuple(reorder_index)
+    if not columns or not all(isinstance(column, str) for column in columns):
+        raise exceptions.InvalidReorderIndex(
+            f"Invalid reorder index {reorder_index!r} for model {model.__name__}"
+        )
+
+    indexes = model.__table__.indexes
+    for index in indexes:
+        if index.name == reorder_index:
+            return index.name
+    for index in indexes:
+        if tuple(column.name for column in index.columns) == columns:
+            return index.name
+
+    if all(column in model.__table__.columns for column in columns):
+        raise exceptions.InvalidReorderIndex(
+            f"No index on {', '.join(columns)} in model {model.__name__}. "
+            "Declare one with Field(index=True) or an Index in __table_args__"
+        )
+    if len(columns) > 1:
+        raise exceptions.InvalidReorderIndex(
+            f"Field(s) {', '.join(columns)} not found in model {model.__name__}"
+        )
+    return columns[0]
@@ -1,11 +1,22 @@
 from .add import add_retention_policy
 from .drop import drop_retention_policy
 from .list import list_retention_policies
+from .schemas import RetentionPolicyChange, RetentionPolicySchema
 from .sync import sync_retention_policies
+from .update import (
+    get_retention_policies,
+    get_retention_policy,
+    update_retention_policy,
+)
 
 __all__ = [
     "add_retention_policy",
     "sync_retention_policies",
     "list_retention_policies",
     "drop_retention_policy",
+    "get_retention_policy",
+    "get_retention_policies",
+    "update_retention_policy",
+    "RetentionPolicySchema",
+    "RetentionPolicyChange",
 ]
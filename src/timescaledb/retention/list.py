@@ -4,8 +4,10 @@ import sqlalchemy
 from sqlmodel import Session
 
 from timescaledb.retention import sql
+from timescaledb.routing import read_only
 
 
+@read_only
 def list_retention_policies(
     session: Session,
 ) -> Optional[dict]:
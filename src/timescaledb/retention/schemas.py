@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class RetentionPolicySchema(BaseModel):
+    """A retention policy job, its drop_after setting and its run stats"""
+
+    job_id: int
+    hypertable_schema: str
+    hypertable_name: str
+    drop_after: Optional[str] = None
+    schedule_interval: Optional[timedelta] = None
+    scheduled: Optional[bool] = None
+    last_run_started_at: Optional[datetime] = None
+    last_successful_finish: Optional[datetime] = None
+    last_run_status: Optional[str] = None
+    last_run_duration: Optional[timedelta] = None
+    next_start: Optional[datetime] = None
+    total_runs: Optional[int] = None
+    total_successes: Optional[int] = None
+    total_failures: Optional[int] = None
+
+
+class RetentionPolicyChange(BaseModel):
+    """What syncing a retention policy did, or would do on a dry run"""
+
+    table_name: str
+    action: str
+    current_drop_after: Optional[str] = None
+    drop_after: Optional[str] = None
+    dry_run: bool = False
@@ -43,12 +43,37 @@ def format_retention_policy_sql_query(
     return str(query.compile(compile_kwargs={"literal_binds": True}))
 
 
-GET_RETENTION_POLICY_SQL = """
-SELECT * FROM timescaledb_information.jobs j
-  JOIN timescaledb_information.job_stats js
+# Retention policies with their job stats, of one hypertable or of all when
+# hypertable_name is NULL. job_stats has no row until a job has been scheduled,
+# and uses -infinity for runs that did not happen yet.
+GET_RETENTION_POLICIES_SQL = """
+SELECT j.job_id,
+       j.hypertable_schema,
+       j.hypertable_name,
+       j.config->>'drop_after' AS drop_after,
+       j.schedule_interval,
+       j.scheduled,
+       CASE WHEN isfinite(js.last_run_started_at)
+            THEN js.last_run_started_at END AS last_run_started_at,
+       CASE WHEN isfinite(js.last_successful_finish)
+            THEN js.last_successful_finish END AS last_successful_finish,
+       js.last_run_status,
+       js.last_run_duration,
+       CASE WHEN isfinite(js.next_start) THEN js.next_start END AS next_start,
+       js.total_runs,
+       js.total_successes,
+       js.total_failures
+  FROM timescaledb_information.jobs j
+  LEFT JOIN timescaledb_information.job_stats js
     ON j.job_id = js.job_id
   WHERE j.proc_name = 'policy_retention'
-    AND j.hypertable_name = :hypertable_name;
+    AND (CAST(:hypertable_name AS TEXT) IS NULL
+         OR j.hypertable_name = :hypertable_name)
+  ORDER BY j.hypertable_name;
+"""
+
+INTERVALS_EQUAL_SQL = """
+SELECT CAST(:current AS INTERVAL) = CAST(:desired AS INTERVAL);
 """
 
 LIST_RETENTION_POLICIES_SQL = """
@@ -58,15 +83,6 @@ SELECT DISTINCT hypertable_name
 """
 
 
-def get_retention_policy_sql_query(
-    table_name: str,
-) -> str:
-    query = sqlalchemy.text(GET_RETENTION_POLICY_SQL).bindparams(
-        hypertable_name=table_name,
-    )
-    return str(query.compile(compile_kwargs={"literal_binds": True}))
-
-
 DROP_RETENTION_POLICY_SQL = """
 SELECT remove_retention_policy(:hypertable_name, if_exists => true);
 """
@@ -1,54 +1,65 @@
 import logging
-from typing import Type
+from typing import List, Type
 
-from sqlalchemy.exc import OperationalError
 from sqlmodel import Session, SQLModel
 
+from timescaledb.instrumentation import instrumented
 from timescaledb.models import TimescaleModel
-from timescaledb.retention.add import add_retention_policy
-from timescaledb.retention.list import list_retention_policies
+from timescaledb.retention.schemas import RetentionPolicyChange
+from timescaledb.retention.update import update_retention_policy
+from timescaledb.routing import on_primary
 
 logger = logging.getLogger(__name__)
 
 
+@instrumented()
+@on_primary
 def sync_retention_policies(
     session: Session,
     *models: Type[SQLModel],
     drop_after=None,
-) -> None:
+    dry_run: bool = False,
+) -> List[RetentionPolicyChange]:
     """
-    Create retention policies for all hypertables
+    Create retention policies for all hypertables and replace the ones whose
+    drop_after no longer matches the model's __drop_after__
+
+    Args:
+        session: SQLAlchemy session
+        *models: Optional specific models to sync. If none provided, all
+            TimescaleModel tables are synced
+        drop_after: Fallback for models without __drop_after__. Models without
+            either are skipped
+        dry_run: Only report the changes that would be made
+
+    Returns:
+        List[RetentionPolicyChange]: One entry per model
     """
-    # Use SQLAlchemy's transaction context
-    with session.begin():
-        if models:
-            model_list = sorted(
-                models, key=lambda m: m.__tablename__
-            )  # Sort for consistent ordering
-        else:
-            model_list = sorted(
-                [
-                    model
-                    for model in TimescaleModel.__subclasses__()
-                    if getattr(model, "__table__", None) is not None
-                ],
-                key=lambda m: m.__tablename__,
-            )
-
-        current_policies = list_retention_policies(session)
-        if current_policies is None:
-            current_policies = []
-
-        logger.info(f"Current retention policies: {current_policies}")
-        logger.info(
-            f"Syncing retention policies for models: {[m.__name__ for m in model_list]}"
+    if models:
+        model_list = sorted(
+            models, key=lambda m: m.__tablename__
+        )  # Sort for consistent ordering
+    else:
+        model_list = sorted(
+            [
+                model
+                for model in TimescaleModel.__subclasses__()
+                if getattr(model, "__table__", None) is not None
+            ],
+            key=lambda m: m.__tablename__,
         )
 
-        for model in model_list:
-            table_name = model.__tablename__
-            if table_name in current_policies:
-                logger.info(f"Retention policy for {model.__name__} already exists")
-                continue
-
-            logger.info(f"Adding retention policy for {model.__name__}")
-            add_retention_policy(session, model, drop_after=drop_after)
+    logger.info(
+        f"Syncing retention policies for models: {[m.__name__ for m in model_list]}"
+    )
+    changes = []
+    for model in model_list:
+        change = update_retention_policy(
+            session, model, drop_after=drop_after, dry_run=dry_run, commit=False
+        )
+        if change.action == "unchanged":
+            logger.info(f"Retention policy for {model.__name__} is up to date")
+        changes.append(change)
+    if not dry_run:
+        session.commit()
+    return changes
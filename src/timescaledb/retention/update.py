@@ -0,0 +1,148 @@
+import logging
+from datetime import timedelta
+from typing import List, Optional, Type
+
+import sqlalchemy
+from sqlmodel import Session, SQLModel
+
+from timescaledb import cleaners
+from timescaledb.instrumentation import instrumented
+from timescaledb.retention import extractors, sql
+from timescaledb.retention.add import add_retention_policy
+from timescaledb.retention.drop import drop_retention_policy
+from timescaledb.retention.schemas import RetentionPolicyChange, RetentionPolicySchema
+from timescaledb.routing import on_primary
+
+logger = logging.getLogger(__name__)
+
+
+def get_retention_policy(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+) -> Optional[RetentionPolicySchema]:
+    """
+    Get the retention policy of a hypertable with its job run stats
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class of the hypertable
+        table_name: Name of the hypertable (alternative to model)
+
+    Returns:
+        RetentionPolicySchema, or None if the table has no retention policy
+    """
+    if model is None and table_name is None:
+        raise ValueError("model or table_name is required to get a retention policy")
+    if model is not None:
+        table_name = model.__tablename__
+    row = session.execute(
+        sqlalchemy.text(sql.GET_RETENTION_POLICIES_SQL),
+        {"hypertable_name": table_name},
+    ).fetchone()
+    if row is None:
+        return None
+    return RetentionPolicySchema(**row._mapping)
+
+
+def get_retention_policies(session: Session) -> List[RetentionPolicySchema]:
+    """
+    Get the retention policies of all hypertables with their job run stats
+    """
+    rows = session.execute(
+        sqlalchemy.text(sql.GET_RETENTION_POLICIES_SQL),
+        {"hypertable_name": None},
+    ).fetchall()
+    return [RetentionPolicySchema(**row._mapping) for row in rows]
+
+
+@instrumented()
+@on_primary
+def update_retention_policy(
+    session: Session,
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    drop_after=None,
+    dry_run: bool = False,
+    commit: bool = True,
+) -> RetentionPolicyChange:
+    """
+    Create a retention policy, or replace the existing one when its drop_after
+    differs from the desired value
+
+    Intervals are compared by the database, so '1 year' and '12 months' match.
+
+    Args:
+        session: SQLAlchemy session
+        model: SQLModel class of the hypertable, its __drop_after__ takes
+            precedence over drop_after
+        table_name: Name of the hypertable (alternative to model)
+        drop_after: Desired drop_after (fallback when the model has none)
+        dry_run: Only report the change that would be made
+        commit: Whether to commit the transaction
+
+    Returns:
+        RetentionPolicyChange with action 'create', 'replace', 'unchanged' or
+        'skip' (no drop_after to apply)
+    """
+    if model is None and table_name is None:
+        raise ValueError("model or table_name is required to update a retention policy")
+    if model is not None:
+        policy_params = extractors.extract_model_retention_policy_params(model)
+        table_name = policy_params["table_name"]
+        drop_after = policy_params.get("drop_after") or drop_after
+
+    policy = get_retention_policy(session, table_name=table_name)
+    current_drop_after = policy.drop_after if policy is not None else None
+    change = RetentionPolicyChange(
+        table_name=table_name,
+        action="unchanged",
+        current_drop_after=current_drop_after,
+        drop_after=str(drop_after) if drop_after is not None else None,
+        dry_run=dry_run,
+    )
+    if drop_after is None:
+        change.action = "skip"
+        return change
+    if policy is None:
+        change.action = "create"
+    elif not _drop_after_matches(session, current_drop_after, drop_after):
+        change.action = "replace"
+    else:
+        return change
+
+    logger.info(
+        f"{'Would ' if dry_run else ''}{change.action} retention policy for "
+        f"{table_name}: drop_after {current_drop_after} -> {drop_after}"
+    )
+    if dry_run:
+        return change
+    if change.action == "replace":
+        drop_retention_policy(session, table_name)
+    add_retention_policy(session, table_name=table_name, drop_after=drop_after)
+    if commit:
+        session.commit()
+    return change
+
+
+def _drop_after_matches(session: Session, current: Optional[str], drop_after) -> bool:
+    if current is None:
+        return False
+    if isinstance(drop_after, timedelta):
+        desired = drop_after
+    else:
+        desired, interval_type = cleaners.clean_interval(drop_after)
+        if interval_type == "INTEGER":
+            try:
+                return int(current) == desired
+            except ValueError:
+                return False
+    # Integer hypertables store drop_after as a number, never equal to an interval
+    if current.lstrip("-").isdigit():
+        return False
+    return bool(
+        session.execute(
+            sqlalchemy.text(sql.INTERVALS_EQUAL_SQL),
+            {"current": current, "desired": desired},
+        ).scalar()
+    )
@@ -0,0 +1,337 @@
+import contextvars
+import functools
+import inspect
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import sqlalchemy
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+from sqlmodel import Session
+
+from timescaledb.engine import create_engine
+from timescaledb.utils import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+# Zero when the replica replayed everything it received (an idle primary does
+# not make a replica lag), zero as well for servers that are not in recovery
+REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END AS lag_seconds
+"""
+
+READ_STATEMENT_PREFIXES = ("SELECT", "WITH", "SHOW", "EXPLAIN", "VALUES", "TABLE")
+
+_route: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "timescaledb_route", default=None
+)
+
+
+class ReplicaStatus(BaseModel):
+    """
+    Result of the latest lag check of a replica
+    """
+
+    url: str
+    lag_seconds: Optional[float] = None
+    healthy: bool = False
+    checked_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+def current_route() -> Optional[str]:
+    """
+    Where statements of RoutingSessions are sent in the current context,
+    'primary', 'replica' or None (the primary)
+    """
+    return _route.get()
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    Send the statements of RoutingSessions inside the with block to the primary
+    """
+    token = _route.set(PRIMARY)
+    try:
+        yield
+    finally:
+        _route.reset(token)
+
+
+@contextmanager
+def use_replica() -> Iterator[None]:
+    """
+    Send the statements of RoutingSessions inside the with block to a replica,
+    unless an enclosing block or helper asked for the primary
+    """
+    token = _route.set(PRIMARY if _route.get() == PRIMARY else REPLICA)
+    try:
+        yield
+    finally:
+        _route.reset(token)
+
+
+def read_only(func: Callable) -> Callable:
+    """
+    Mark a helper that only reads, so RoutingSessions run it on a replica
+
+    Helpers called from another routed helper (e.g., list_hypertables inside
+    sync_all_hypertables) keep the route of the outer call, so a write flow
+    never reads its own writes from a replica.
+    """
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            if _route.get() is not None:
+                yield from func(*args, **kwargs)
+                return
+            # Resume the generator with the route set, without leaking the
+            # route to the caller between items
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    with use_replica():
+                        try:
+                            item = next(generator)
+                        except StopIteration:
+                            return
+                    yield item
+            finally:
+                generator.close()
+
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _route.get() is not None:
+            return func(*args, **kwargs)
+        with use_replica():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def on_primary(func: Callable) -> Callable:
+    """
+    Mark a helper that writes or manages policies, so RoutingSessions run it
+    (and the helpers it calls) on the primary
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with use_primary():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class EngineRouter:
+    """
+    A primary engine plus replica engines, each with its own connection pool
+
+    Sessions created with session() send writes, policy management and
+    anything not marked read-only to the primary. Read-only helpers
+    (time_bucket_query, list_hypertables, the stats functions, ...) and
+    use_replica() blocks go to a replica whose replay lag is at most
+    `max_lag_seconds`, picked round-robin. When no replica qualifies, or one
+    cannot be reached, reads fall back to the primary.
+
+    Args:
+        primary: Engine of the primary
+        replicas: Engines of the read replicas
+        max_lag_seconds: Replicas lagging further behind are not used
+        check_interval: How long a lag check result is reused, in seconds
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine] = (),
+        max_lag_seconds: float = 10.0,
+        check_interval: float = 5.0,
+    ):
+        if max_lag_seconds < 0:
+            raise ValueError("max_lag_seconds must not be negative")
+        if check_interval < 0:
+            raise ValueError("check_interval must not be negative")
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._statuses: Dict[int, ReplicaStatus] = {}
+        self._checked_at_monotonic: Dict[int, float] = {}
+        self._round_robin = itertools.count()
+
+    @classmethod
+    def from_urls(
+        cls,
+        primary_url: str,
+        replica_urls: Sequence[str] = (),
+        max_lag_seconds: float = 10.0,
+        check_interval: float = 5.0,
+        timezone: str = "UTC",
+        **kwargs,
+    ) -> "EngineRouter":
+        """
+        Create the primary and replica engines with timescaledb.engine.create_engine
+
+        Args:
+            primary_url: Database URL of the primary
+            replica_urls: Database URLs of the read replicas
+            timezone: Timezone of the connections
+            **kwargs: Passed to every create_engine call (pool_size, ...)
+        """
+        return cls(
+            create_engine(primary_url, timezone=timezone, **kwargs),
+            [create_engine(url, timezone=timezone, **kwargs) for url in replica_urls],
+            max_lag_seconds=max_lag_seconds,
+            check_interval=check_interval,
+        )
+
+    def session(self, **kwargs) -> "RoutingSession":
+        """
+        New RoutingSession, keyword arguments are passed to Session
+        """
+        return RoutingSession(self, **kwargs)
+
+    def get_replica(self) -> Engine:
+        """
+        A replica within the lag limit, or the primary when there is none
+        """
+        healthy = [
+            engine for engine in self.replicas if self.check_replica(engine).healthy
+        ]
+        if not healthy:
+            return self.primary
+        return healthy[next(self._round_robin) % len(healthy)]
+
+    def check_replica(self, engine: Engine, force: bool = False) -> ReplicaStatus:
+        """
+        Lag status of a replica, checked at most once per check_interval
+
+        Args:
+            engine: One of the replica engines
+            force: Check even if the previous result is still fresh
+        """
+        key = id(engine)
+        with self._lock:
+            now = time.monotonic()
+            checked_at = self._checked_at_monotonic.get(key)
+            if (
+                not force
+                and checked_at is not None
+                and now - checked_at < self.check_interval
+                and key in self._statuses
+            ):
+                return self._statuses[key]
+            # Reserve the check so concurrent callers keep the previous status
+            self._checked_at_monotonic[key] = now
+            previous = self._statuses.get(key)
+
+        status = self._measure_lag(engine)
+        if previous is not None and previous.healthy and not status.healthy:
+            logger.warning(
+                f"Not reading from replica {status.url}: "
+                f"{status.error or f'lag {status.lag_seconds}s'}"
+            )
+        with self._lock:
+            self._statuses[key] = status
+        return status
+
+    def status(self, force: bool = False) -> List[ReplicaStatus]:
+        """
+        Lag status of every replica, e.g., for a health endpoint
+        """
+        return [self.check_replica(engine, force=force) for engine in self.replicas]
+
+    def dispose(self) -> None:
+        """
+        Close the connection pools of the primary and the replicas
+        """
+        self.primary.dispose()
+        for engine in self.replicas:
+            engine.dispose()
+
+    def _measure_lag(self, engine: Engine) -> ReplicaStatus:
+        status = ReplicaStatus(
+            url=engine.url.render_as_string(hide_password=True),
+            checked_at=get_utc_now(),
+        )
+        try:
+            with engine.connect() as connection:
+                lag = connection.execute(sqlalchemy.text(REPLICA_LAG_SQL)).scalar()
+        except sqlalchemy.exc.DBAPIError as e:
+            status.error = str(e.orig or e).strip()
+            return status
+        if lag is None:
+            status.error = "replay position unknown"
+            return status
+        status.lag_seconds = float(lag)
+        status.healthy = status.lag_seconds <= self.max_lag_seconds
+        return status
+
+
+class RoutingSession(Session):
+    """
+    Session sending reads of read-only helpers to a replica of an EngineRouter
+
+    Within a transaction the session sticks to one replica. Once it flushed
+    or executed a write, it reads from the primary until the transaction
+    ends, so it always sees its own writes.
+    """
+
+    def __init__(self, router: EngineRouter, **kwargs):
+        kwargs.setdefault("bind", router.primary)
+        super().__init__(**kwargs)
+        self.router = router
+        self._replica: Optional[Engine] = None
+        self._wrote = False
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs) -> Engine:
+        if _route.get() != REPLICA or self._wrote or not self.router.replicas:
+            return self.router.primary
+        if self._replica is None:
+            self._replica = self.router.get_replica()
+        return self._replica
+
+
+def _is_write(statement: Any) -> bool:
+    if isinstance(statement, TextClause):
+        words = statement.text.lstrip().split(None, 1)
+        return not words or words[0].upper() not in READ_STATEMENT_PREFIXES
+    return getattr(statement, "is_dml", False)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _track_writes(orm_execute_state) -> None:
+    if _is_write(orm_execute_state.statement):
+        orm_execute_state.session._wrote = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _track_flush(session: RoutingSession, flush_context) -> None:
+    session._wrote = True
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_route(session: RoutingSession, transaction) -> None:
+    if transaction.parent is None:
+        session._replica = None
+        session._wrote = False
@@ -0,0 +1,171 @@
+import dataclasses
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import select
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlmodel import Session, SQLModel
+
+from timescaledb.instrumentation import instrumented, mark_phase, set_row_count
+from timescaledb.routing import read_only
+
+_row_classes: Dict[Tuple[Type[SQLModel], Tuple[str, ...]], type] = {}
+
+
+def row_class(model: Type[SQLModel], columns: Optional[Sequence[Any]] = None) -> type:
+    """
+    Frozen __slots__ dataclass with one field per column of a model
+
+    Row classes are created once per model and column selection and reused.
+
+    Args:
+        model: SQLModel table class
+        columns: Column names (or model attributes) to include, defaults to all
+    """
+    names = _column_names(model, columns)
+    key = (model, names)
+    cls = _row_classes.get(key)
+    if cls is None:
+        table_columns = model.__table__.columns
+        cls = dataclasses.make_dataclass(
+            f"{model.__name__}Row",
+            [(name, _python_type(table_columns[name])) for name in names],
+            frozen=True,
+            slots=True,
+        )
+        _row_classes[key] = cls
+    return cls
+
+
+def field_index(
+    model: Type[SQLModel], columns: Optional[Sequence[Any]] = None
+) -> Dict[str, int]:
+    """
+    Position of every column in the tuples returned with as_tuples=True
+    """
+    return {name: index for index, name in enumerate(_column_names(model, columns))}
+
+
+@instrumented()
+@read_only
+def select_rows(
+    session: Session,
+    model: Type[SQLModel],
+    columns: Optional[Sequence[Any]] = None,
+    filters: List = None,
+    order_by: List = None,
+    limit: Optional[int] = None,
+    as_tuples: bool = False,
+) -> List[Any]:
+    """
+    Read rows of a model as compact row objects instead of SQLModel instances
+
+    The table is queried through SQLAlchemy Core, so rows are neither validated
+    by pydantic nor tracked in the session's identity map. Use it for bulk
+    reads and exports; use the ORM when the objects are modified.
+
+    Args:
+        session: SQLModel session
+        model: The SQLModel class to read
+        columns: Column names (or model attributes) to read, defaults to all
+        filters: List of filter conditions to apply to the query
+        order_by: Columns or expressions to order by
+        limit: Maximum number of rows
+        as_tuples: Return plain tuples (see field_index) instead of row_class
+            instances
+
+    Returns:
+        List of row_class(model, columns) instances or tuples
+    """
+    statement = _build_select(model, columns, filters, order_by, limit)
+    mark_phase("build")
+    result = session.connection().execute(statement)
+    mark_phase("execute")
+    if as_tuples:
+        rows = [tuple(row) for row in result]
+    else:
+        cls = row_class(model, columns)
+        rows = [cls(*row) for row in result]
+    mark_phase("fetch")
+    set_row_count(len(rows))
+    return rows
+
+
+@read_only
+def stream_rows(
+    session: Session,
+    model: Type[SQLModel],
+    columns: Optional[Sequence[Any]] = None,
+    filters: List = None,
+    order_by: List = None,
+    limit: Optional[int] = None,
+    as_tuples: bool = False,
+    batch_size: int = 1000,
+) -> Iterator[Any]:
+    """
+    Stream rows of a model as compact row objects, `batch_size` rows at a time
+
+    Rows are fetched through a server-side cursor, so memory use stays bounded
+    by the batch size however many rows the query returns. Consume the
+    iterator before using the session for other queries.
+
+    Args:
+        batch_size: Number of rows fetched from the server per round trip
+
+    Other arguments are the same as for select_rows.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    statement = _build_select(model, columns, filters, order_by, limit)
+    result = session.connection().execute(
+        statement.execution_options(yield_per=batch_size)
+    )
+    try:
+        if as_tuples:
+            for row in result:
+                yield tuple(row)
+        else:
+            cls = row_class(model, columns)
+            for row in result:
+                yield cls(*row)
+    finally:
+        result.close()
+
+
+def _build_select(
+    model: Type[SQLModel],
+    columns: Optional[Sequence[Any]],
+    filters: Optional[List],
+    order_by: Optional[List],
+    limit: Optional[int],
+):
+    table_columns = model.__table__.columns
+    statement = select(*[table_columns[name] for name in _column_names(model, columns)])
+    for filter_condition in filters or []:
+        statement = statement.where(filter_condition)
+    if order_by:
+        statement = statement.order_by(*order_by)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def _column_names(
+    model: Type[SQLModel], columns: Optional[Sequence[Any]]
+) -> Tuple[str, ...]:
+    table_columns = model.__table__.columns
+    if columns is None:
+        return tuple(table_columns.keys())
+    names = []
+    for column in columns:
+        name = column.key if isinstance(column, InstrumentedAttribute) else column
+        if name not in table_columns:
+            raise ValueError(f"Column {name} not found in model {model.__name__}")
+        names.append(name)
+    return tuple(names)
+
+
+def _python_type(column) -> Any:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return Any
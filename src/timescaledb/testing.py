@@ -0,0 +1,62 @@
+from typing import Any, Callable, List, Optional, Type, Union
+
+from sqlmodel import Session, SQLModel
+
+from timescaledb.explain import ExplainReport, explain_query, explaining
+
+
+def assert_excludes_chunks(
+    session: Session,
+    query: Union[Any, Callable[[], Any]],
+    model: Type[SQLModel] = None,
+    table_name: str = None,
+    max_scanned: Optional[int] = None,
+    allow_decompression: bool = True,
+) -> List[ExplainReport]:
+    """
+    Assert a query does not read every chunk of a hypertable
+
+    Use it in tests to make sure time range predicates stay sargable, e.g.:
+
+        assert_excludes_chunks(
+            session,
+            lambda: time_bucket_query(session, Metric, filters=[Metric.time > start]),
+        )
+
+    Args:
+        session: SQLAlchemy session
+        query: A SQLAlchemy statement, or a callable that runs query helpers
+            (every helper call inside it is checked)
+        model: SQLModel class of the hypertable, required for statements
+        table_name: Name of the hypertable (alternative to model)
+        max_scanned: Fail when more chunks than this are read
+        allow_decompression: Fail when compressed chunks are read if False
+
+    Returns:
+        List[ExplainReport]: The reports that were checked
+    """
+    if callable(query):
+        with explaining() as reports:
+            query()
+        if not reports:
+            raise AssertionError("The callable did not run any query helper")
+    else:
+        if model is None and table_name is None:
+            raise ValueError("model or table_name is required to check a statement")
+        reports = [explain_query(session, query, model=model, table_name=table_name)]
+
+    for report in reports:
+        if not report.total_chunks:
+            raise AssertionError(
+                f"{report.hypertable_name} has no chunks, load data that spans "
+                "several chunks before checking chunk exclusion"
+            )
+        if report.excluded_chunks <= 0:
+            raise AssertionError(f"No chunks were excluded: {report.summary()}")
+        if max_scanned is not None and len(report.scanned_chunks) > max_scanned:
+            raise AssertionError(
+                f"Expected at most {max_scanned} scanned chunks: {report.summary()}"
+            )
+        if not allow_decompression and report.decompressed:
+            raise AssertionError(f"Compressed chunks were read: {report.summary()}")
+    return reports
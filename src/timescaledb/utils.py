@@ -1,6 +1,27 @@
 from datetime import datetime, timezone
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
 
 
 def get_utc_now():
     """Get the current UTC time"""
     return datetime.now(timezone.utc).replace(tzinfo=timezone.utc)
+
+
+def localize_datetime(value: Any, tz: Optional[str] = None) -> Any:
+    """
+    Attach the given IANA timezone to a naive datetime.
+
+    Aware datetimes, non-datetime values and calls without a timezone are
+    returned unchanged.
+    """
+    if tz is None or not isinstance(value, datetime) or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=ZoneInfo(tz))
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a (possibly schema-qualified) identifier for use in generated SQL
+    """
+    return ".".join('"' + part.replace('"', '""') + '"' for part in name.split("."))
@@ -9,6 +9,7 @@ from testcontainers.postgres import PostgresContainer
 
 import timescaledb
 from timescaledb.engine import create_engine
+from timescaledb.indexes import brin_index, composite_index
 from timescaledb.models import TimescaleModel
 from timescaledb.utils import get_utc_now
 
@@ -154,6 +155,30 @@ class RetentionModel(TimescaleModel, table=True):
     __chunk_time_interval__ = "INTERVAL 7 days"
 
 
+class Trade(TimescaleModel, table=True):
+    """Test model for financial-style bucket queries."""
+
+    symbol: str = Field(index=True)
+    price: float
+    volume: int
+
+    __table_name__ = "trades"
+    __enable_compression__ = False
+
+
+class DeviceReading(TimescaleModel, table=True):
+    """Test model with a hash dimension on device_id."""
+
+    # Partitioning columns must be part of the primary key
+    device_id: int = Field(primary_key=True, index=True)
+    reading: float
+
+    __table_name__ = "device_readings"
+    __partition_by__ = ("device_id", 4)
+    __reorder_index__ = "device_id"
+    __time_series_indexes__ = [composite_index("device_id"), brin_index()]
+
+
 @pytest.fixture(scope="function", autouse=True)
 def migrate_database(engine: Engine):
     """Migrate the database to the latest version."""
@@ -172,5 +197,7 @@ test_hypertables_list = [
     SimpleCompressionWithOrderby,
     SimpleCompressionWithSegmentby,
     RetentionModel,
+    Trade,
+    DeviceReading,
 ]
 test_regular_tables_list = [Record]
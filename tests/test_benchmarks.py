@@ -0,0 +1,71 @@
+import json
+from datetime import timedelta
+
+import pytest
+
+from benchmarks.generator import GeneratorConfig, batched, generate_readings
+from benchmarks.runner import BenchmarkResult, compare
+
+
+def test_generator_is_deterministic():
+    """Test the same config always produces the same readings"""
+    config = GeneratorConfig(devices=5, duration=timedelta(hours=2), cardinality=2)
+    readings = list(generate_readings(config))
+    assert readings == list(generate_readings(config))
+    assert len(readings) == config.rows == 5 * 120
+    assert {reading.site for reading in readings} == {"site-0", "site-1"}
+    assert [reading.time for reading in readings] == sorted(
+        reading.time for reading in readings
+    )
+    assert readings != list(
+        generate_readings(
+            GeneratorConfig(
+                devices=5, duration=timedelta(hours=2), cardinality=2, seed=1
+            )
+        )
+    )
+
+
+def test_generator_out_of_order():
+    """Test late readings keep their timestamp and none are lost"""
+    config = GeneratorConfig(
+        devices=10, duration=timedelta(hours=2), out_of_order_fraction=0.2
+    )
+    readings = list(generate_readings(config))
+    in_order = list(
+        generate_readings(GeneratorConfig(devices=10, duration=config.duration))
+    )
+    assert len(readings) == config.rows
+    assert sorted((r.time, r.device_id) for r in readings) == sorted(
+        (r.time, r.device_id) for r in in_order
+    )
+    late = sum(1 for a, b in zip(readings, readings[1:]) if b.time < a.time)
+    assert late > 0
+
+    with pytest.raises(ValueError):
+        GeneratorConfig(out_of_order_fraction=1.5)
+    assert [len(batch) for batch in batched(iter(range(5)), 2)] == [2, 2, 1]
+
+
+def test_compare_results(tmp_path, capsys):
+    """Test slowdowns above the threshold are counted as regressions"""
+
+    def write(path, medians):
+        results = [
+            BenchmarkResult(name=name, runs=[median]).to_dict()
+            for name, median in medians.items()
+        ]
+        path.write_text(json.dumps({"results": results}))
+
+    write(tmp_path / "baseline.json", {"ingest_copy": 1.0, "time_bucket_hot": 1.0})
+    write(
+        tmp_path / "current.json",
+        {"ingest_copy": 1.5, "time_bucket_hot": 0.5, "create_all_cold": 1.0},
+    )
+    regressions = compare(
+        str(tmp_path / "baseline.json"), str(tmp_path / "current.json")
+    )
+    assert regressions == 1
+    output = capsys.readouterr().out
+    assert "SLOWER" in output
+    assert "create_all_cold" in output
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session
+
+import timescaledb
+
+from .conftest import Trade
+
+
+def _add_trades(session: Session, base_time: datetime):
+    trades = [
+        Trade(symbol="AAA", price=10.0, volume=1, time=base_time),
+        Trade(
+            symbol="AAA", price=12.0, volume=2, time=base_time + timedelta(minutes=10)
+        ),
+        Trade(
+            symbol="AAA", price=9.0, volume=3, time=base_time + timedelta(minutes=20)
+        ),
+        Trade(
+            symbol="AAA", price=11.0, volume=4, time=base_time + timedelta(minutes=30)
+        ),
+        # Gap of one hour for AAA
+        Trade(symbol="AAA", price=15.0, volume=5, time=base_time + timedelta(hours=2)),
+        Trade(symbol="BBB", price=100.0, volume=10, time=base_time),
+        Trade(
+            symbol="BBB", price=90.0, volume=20, time=base_time + timedelta(minutes=5)
+        ),
+    ]
+    session.add_all(trades)
+    session.commit()
+
+
+def test_candlestick_query(session: Session):
+    """Test OHLCV per bucket for a single series."""
+    base_time = datetime(2024, 1, 1, 12, 0)
+    _add_trades(session, base_time)
+
+    results = timescaledb.queries.candlestick_query(
+        session,
+        Trade,
+        interval="1 hour",
+        price_field="price",
+        volume_field="volume",
+        filters=[Trade.symbol == "AAA"],
+    )
+
+    assert len(results) == 2, "Expected two hourly candles"
+    candle = results[0]
+    assert candle["open"] == 10.0
+    assert candle["high"] == 12.0
+    assert candle["low"] == 9.0
+    assert candle["close"] == 11.0
+    assert candle["volume"] == 10
+    assert results[1]["open"] == results[1]["close"] == 15.0
+
+
+def test_candlestick_query_group_by(session: Session):
+    """Test candles are computed per symbol when grouping."""
+    base_time = datetime(2024, 1, 1, 12, 0)
+    _add_trades(session, base_time)
+
+    results = timescaledb.queries.candlestick_query(
+        session,
+        Trade,
+        interval="1 hour",
+        price_field="price",
+        volume_field="volume",
+        group_by="symbol",
+    )
+
+    first_bucket = {
+        r["symbol"]: r for r in results if r["bucket"] == results[0]["bucket"]
+    }
+    assert set(first_bucket) == {"AAA", "BBB"}
+    assert first_bucket["BBB"]["open"] == 100.0
+    assert first_bucket["BBB"]["close"] == 90.0
+    assert first_bucket["BBB"]["volume"] == 30
+
+
+def test_candlestick_query_gapfill_locf(session: Session):
+    """Test gapfilled candles carry the last observation forward."""
+    base_time = datetime(2024, 1, 1, 12, 0)
+    _add_trades(session, base_time)
+
+    results = timescaledb.queries.candlestick_query(
+        session,
+        Trade,
+        interval="1 hour",
+        price_field="price",
+        volume_field="volume",
+        start=base_time,
+        finish=base_time + timedelta(hours=3),
+        use_locf=True,
+        filters=[Trade.symbol == "AAA"],
+    )
+
+    assert len(results) == 3, "Expected three hourly candles"
+    gap = results[1]
+    assert gap["open"] == 10.0
+    assert gap["close"] == 11.0
+    assert gap["volume"] is None
+
+
+def test_candlestick_query_invalid_params(session: Session):
+    """Test candlestick_query with invalid parameters."""
+    with pytest.raises(ValueError, match="Column .* not found"):
+        timescaledb.queries.candlestick_query(
+            session, Trade, price_field="nonexistent_field"
+        )
+
+    with pytest.raises(ValueError, match="Column .* not found"):
+        timescaledb.queries.candlestick_query(
+            session, Trade, price_field="price", group_by="nonexistent_field"
+        )
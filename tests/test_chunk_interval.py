@@ -0,0 +1,87 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlmodel import Session
+
+from timescaledb.hypertables import (
+    ChunkIntervalRecommendation,
+    check_chunk_time_interval_drift,
+    get_chunk_time_interval,
+    recommend_chunk_time_interval,
+    set_chunk_time_interval,
+    sync_all_hypertables,
+)
+from timescaledb.hypertables.chunks import list_chunks
+
+from .conftest import Metric
+
+
+def _add_hourly_metrics(session: Session, days: int) -> datetime:
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    metrics = [
+        Metric(sensor_id=1, value=float(hour), time=base_time + timedelta(hours=hour))
+        for hour in range(days * 24)
+    ]
+    session.add_all(metrics)
+    session.commit()
+    return base_time
+
+
+def test_set_chunk_time_interval(session: Session):
+    """Test changing the interval only affects chunks created afterwards"""
+    assert get_chunk_time_interval(session, Metric) == timedelta(days=7)
+    assert check_chunk_time_interval_drift(session, Metric) is None
+
+    base_time = _add_hourly_metrics(session, days=7)
+    existing = list_chunks(session, model=Metric)
+
+    set_chunk_time_interval(session, Metric, chunk_time_interval="1 day")
+    assert get_chunk_time_interval(session, Metric) == timedelta(days=1)
+    assert list_chunks(session, model=Metric) == existing
+
+    drift = check_chunk_time_interval_drift(session, Metric)
+    assert drift is not None
+    assert "set_chunk_time_interval" in drift
+
+    session.add(Metric(sensor_id=1, value=1.0, time=base_time + timedelta(days=30)))
+    session.commit()
+    newest = list_chunks(session, model=Metric)[-1]
+    assert newest.range_end - newest.range_start == timedelta(days=1)
+
+    # Without an explicit interval the model value is applied again
+    set_chunk_time_interval(session, Metric)
+    assert check_chunk_time_interval_drift(session, Metric) is None
+
+
+def test_sync_all_hypertables_reports_drift(session: Session, caplog):
+    """Test sync_all_hypertables warns when the live interval drifted"""
+    set_chunk_time_interval(session, Metric, chunk_time_interval=timedelta(days=2))
+
+    with caplog.at_level(logging.WARNING, logger="timescaledb.hypertables.sync"):
+        sync_all_hypertables(session, Metric)
+
+    assert "__chunk_time_interval__" in caplog.text
+
+
+def test_recommend_chunk_time_interval(session: Session):
+    """Test the recommendation scales with the memory budget"""
+    recommendation = recommend_chunk_time_interval(session, Metric)
+    assert recommendation.recommended_interval is None
+    assert recommendation.warnings
+
+    _add_hourly_metrics(session, days=21)
+
+    recommendation = recommend_chunk_time_interval(
+        session, Metric, memory_bytes=64 * 1024 * 1024
+    )
+    assert isinstance(recommendation, ChunkIntervalRecommendation)
+    assert recommendation.current_interval == timedelta(days=7)
+    assert recommendation.target_bytes == 16 * 1024 * 1024
+    assert recommendation.sampled_chunks >= 2
+    assert recommendation.bytes_per_second > 0
+    assert recommendation.recommended_interval >= timedelta(minutes=1)
+
+    smaller = recommend_chunk_time_interval(
+        session, Metric, memory_bytes=64 * 1024 * 1024, active_chunks=4
+    )
+    assert smaller.recommended_interval < recommendation.recommended_interval
@@ -1,105 +1,160 @@
-# from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session
+
+from timescaledb.hypertables.chunks import (
+    ChunkSchema,
+    ChunkSizeSchema,
+    chunks_detailed_size,
+    drop_chunks,
+    list_chunks,
+    show_chunks,
+)
+from timescaledb.hypertables.chunks import sql_statements as sql
 
-# import pytest
-# from pytest_mock import mocker
-# from sqlmodel import Session
-
-# from timescaledb.hypertables.chunks import show_chunks
-# from timescaledb.hypertables.chunks import sql_statements as sql
-
-
-# @pytest.fixture
-# def mock_execute(mocker):
-#     """Mock the session.execute() to return a predefined result"""
-#     mock = mocker.patch("sqlmodel.Session.execute")
-#     mock.return_value.fetchall.return_value = [("chunk1",), ("chunk2",)]
-#     return mock
-
-
-# def test_show_all_chunks(mock_execute, session: Session):
-#     """Test showing all chunks without any filters"""
-#     result = show_chunks(session, "test_table")
-
-#     mock_execute.assert_called_once()
-#     query = mock_execute.call_args[0][0]
-#     assert str(query) == sql.SHOW_CHUNKS
-#     assert len(result) == 2
-
-
-# def test_show_chunks_older_than(mock_execute, session: Session):
-#     """Test showing chunks older than an interval"""
-#     result = show_chunks(session, "test_table", older_than="7 days")
-
-#     mock_execute.assert_called_once()
-#     query = mock_execute.call_args[0][0]
-#     assert str(query) == sql.SHOW_CHUNKS_OLDER_THAN_INTERVAL_SQL
-#     params = mock_execute.call_args[1]
-#     assert params["older_than"] == "7 days"
-
-
-# def test_show_chunks_older_than_timestamp(mock_execute, session: Session):
-#     """Test showing chunks older than a timestamp"""
-#     timestamp = "2024-01-01"
-#     result = show_chunks(session, "test_table", older_than=timestamp, is_timestamp=True)
-
-#     mock_execute.assert_called_once()
-#     query = mock_execute.call_args[0][0]
-#     assert str(query) == sql.SHOW_CHUNKS_TIMESTAMP_SQL
-#     params = mock_execute.call_args[1]
-#     assert params["timestamp"] == timestamp
-
-
-# def test_show_chunks_newer_than(mock_execute, session: Session):
-#     """Test showing chunks newer than an interval"""
-#     result = show_chunks(session, "test_table", newer_than="7 days")
-
-#     mock_execute.assert_called_once()
-#     query = mock_execute.call_args[0][0]
-#     assert str(query) == sql.SHOW_CHUNKS_NEWER_THAN_INTERVAL_SQL
-#     params = mock_execute.call_args[1]
-#     assert params["newer_than"] == "7 days"
-
-
-# def test_show_chunks_between_intervals(mock_execute, session: Session):
-#     """Test showing chunks between two intervals"""
-#     result = show_chunks(
-#         session,
-#         "test_table",
-#         older_than="14 days",
-#         newer_than="7 days",
-#     )
-
-#     mock_execute.assert_called_once()
-#     query = mock_execute.call_args[0][0]
-#     assert str(query) == sql.SHOW_CHUNKS_BETWEEN_INTERVALS_SQL
-#     params = mock_execute.call_args[1]
-#     assert params["end_timestamp"] == "14 days"
-#     assert params["start_timestamp"] == "7 days"
-
-
-# def test_show_chunks_created_between_intervals(mock_execute, session: Session):
-#     """Test showing chunks created between two intervals"""
-#     result = show_chunks(
-#         session,
-#         "test_table",
-#         created_before="14 days",
-#         created_after="7 days",
-#     )
-
-#     mock_execute.assert_called_once()
-#     query = mock_execute.call_args[0][0]
-#     assert str(query) == sql.SHOW_CHUNKS_CREATED_BETWEEN_INTERVALS_SQL
-#     params = mock_execute.call_args[1]
-#     assert params["created_before"] == "14 days"
-#     assert params["created_after"] == "7 days"
-
-
-# def test_show_chunks_created_before(mock_execute, session: Session):
-#     """Test showing chunks created before an interval"""
-#     result = show_chunks(session, "test_table", created_before="7 days")
-
-#     mock_execute.assert_called_once()
-#     query = mock_execute.call_args[0][0]
-#     assert str(query) == sql.SHOW_CHUNKS_CREATED_BEFORE_INTERVAL_SQL
-#     params = mock_execute.call_args[1]
-#     assert params["created_before"] == "7 days"
+from .conftest import Metric
+
+
+@pytest.fixture
+def mock_execute(mocker):
+    """Mock the session.execute() to return a predefined result"""
+    mock = mocker.patch("sqlmodel.Session.execute")
+    mock.return_value.fetchall.return_value = [("chunk1",), ("chunk2",)]
+    return mock
+
+
+def _add_weekly_metrics(session: Session, weeks: int) -> datetime:
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    metrics = [
+        Metric(sensor_id=1, value=float(week), time=base_time + timedelta(weeks=week))
+        for week in range(weeks)
+    ]
+    session.add_all(metrics)
+    session.commit()
+    return base_time
+
+
+def test_show_all_chunks(mock_execute, session: Session):
+    """Test showing all chunks without any filters"""
+    result = show_chunks(session, table_name="test_table")
+
+    mock_execute.assert_called_once()
+    query, params = mock_execute.call_args[0]
+    assert str(query) == sql.SHOW_CHUNKS_SQL.format(arguments="")
+    assert params == {"hypertable_name": "test_table"}
+    assert result == ["chunk1", "chunk2"]
+
+
+def test_show_chunks_older_than(mock_execute, session: Session):
+    """Test showing chunks older than an interval"""
+    show_chunks(session, table_name="test_table", older_than="INTERVAL 7 days")
+
+    query, params = mock_execute.call_args[0]
+    assert "older_than => CAST(:older_than AS INTERVAL)" in str(query)
+    assert params["older_than"] == "7 days"
+
+
+def test_show_chunks_older_than_timestamp(mock_execute, session: Session):
+    """Test showing chunks older than a timestamp"""
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    show_chunks(session, table_name="test_table", older_than=timestamp)
+
+    query, params = mock_execute.call_args[0]
+    assert "older_than => CAST(:older_than AS TIMESTAMPTZ)" in str(query)
+    assert params["older_than"] == timestamp
+
+
+def test_show_chunks_between_intervals(mock_execute, session: Session):
+    """Test showing chunks between two intervals"""
+    show_chunks(
+        session,
+        table_name="test_table",
+        older_than="7 days",
+        newer_than=timedelta(days=14),
+    )
+
+    query, params = mock_execute.call_args[0]
+    assert "older_than => CAST(:older_than AS INTERVAL)" in str(query)
+    assert "newer_than => CAST(:newer_than AS INTERVAL)" in str(query)
+    assert params["older_than"] == "7 days"
+    assert params["newer_than"] == timedelta(days=14)
+
+
+def test_show_chunks_created_between_intervals(mock_execute, session: Session):
+    """Test showing chunks created between two intervals"""
+    show_chunks(
+        session,
+        table_name="test_table",
+        created_before="7 days",
+        created_after="14 days",
+    )
+
+    query, params = mock_execute.call_args[0]
+    assert "created_before => CAST(:created_before AS INTERVAL)" in str(query)
+    assert "created_after => CAST(:created_after AS INTERVAL)" in str(query)
+    assert params["created_before"] == "7 days"
+    assert params["created_after"] == "14 days"
+
+
+def test_chunk_time_argument_validation():
+    """Test invalid time arguments and drop_chunks without filters are rejected"""
+    with pytest.raises(ValueError, match="Invalid chunk time argument"):
+        sql.format_show_chunks_sql("test_table", older_than=1.5)
+
+    with pytest.raises(ValueError, match="At least one of"):
+        sql.format_drop_chunks_sql("test_table")
+
+    with pytest.raises(ValueError, match="model or table_name is required"):
+        show_chunks(None)
+
+
+def test_chunk_time_argument_interval_keyword():
+    """Test the INTERVAL keyword is stripped in any case"""
+    for older_than in ("INTERVAL 7 days", "interval '7 days'", "7 days"):
+        _, params = sql.format_show_chunks_sql("test_table", older_than=older_than)
+        assert params["older_than"] == "7 days"
+
+
+def test_list_and_show_chunks(session: Session):
+    """Test listing chunks of a hypertable with data in several chunks"""
+    base_time = _add_weekly_metrics(session, weeks=6)
+
+    chunks = list_chunks(session, model=Metric)
+    assert len(chunks) >= 6
+    assert all(isinstance(chunk, ChunkSchema) for chunk in chunks)
+    assert chunks[0].range_start <= base_time < chunks[0].range_end
+    assert not any(chunk.is_compressed for chunk in chunks)
+
+    all_chunks = show_chunks(session, model=Metric)
+    assert set(all_chunks) == {chunk.qualified_name for chunk in chunks}
+
+    older = show_chunks(
+        session, model=Metric, older_than=base_time + timedelta(weeks=3)
+    )
+    assert 0 < len(older) < len(all_chunks)
+
+
+def test_chunks_detailed_size(session: Session):
+    """Test chunk sizes are reported per chunk"""
+    _add_weekly_metrics(session, weeks=3)
+
+    sizes = chunks_detailed_size(session, model=Metric)
+    assert len(sizes) >= 3
+    assert all(isinstance(size, ChunkSizeSchema) for size in sizes)
+    assert all(size.total_bytes > 0 for size in sizes)
+
+
+def test_drop_chunks(session: Session):
+    """Test dropping chunks older than a timestamp"""
+    base_time = _add_weekly_metrics(session, weeks=6)
+    total = len(show_chunks(session, model=Metric))
+
+    dropped = drop_chunks(
+        session, model=Metric, older_than=base_time + timedelta(weeks=3)
+    )
+
+    assert len(dropped) > 0
+    remaining = show_chunks(session, model=Metric)
+    assert len(remaining) == total - len(dropped)
+    assert not set(dropped) & set(remaining)
@@ -50,6 +50,11 @@ def test_clean_interval_with_string():
     assert type_ == "INTERVAL"
     assert value == "4 days"
 
+    # Test with a lowercase keyword
+    value, type_ = clean_interval("interval 7 days")
+    assert type_ == "INTERVAL"
+    assert value == "7 days"
+
 
 def test_clean_interval_with_invalid_type():
     # Test with float
@@ -0,0 +1,78 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from timescaledb.compression import (
+    CompressionRecommendation,
+    check_compression_settings,
+    recommend_compression_settings,
+    sync_compression_policies,
+)
+
+from .conftest import SimpleCompressionWithOrderby, VideoView
+
+
+def _add_video_views(session: Session, rows: int = 3000):
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    views = [
+        VideoView(
+            video_id=row % 3,
+            duration=row,
+            time=base_time + timedelta(minutes=row),
+        )
+        for row in range(rows)
+    ]
+    session.add_all(views)
+    session.commit()
+    session.execute(text(f"ANALYZE {VideoView.__tablename__}"))
+    session.commit()
+
+
+def test_recommend_compression_settings(session: Session):
+    """Test the low-cardinality column is recommended as segmentby"""
+    _add_video_views(session)
+
+    recommendation = recommend_compression_settings(session, VideoView)
+
+    assert isinstance(recommendation, CompressionRecommendation)
+    assert recommendation.compress_segmentby == "video_id"
+    assert recommendation.compress_orderby == "time DESC"
+    assert recommendation.rows_per_segment >= 100
+    columns = {column.column: column for column in recommendation.columns}
+    assert columns["duration"].rows_per_segment < 100
+    assert recommendation.warnings == []
+
+
+def test_recommend_compression_settings_without_data(session: Session):
+    """Test a recommendation on an empty table only warns"""
+    recommendation = recommend_compression_settings(session, VideoView)
+
+    assert recommendation.compress_segmentby is None
+    assert len(recommendation.warnings) == 1
+
+
+def test_check_compression_settings(session: Session):
+    """Test warnings for high-cardinality segmentby and orderby without time"""
+    _add_video_views(session)
+
+    assert check_compression_settings(session, VideoView) == []
+
+    warnings = check_compression_settings(
+        session, VideoView, compress_segmentby="duration", sample_chunk=True
+    )
+    assert len(warnings) == 1
+    assert "'duration'" in warnings[0]
+
+    warnings = check_compression_settings(session, SimpleCompressionWithOrderby)
+    assert len(warnings) == 1
+    assert "does not include the time column" in warnings[0]
+
+
+def test_sync_compression_policies_warns(session: Session, caplog):
+    """Test sync_compression_policies logs poorly compressing settings"""
+    with caplog.at_level(logging.WARNING, logger="timescaledb.compression.sync"):
+        sync_compression_policies(session, SimpleCompressionWithOrderby)
+
+    assert "does not include the time column" in caplog.text
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timescaledb.compression import (
+    ChunkCompressionResult,
+    ChunkCompressionStats,
+    HypertableCompressionStats,
+    compress_chunks,
+    decompress_chunks,
+    get_chunk_compression_stats,
+    get_hypertable_compression_stats,
+)
+from timescaledb.hypertables.chunks import list_chunks
+
+from .conftest import Metric, VideoView
+
+
+def _add_video_views(session: Session, weeks: int = 4):
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    views = [
+        VideoView(
+            video_id=hour % 3,
+            duration=hour,
+            time=base_time + timedelta(hours=hour),
+        )
+        for hour in range(0, weeks * 7 * 24, 6)
+    ]
+    session.add_all(views)
+    session.commit()
+
+
+def test_compress_and_decompress_chunks(session: Session, engine: Engine):
+    """Test compressing chunks in parallel and decompressing them again"""
+    _add_video_views(session)
+    total_chunks = len(list_chunks(session, model=VideoView))
+
+    progress_calls = []
+    results = compress_chunks(
+        engine,
+        VideoView,
+        older_than="1 day",
+        workers=2,
+        progress=lambda result, done, total: progress_calls.append((done, total)),
+    )
+
+    assert len(results) == total_chunks
+    assert all(isinstance(result, ChunkCompressionResult) for result in results)
+    assert all(result.succeeded for result in results)
+    assert all(result.duration_seconds >= 0 for result in results)
+    assert all(result.before_bytes and result.after_bytes for result in results)
+    assert progress_calls[-1] == (total_chunks, total_chunks)
+
+    assert all(chunk.is_compressed for chunk in list_chunks(session, model=VideoView))
+
+    # Compressing again is a no-op, every chunk is already compressed
+    assert compress_chunks(engine, VideoView, older_than="1 day") == []
+
+    results = decompress_chunks(session, VideoView, older_than="1 day", workers=2)
+    assert len(results) == total_chunks
+    assert all(result.action == "decompress" for result in results)
+    assert not any(
+        chunk.is_compressed for chunk in list_chunks(session, model=VideoView)
+    )
+
+
+def test_compress_chunks_requires_compression(engine: Engine):
+    """Test compress_chunks fails early when compression is not enabled"""
+    with pytest.raises(ValueError, match="Compression is not enabled"):
+        compress_chunks(engine, Metric, older_than="1 day")
+
+    with pytest.raises(ValueError, match="model or table_name is required"):
+        compress_chunks(engine)
+
+
+def test_compression_stats(session: Session, engine: Engine):
+    """Test hypertable and chunk compression stats report sizes and ratios"""
+    _add_video_views(session)
+    compress_chunks(engine, VideoView, older_than="1 day")
+
+    stats = get_hypertable_compression_stats(session, VideoView)
+    assert isinstance(stats, HypertableCompressionStats)
+    assert stats.hypertable_name == VideoView.__tablename__
+    assert stats.number_compressed_chunks == stats.total_chunks
+    assert stats.before_compression_total_bytes > 0
+    assert stats.after_compression_total_bytes > 0
+    assert stats.compression_ratio == (
+        stats.before_compression_total_bytes / stats.after_compression_total_bytes
+    )
+
+    chunk_stats = get_chunk_compression_stats(
+        session, table_name=VideoView.__tablename__
+    )
+    assert len(chunk_stats) == stats.total_chunks
+    assert all(isinstance(chunk, ChunkCompressionStats) for chunk in chunk_stats)
+    assert all(chunk.is_compressed for chunk in chunk_stats)
+    assert all(chunk.compression_ratio is not None for chunk in chunk_stats)
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timescaledb.compression import (
+    CompressionMigrationResult,
+    compress_chunks,
+    get_compression_settings,
+    get_outdated_compressed_chunks,
+    migrate_compression_settings,
+)
+from timescaledb.compression.migrate import _normalize_orderby, _normalize_segmentby
+
+from .conftest import VideoView
+
+
+def _add_compressed_video_views(session: Session, engine: Engine) -> int:
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    views = [
+        VideoView(
+            video_id=hour % 3,
+            duration=hour,
+            time=base_time + timedelta(hours=hour),
+        )
+        for hour in range(0, 3 * 7 * 24, 6)
+    ]
+    session.add_all(views)
+    session.commit()
+    return len(compress_chunks(engine, VideoView, older_than="1 day"))
+
+
+def test_normalize_compression_settings():
+    """Test equivalent spellings of settings compare equal"""
+    assert _normalize_orderby('"time" DESC') == _normalize_orderby("time DESC")
+    assert _normalize_orderby("time DESC") == _normalize_orderby(
+        "time DESC NULLS FIRST"
+    )
+    assert _normalize_orderby("time") == _normalize_orderby("time ASC NULLS LAST")
+    assert _normalize_orderby("time DESC") != _normalize_orderby("time ASC")
+    assert _normalize_segmentby("video_id, duration") == ("video_id", "duration")
+    assert _normalize_segmentby(None) == ()
+
+
+def test_migrate_compression_settings(session: Session, engine: Engine):
+    """Test changed settings are applied and compressed chunks recompressed"""
+    compressed = _add_compressed_video_views(session, engine)
+    assert compressed > 1
+
+    # Declared settings match the table, nothing to migrate
+    result = migrate_compression_settings(engine, VideoView, pause_seconds=0)
+    assert not result.settings_changed
+    assert result.chunks == []
+    assert result.completed
+
+    dry_run = migrate_compression_settings(
+        engine, VideoView, compress_orderby="time ASC", dry_run=True
+    )
+    assert dry_run.settings_changed
+    assert len(dry_run.remaining_chunks) == compressed
+    assert "DESC" in get_compression_settings(session, VideoView).orderby
+
+    progress_calls = []
+    result = migrate_compression_settings(
+        engine,
+        VideoView,
+        compress_orderby="time ASC",
+        batch_size=1,
+        pause_seconds=0,
+        progress=lambda result, done, total: progress_calls.append((done, total)),
+    )
+
+    assert isinstance(result, CompressionMigrationResult)
+    assert result.settings_changed
+    assert result.completed
+    assert len(result.chunks) == compressed
+    assert all(chunk.succeeded for chunk in result.chunks)
+    assert all(chunk.action == "recompress" for chunk in result.chunks)
+    assert progress_calls[-1] == (compressed, compressed)
+    assert "DESC" not in get_compression_settings(session, VideoView).orderby
+    assert get_outdated_compressed_chunks(session, VideoView) == []
+
+    # Running again resumes from the catalog state, nothing is left to do
+    result = migrate_compression_settings(
+        engine, VideoView, compress_orderby="time ASC", pause_seconds=0
+    )
+    assert not result.settings_changed
+    assert result.chunks == []
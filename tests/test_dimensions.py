@@ -0,0 +1,60 @@
+from sqlmodel import Session
+
+from timescaledb.hypertables import (
+    DimensionSchema,
+    list_dimensions,
+    sync_all_hypertables,
+    sync_partition_dimensions,
+)
+from timescaledb.hypertables.extractors import extract_model_hypertable_params
+from timescaledb.hypertables.schemas import HypertableCreateSchema
+
+from .conftest import DeviceReading, Metric
+
+
+def test_hash_dimension_sql():
+    """Test __partition_by__ is emitted as add_dimension(by_hash(...))"""
+    schema = HypertableCreateSchema(**extract_model_hypertable_params(DeviceReading))
+
+    [query] = schema.to_dimension_sql_queries()
+    assert "add_dimension" in query
+    assert "by_hash('device_id', 4)" in query
+    assert "by_hash" not in schema.to_sql_query()
+
+
+def test_hash_dimension_created(session: Session):
+    """Test the hypertable is created with the declared hash dimension"""
+    dimensions = list_dimensions(session, DeviceReading)
+
+    assert all(isinstance(dimension, DimensionSchema) for dimension in dimensions)
+    assert [(d.column_name, d.dimension_type) for d in dimensions] == [
+        ("time", "Time"),
+        ("device_id", "Space"),
+    ]
+    assert dimensions[1].num_partitions == 4
+    assert len(list_dimensions(session, Metric)) == 1
+
+
+def test_sync_partition_dimensions(session: Session, monkeypatch):
+    """Test changed partition counts are applied to the existing hypertable"""
+    monkeypatch.setattr(DeviceReading, "__partition_by__", ("device_id", 8))
+
+    assert sync_partition_dimensions(session, DeviceReading) == []
+    assert list_dimensions(session, DeviceReading)[1].num_partitions == 8
+
+    # Dimensions cannot be removed, that is reported
+    monkeypatch.setattr(DeviceReading, "__partition_by__", None)
+    warnings = sync_partition_dimensions(session, DeviceReading)
+    assert len(warnings) == 1
+    assert "device_id" in warnings[0]
+
+
+def test_sync_all_hypertables_adds_dimension(session: Session, monkeypatch):
+    """Test the sync adds a newly declared dimension to an empty hypertable"""
+    # id is part of Metric's primary key (id, time), sensor_id is not
+    monkeypatch.setattr(Metric, "__partition_by__", ("id", 2))
+
+    sync_all_hypertables(session, Metric)
+
+    dimensions = list_dimensions(session, Metric)
+    assert [(d.column_name, d.num_partitions) for d in dimensions][1:] == [("id", 2)]
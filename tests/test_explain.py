@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session, select
+
+from timescaledb import time_bucket_query
+from timescaledb.explain import (
+    ExplainReport,
+    disable_auto_explain,
+    enable_auto_explain,
+    explain_query,
+    explaining,
+    parse_explain,
+)
+from timescaledb.testing import assert_excludes_chunks
+
+from .conftest import Metric
+
+EXPLAIN_OUTPUT = [
+    {
+        "Plan": {
+            "Node Type": "Custom Scan",
+            "Custom Plan Provider": "ChunkAppend",
+            "Chunks excluded during startup": 2,
+            "Shared Hit Blocks": 30,
+            "Shared Read Blocks": 10,
+            "Plans": [
+                {
+                    "Node Type": "Custom Scan",
+                    "Custom Plan Provider": "DecompressChunk",
+                    "Relation Name": "_hyper_1_1_chunk",
+                    "Actual Loops": 1,
+                    "Plans": [
+                        {
+                            "Node Type": "Seq Scan",
+                            "Relation Name": "compress_hyper_2_3_chunk",
+                            "Actual Loops": 1,
+                        }
+                    ],
+                },
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "_hyper_1_2_chunk",
+                    "Actual Loops": 1,
+                },
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "_hyper_1_4_chunk",
+                    "Actual Loops": 0,
+                },
+            ],
+        },
+        "Planning Time": 0.5,
+        "Execution Time": 1.25,
+    }
+]
+
+
+def test_parse_explain():
+    """Test scanned, decompressed and excluded chunks are read from the plan"""
+    report = parse_explain(EXPLAIN_OUTPUT, statement="SELECT 1")
+    report.total_chunks = 5
+
+    assert isinstance(report, ExplainReport)
+    assert report.planned_chunks == [
+        "_hyper_1_1_chunk",
+        "_hyper_1_2_chunk",
+        "_hyper_1_4_chunk",
+    ]
+    assert report.scanned_chunks == ["_hyper_1_1_chunk", "_hyper_1_2_chunk"]
+    assert report.decompressed_chunks == ["_hyper_1_1_chunk"]
+    assert report.decompressed
+    assert report.excluded_chunks == 3
+    assert report.excluded_at_startup == 2
+    assert report.buffer_hit_ratio == 0.75
+    assert report.execution_time == 1.25
+    assert "2/5 chunks" in report.summary()
+
+
+def _add_metrics(session: Session, weeks: int) -> datetime:
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    session.add_all(
+        Metric(sensor_id=1, value=float(day), time=base_time + timedelta(days=day))
+        for day in range(weeks * 7)
+    )
+    session.commit()
+    return base_time
+
+
+def test_explain_query(session: Session):
+    """Test a time range predicate excludes the chunks outside of it"""
+    base_time = _add_metrics(session, weeks=4)
+    query = select(Metric).where(Metric.time >= base_time + timedelta(days=21))
+
+    report = explain_query(session, query, model=Metric)
+    assert report.total_chunks >= 4
+    assert 0 < len(report.scanned_chunks) < report.total_chunks
+    assert report.execution_time is not None
+
+    assert_excludes_chunks(session, query, model=Metric, max_scanned=2)
+    with pytest.raises(AssertionError):
+        assert_excludes_chunks(session, select(Metric), model=Metric)
+
+
+def test_explain_query_helpers(session: Session):
+    """Test query helper calls are explained on demand and over the threshold"""
+    base_time = _add_metrics(session, weeks=4)
+
+    def recent_buckets():
+        return time_bucket_query(
+            session,
+            Metric,
+            interval="1 day",
+            metric_field="value",
+            filters=[Metric.time >= base_time + timedelta(days=21)],
+        )
+
+    with explaining() as reports:
+        rows = recent_buckets()
+    assert len(rows) == 7
+    assert reports[0].operation == "time_bucket_query"
+    assert reports[0].hypertable_name == Metric.__tablename__
+
+    assert_excludes_chunks(session, recent_buckets)
+
+    slow = []
+    enable_auto_explain(threshold=0, callback=slow.append)
+    try:
+        recent_buckets()
+    finally:
+        disable_auto_explain()
+    recent_buckets()
+    assert len(slow) == 1
+    assert slow[0].duration is not None
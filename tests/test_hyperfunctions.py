@@ -1,8 +1,21 @@
 from datetime import datetime, timezone
 
+import pytest
+from sqlalchemy import column
 from sqlalchemy.sql.functions import FunctionElement
 
-from timescaledb.hyperfunctions import time_bucket, time_bucket_gapfill
+from timescaledb.hyperfunctions import (
+    average,
+    counter_agg,
+    delta,
+    extrapolated_rate,
+    first,
+    last,
+    rate,
+    time_bucket,
+    time_bucket_gapfill,
+    time_weight,
+)
 
 
 def test_time_bucket_basic():
@@ -82,3 +95,46 @@ def test_time_bucket_gapfill_with_timezone():
     compiled = bucket.compile().string
     assert "time_bucket_gapfill" in compiled
     assert "UTC" in compiled
+
+
+def test_first_and_last():
+    """Test first/last builders reference both the value and the time column."""
+    value = column("price")
+    ts = column("time")
+
+    compiled_first = first(value, ts).compile().string
+    compiled_last = last(value, ts).compile().string
+    assert compiled_first == "first(price, time)"
+    assert compiled_last == "last(price, time)"
+
+
+def test_counter_agg_accessors():
+    """Test counter_agg accessors wrap the same summary."""
+    summary = counter_agg(column("time"), column("requests"))
+
+    assert rate(summary).compile().string == "rate(counter_agg(time, requests))"
+    assert delta(summary).compile().string == "delta(counter_agg(time, requests))"
+
+
+def test_extrapolated_rate_with_bounds():
+    """Test extrapolated_rate uses a bounded counter_agg and a valid method."""
+    summary = counter_agg(column("time"), column("requests"), column("bounds"))
+
+    compiled = extrapolated_rate(summary).compile()
+    assert "extrapolated_rate(counter_agg(time, requests, bounds)" in compiled.string
+    assert "prometheus" in compiled.params.values()
+
+    with pytest.raises(ValueError, match="Invalid extrapolation method"):
+        extrapolated_rate(summary, method="linear")
+
+
+def test_time_weight_average():
+    """Test time_weight with average accessor."""
+    summary = time_weight("LOCF", column("time"), column("temp"))
+
+    compiled = average(summary).compile()
+    assert compiled.string.startswith("average(time_weight(")
+    assert "LOCF" in compiled.params.values()
+
+    with pytest.raises(ValueError, match="Invalid time weight method"):
+        time_weight("Cubic", column("time"), column("temp"))
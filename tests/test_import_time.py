@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+import timescaledb
+
+# Generous budget for `import timescaledb` alone (microseconds), it only has to
+# catch a subsystem being imported eagerly again
+IMPORT_BUDGET_US = 50_000
+
+
+def _import_times(statement: str) -> dict:
+    """Run a statement in a fresh interpreter and parse -X importtime output"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        try:
+            times[module.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return times
+
+
+def test_import_is_lazy():
+    """Test importing the package does not load its dependencies"""
+    times = _import_times("import timescaledb")
+    assert "timescaledb" in times
+    for dependency in ("sqlalchemy", "sqlmodel", "pydantic", "fastapi"):
+        assert dependency not in times
+    assert times["timescaledb"] < IMPORT_BUDGET_US
+
+
+def test_lazy_attributes():
+    """Test every public name resolves and submodules load on attribute access"""
+    for name in timescaledb.__all__:
+        assert getattr(timescaledb, name) is not None
+    assert "TimescaleModel" in dir(timescaledb)
+    assert timescaledb.metadata.create_all is not None
+    assert timescaledb.defaults.TIME_COLUMN == "time"
+    assert timescaledb.queries.time_bucket_query is timescaledb.time_bucket_query
+    assert timescaledb.hypertables.list_hypertables is not None
+    assert timescaledb.hyperfunctions.time_bucket is not None
+    with pytest.raises(AttributeError):
+        getattr(timescaledb, "not_a_submodule")
+
+    # Only the accessed subsystem is loaded
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from timescaledb import time_bucket_query; "
+            "print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert "timescaledb.queries" in loaded
+    assert "timescaledb.compression" not in loaded
+    assert "fastapi" not in loaded
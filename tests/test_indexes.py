@@ -0,0 +1,147 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+import pytest
+import sqlalchemy
+from sqlmodel import Field, Session, SQLModel
+
+from timescaledb.exceptions import InvalidTimeSeriesIndex
+from timescaledb.indexes import (
+    TimeSeriesIndex,
+    brin_index,
+    check_index_patterns,
+    composite_index,
+    create_time_series_indexes,
+    partial_index,
+    sync_time_series_indexes,
+)
+from timescaledb.indexes.sql import format_create_index_sql
+from timescaledb.indexes.validators import (
+    validate_time_series_index,
+    validate_time_series_indexes,
+)
+
+from .conftest import DeviceReading, Metric
+
+
+class FloatIndexReading(SQLModel, table=True):
+    """Model with an index on a measurement column"""
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    time: datetime
+    value: float = Field(index=True)
+
+
+def test_format_create_index_sql():
+    """Test index specs are rendered as CREATE INDEX statements"""
+    sql = format_create_index_sql("metrics", composite_index("sensor_id"))
+    assert sql == (
+        'CREATE INDEX IF NOT EXISTS "ix_metrics_sensor_id_time" ON "metrics" '
+        'USING btree ("sensor_id", "time" DESC);'
+    )
+
+    sql = format_create_index_sql("metrics", brin_index(pages_per_range=16))
+    assert 'USING brin ("time") WITH (pages_per_range = 16)' in sql
+
+    sql = format_create_index_sql(
+        "metrics", partial_index("sensor_id", where="value > 100")
+    )
+    assert '"ix_metrics_sensor_id_partial_' in sql
+    assert sql.endswith("WHERE value > 100;")
+
+
+def test_invalid_time_series_index():
+    """Test invalid index declarations are rejected"""
+    with pytest.raises(ValueError, match="Invalid index method"):
+        TimeSeriesIndex(columns=("time",), method="gin")
+    with pytest.raises(ValueError, match="Invalid index column"):
+        TimeSeriesIndex(columns=("time DOWN",))
+    with pytest.raises(InvalidTimeSeriesIndex, match="not found"):
+        validate_time_series_index(Metric, composite_index("device_id"))
+    with pytest.raises(InvalidTimeSeriesIndex, match="must include the time column"):
+        validate_time_series_index(
+            Metric, TimeSeriesIndex(columns=("sensor_id",), unique=True)
+        )
+    with pytest.raises(InvalidTimeSeriesIndex, match="partition column"):
+        validate_time_series_index(
+            DeviceReading, TimeSeriesIndex(columns=("time",), unique=True)
+        )
+    validate_time_series_index(
+        DeviceReading, TimeSeriesIndex(columns=("device_id", "time"), unique=True)
+    )
+
+
+def test_partial_index_names():
+    """Test partial indexes on the same columns get distinct, stable names"""
+    errors = partial_index("device_id", where="reading < 0")
+    high = partial_index("device_id", where="reading > 10")
+    assert errors.get_name("metrics") != high.get_name("metrics")
+    assert errors.get_name("metrics") == partial_index(
+        "device_id", where="reading  <  0"
+    ).get_name("metrics")
+    assert errors.get_name("metrics").startswith("ix_metrics_device_id_partial_")
+    assert composite_index("device_id").get_name("metrics") != TimeSeriesIndex(
+        columns=("device_id", "time DESC"), include=("reading",)
+    ).get_name("metrics")
+
+    validate_time_series_indexes(DeviceReading, [errors, high])
+    with pytest.raises(InvalidTimeSeriesIndex, match="are both named"):
+        validate_time_series_indexes(DeviceReading, [high, high])
+
+
+def test_check_index_patterns():
+    """Test warnings for index patterns that hurt ingest"""
+    [warning] = check_index_patterns(FloatIndexReading)
+    assert "measurement column value" in warning
+
+    warnings = check_index_patterns(
+        Metric, [TimeSeriesIndex(columns=("time DESC", "sensor_id"))]
+    )
+    assert len(warnings) == 1
+    assert "leads with the time column" in warnings[0]
+
+    [warning] = check_index_patterns(Metric, [brin_index("sensor_id")])
+    assert "BRIN only helps" in warning
+
+    assert check_index_patterns(Metric) == []
+
+
+def test_time_series_indexes_created(session: Session):
+    """Test declared indexes are created with the hypertable"""
+    index_names = session.execute(
+        sqlalchemy.text("SELECT indexname FROM pg_indexes WHERE tablename = :name"),
+        {"name": DeviceReading.__tablename__},
+    ).scalars()
+
+    assert {"ix_devicereading_device_id_time", "ix_devicereading_time_brin"} <= set(
+        index_names
+    )
+    # Already created, nothing left to do
+    assert create_time_series_indexes(session, DeviceReading) == []
+
+
+def test_partial_indexes_on_same_column_created(session: Session):
+    """Test two partial indexes on the same column are both created"""
+    indexes = [
+        partial_index("device_id", where="reading < 0"),
+        partial_index("device_id", where="reading > 10"),
+    ]
+    created = create_time_series_indexes(session, DeviceReading, indexes=indexes)
+
+    index_names = session.execute(
+        sqlalchemy.text("SELECT indexname FROM pg_indexes WHERE tablename = :name"),
+        {"name": DeviceReading.__tablename__},
+    ).scalars()
+    expected = {index.get_name(DeviceReading.__tablename__) for index in indexes}
+    assert len(expected) == 2
+    assert set(created) == expected
+    assert expected <= set(index_names)
+
+
+def test_sync_time_series_indexes_warns(session: Session, caplog):
+    """Test the sync reports the single-column index made redundant"""
+    with caplog.at_level(logging.WARNING, logger="timescaledb.indexes.sync"):
+        sync_time_series_indexes(session, DeviceReading)
+
+    assert "ix_devicereading_device_id is redundant" in caplog.text
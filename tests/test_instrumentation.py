@@ -0,0 +1,151 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import sqlalchemy
+from sqlmodel import Session
+
+from timescaledb import time_bucket_query
+from timescaledb.instrumentation import (
+    HistogramCollector,
+    LoggingListener,
+    QueryEvent,
+    fingerprint_sql,
+    instrumented,
+    listening,
+    mark_phase,
+    normalize_sql,
+)
+
+from .conftest import Metric
+
+
+@instrumented("example_operation")
+def _example(session, model=None, table_name=None, rows=3, fail=False):
+    mark_phase("build")
+    if fail:
+        raise ValueError("failed")
+    return list(range(rows))
+
+
+def test_normalize_sql():
+    """Test literals and parameters are replaced so calls group together"""
+    first = "SELECT * FROM metric WHERE sensor_id = 1 AND time > '2024-01-01'"
+    second = "SELECT *  FROM metric\nWHERE sensor_id = 42 AND time > '2025-06-01'"
+    assert normalize_sql(first) == (
+        "SELECT * FROM metric WHERE sensor_id = ? AND time > ?"
+    )
+    assert fingerprint_sql(first) == fingerprint_sql(second)
+    assert normalize_sql("SELECT %(param_1)s::interval, col1") == (
+        "SELECT ?::interval, col1"
+    )
+    assert fingerprint_sql("SELECT 1 FROM a") != fingerprint_sql("SELECT 1 FROM b")
+
+
+def test_instrumented_events():
+    """Test instrumented calls report their operation, model and rows"""
+    events = []
+    with listening(events.append):
+        _example(None, table_name="metric", rows=5)
+        with pytest.raises(ValueError):
+            _example(None, Metric, fail=True)
+    _example(None)
+
+    assert len(events) == 2
+    assert isinstance(events[0], QueryEvent)
+    assert events[0].operation == "example_operation"
+    assert events[0].model == "metric"
+    assert events[0].row_count == 5
+    assert events[0].duration >= events[0].build
+    assert events[1].model == Metric.__tablename__
+    assert "failed" in events[1].error
+
+
+def test_failing_listener_does_not_break_calls():
+    """Test errors in listeners are logged instead of raised"""
+
+    def broken(event):
+        raise RuntimeError("listener bug")
+
+    with listening(broken):
+        assert _example(None) == [0, 1, 2]
+
+
+@instrumented("raw_statement")
+def _run_statement(connection, statement):
+    return connection.exec_driver_sql(statement).fetchall()
+
+
+def test_cursor_timing_with_failing_statement():
+    """Test failed statements leave no timing state on the connection"""
+    engine = sqlalchemy.create_engine("sqlite://")
+    events = []
+    with listening(events.append), engine.connect() as connection:
+        with pytest.raises(sqlalchemy.exc.OperationalError):
+            _run_statement(connection, "SELECT * FROM missing_table")
+        assert _run_statement(connection, "SELECT 1") == [(1,)]
+        assert not connection.info
+
+    assert "missing_table" in events[0].error
+    assert events[1].statement_count == 1
+    assert 0 < events[1].execute <= events[1].duration
+    engine.dispose()
+
+
+def test_histogram_collector():
+    """Test durations are bucketed cumulatively per operation"""
+    collector = HistogramCollector(buckets=(0.1, 1.0))
+    for duration in (0.05, 0.5, 5.0):
+        collector(
+            QueryEvent(operation="query", duration=duration, execute=duration / 2)
+        )
+    collector(QueryEvent(operation="sync", duration=0.01, error="boom"))
+
+    snapshot = collector.snapshot()
+    histogram = snapshot["query"]
+    assert histogram.count == 3
+    assert histogram.buckets == {0.1: 1, 1.0: 2}
+    assert histogram.duration_sum == pytest.approx(5.55)
+    assert histogram.phase_sums["execute"] == pytest.approx(2.775)
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(0.99) is None
+    assert snapshot["sync"].errors == 1
+
+    collector.reset()
+    assert collector.snapshot() == {}
+
+
+def test_logging_listener(caplog):
+    """Test the logging adapter only logs slow calls when given a threshold"""
+    listener = LoggingListener(slow_threshold=1.0)
+    with caplog.at_level(logging.DEBUG, logger="timescaledb.instrumentation"):
+        listener(QueryEvent(operation="fast", duration=0.1))
+        listener(QueryEvent(operation="slow", model="metric", duration=2.0))
+    assert "fast" not in caplog.text
+    assert "slow on metric took 2000.0ms" in caplog.text
+
+
+def test_time_bucket_query_events(session: Session):
+    """Test queries report their phases, rows and statement fingerprint"""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    session.add_all(
+        Metric(sensor_id=1, value=float(i), time=base_time + timedelta(hours=i))
+        for i in range(3)
+    )
+    session.commit()
+
+    collector = HistogramCollector()
+    events = []
+    with listening(events.append), listening(collector):
+        time_bucket_query(session, Metric, interval="1 hour", metric_field="value")
+        time_bucket_query(session, Metric, interval="1 day", metric_field="value")
+
+    event = events[0]
+    assert event.operation == "time_bucket_query"
+    assert event.model == Metric.__tablename__
+    assert event.row_count == 3
+    assert event.statement_count == 1
+    assert event.execute > 0
+    assert event.build + event.compile + event.execute + event.fetch <= (event.duration)
+    assert events[1].fingerprint == event.fingerprint
+    assert collector.snapshot()["time_bucket_query"].count == 2
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timescaledb.jobs import (
+    JobSchema,
+    JobsHealthSummary,
+    alter_job,
+    get_job,
+    get_jobs_health,
+    list_job_errors,
+    list_jobs,
+    run_job,
+    summarize_jobs,
+)
+from timescaledb.jobs.sql import format_alter_job_sql
+
+from .conftest import RetentionModel
+
+
+def test_format_alter_job_sql():
+    """Test only the given settings are passed to alter_job"""
+    query, params = format_alter_job_sql(
+        1000, schedule_interval="1 hour", scheduled=False, max_retries=None
+    )
+    assert "schedule_interval => CAST(:schedule_interval AS INTERVAL)" in query
+    assert "scheduled => CAST(:scheduled AS BOOLEAN)" in query
+    assert "max_retries" not in query
+    assert params == {"job_id": 1000, "schedule_interval": "1 hour", "scheduled": False}
+
+    with pytest.raises(ValueError):
+        format_alter_job_sql(1000)
+
+
+def test_summarize_jobs():
+    """Test failing, overdue and never succeeded jobs are reported"""
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    jobs = [
+        JobSchema(
+            job_id=1,
+            scheduled=True,
+            last_run_status="Success",
+            last_successful_finish=now - timedelta(hours=2),
+            next_start=now + timedelta(hours=1),
+            total_runs=3,
+            total_failures=0,
+        ),
+        JobSchema(
+            job_id=2,
+            scheduled=True,
+            last_run_status="Failed",
+            next_start=now - timedelta(hours=1),
+            total_runs=2,
+            total_failures=2,
+        ),
+        JobSchema(job_id=3, scheduled=False, next_start=now - timedelta(days=1)),
+    ]
+    summary = summarize_jobs(jobs, now=now)
+    assert isinstance(summary, JobsHealthSummary)
+    assert summary.total_jobs == 3
+    assert summary.scheduled_jobs == 2
+    assert summary.failing_job_ids == [2]
+    assert summary.overdue_job_ids == [2]
+    assert summary.never_succeeded_job_ids == [2]
+    assert summary.total_failures == 2
+    assert summary.oldest_success == now - timedelta(hours=2)
+    assert not summary.healthy
+
+
+def test_list_jobs(session: Session):
+    """Test policy jobs are listed and mapped back to their models"""
+    jobs = list_jobs(session, RetentionModel)
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job.proc_name == "policy_retention"
+    assert job.target_name == RetentionModel.__tablename__
+    assert job.model is RetentionModel
+    assert get_job(session, job.job_id).model is RetentionModel
+
+    assert {job.proc_name for job in list_jobs(session)} >= {"policy_retention"}
+    assert list_jobs(session, proc_names=["policy_does_not_exist"]) == []
+
+
+def test_alter_and_run_job(session: Session, engine: Engine):
+    """Test pausing, rescheduling and running a job"""
+    job = list_jobs(session, RetentionModel)[0]
+
+    altered = alter_job(
+        session, job.job_id, schedule_interval=timedelta(hours=6), scheduled=False
+    )
+    assert altered.schedule_interval == timedelta(hours=6)
+    assert not altered.scheduled
+
+    run_job(engine, job.job_id)
+    session.expire_all()
+    ran = get_job(session, job.job_id)
+    assert ran.total_runs >= 1
+    assert ran.last_run_status == "Success"
+    assert not ran.failed
+    assert list_job_errors(session, job.job_id) == []
+
+    health = get_jobs_health(session)
+    assert job.job_id not in health.failing_job_ids
+    assert health.total_jobs >= 1
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session
+
+from timescaledb import queries
+from timescaledb.latest import LatestValueCache
+from timescaledb.queries import latest_per_series
+from timescaledb.utils import get_utc_now
+
+from .conftest import DeviceReading
+
+
+def test_latest_per_series(session: Session):
+    """Test the newest row of every device inside the lookback is returned"""
+    now = get_utc_now()
+    session.add_all(
+        DeviceReading(
+            device_id=device_id, reading=float(i), time=now - timedelta(hours=i)
+        )
+        for device_id in range(3)
+        for i in range(5)
+    )
+    # Only has rows older than the lookback
+    session.add(DeviceReading(device_id=9, reading=1.0, time=now - timedelta(days=3)))
+    session.commit()
+
+    rows = latest_per_series(
+        session, DeviceReading, series_field="device_id", lookback=timedelta(days=1)
+    )
+    assert [row["device_id"] for row in rows] == [0, 1, 2]
+    assert all(row["reading"] == 0.0 for row in rows)
+    assert set(rows[0].keys()) == {"device_id", "time", "id", "reading"}
+
+    rows = latest_per_series(
+        session,
+        DeviceReading,
+        series_field="device_id",
+        value_fields="reading",
+        lookback=None,
+        filters=[DeviceReading.reading > 0],
+    )
+    assert [(row["device_id"], row["reading"]) for row in rows] == [
+        (0, 1.0),
+        (1, 1.0),
+        (2, 1.0),
+        (9, 1.0),
+    ]
+
+    with pytest.raises(ValueError):
+        latest_per_series(session, DeviceReading, lookback=timedelta(0))
+
+
+def test_latest_per_series_naive_since(monkeypatch):
+    """Test a naive since is taken as UTC, with and without a lookback"""
+    built = []
+    monkeypatch.setattr(
+        queries,
+        "_fetch_mappings",
+        lambda session, query, model, operation: built.append(query) or [],
+    )
+    since = datetime.now() - timedelta(hours=1)
+    aware_since = since.replace(tzinfo=timezone.utc)
+
+    latest_per_series(None, DeviceReading, since=since, lookback=timedelta(days=1))
+    latest_per_series(None, DeviceReading, since=since, lookback=None)
+
+    for query in built:
+        [bound] = query.compile().params.values()
+        assert bound == aware_since
+
+
+def test_latest_value_cache(session: Session):
+    """Test the cache picks up new rows incrementally and drops stale series"""
+    now = get_utc_now()
+    session.add_all(
+        DeviceReading(device_id=device_id, reading=1.0, time=now - timedelta(minutes=5))
+        for device_id in range(3)
+    )
+    session.commit()
+
+    cache = LatestValueCache(
+        session, DeviceReading, series_field="device_id", refresh_seconds=60
+    )
+    assert sorted(cache.get()) == [0, 1, 2]
+    assert cache.get_series(1)["reading"] == 1.0
+
+    session.add(DeviceReading(device_id=1, reading=2.0, time=now))
+    session.add(DeviceReading(device_id=3, reading=3.0, time=now))
+    session.commit()
+    # Served from the cache until it is refreshed
+    assert cache.get_series(1)["reading"] == 1.0
+    assert cache.refresh() == 2
+    assert cache.get_series(1)["reading"] == 2.0
+    assert cache.get_series(3)["reading"] == 3.0
+    assert cache.refresh() == 0
+
+    # Late rows of other devices, within the grace window
+    session.add(
+        DeviceReading(device_id=2, reading=2.5, time=now - timedelta(minutes=1))
+    )
+    session.add(
+        DeviceReading(device_id=5, reading=5.0, time=now - timedelta(minutes=2))
+    )
+    session.commit()
+    assert cache.refresh() == 2
+    assert cache.get_series(2)["reading"] == 2.5
+    assert cache.get_series(5)["reading"] == 5.0
+
+    # A late row older than a cached one does not replace it
+    session.add(
+        DeviceReading(device_id=1, reading=1.5, time=now - timedelta(minutes=1))
+    )
+    session.commit()
+    assert cache.refresh() == 0
+    assert cache.get_series(1)["reading"] == 2.0
+
+    # Backfilled further back than the grace window, only seen after a reload
+    session.add(DeviceReading(device_id=4, reading=4.0, time=now - timedelta(hours=1)))
+    session.commit()
+    cache.refresh()
+    assert cache.get_series(4) is None
+    cache.reload()
+    assert cache.get_series(4)["reading"] == 4.0
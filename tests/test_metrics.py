@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timescaledb.compression import compress_chunks
+from timescaledb.metrics import (
+    HypertableMetrics,
+    MetricsCollector,
+    MetricsSnapshot,
+    collect_hypertable_metrics,
+    render_prometheus,
+)
+
+from .conftest import Metric, VideoView
+
+
+def test_render_prometheus():
+    """Test gauges are rendered with escaped labels and missing values skipped"""
+    snapshot = MetricsSnapshot(
+        collected_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        collect_seconds=0.25,
+        hypertables=[
+            HypertableMetrics(
+                hypertable_schema="public",
+                hypertable_name='odd"name',
+                num_chunks=3,
+                total_bytes=8192,
+                before_compression_total_bytes=1000,
+                after_compression_total_bytes=100,
+            ),
+            HypertableMetrics(
+                hypertable_schema="public", hypertable_name="metric", num_chunks=0
+            ),
+        ],
+    )
+    text = render_prometheus(snapshot)
+
+    assert "# TYPE timescaledb_hypertable_chunks gauge" in text
+    assert (
+        'timescaledb_hypertable_total_bytes{schema="public",hypertable="odd\\"name"} '
+        "8192" in text
+    )
+    assert 'timescaledb_hypertable_chunks{schema="public",hypertable="metric"} 0' in (
+        text
+    )
+    assert (
+        'timescaledb_hypertable_compression_ratio{schema="public",hypertable="odd\\"name"} 10'
+        in text
+    )
+    assert 'compression_ratio{schema="public",hypertable="metric"}' not in text
+    assert "timescaledb_hypertable_ingest_rows_per_second" not in text
+    assert "timescaledb_metrics_collect_seconds 0.25" in text
+    assert text.endswith("\n")
+
+
+def test_collect_hypertable_metrics(session: Session, engine: Engine):
+    """Test sizes, chunks, compression and jobs are collected per hypertable"""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    session.add_all(
+        VideoView(video_id=1, duration=i, time=base_time + timedelta(days=i))
+        for i in range(21)
+    )
+    session.commit()
+    compressed = len(compress_chunks(engine, VideoView, older_than="1 day"))
+
+    metrics = collect_hypertable_metrics(session, models=[VideoView, Metric])
+    by_name = {m.hypertable_name: m for m in metrics}
+    assert set(by_name) == {VideoView.__tablename__, Metric.__tablename__}
+
+    video_views = by_name[VideoView.__tablename__]
+    assert video_views.num_chunks >= 3
+    assert video_views.compressed_chunks == compressed
+    assert video_views.total_bytes > 0
+    assert video_views.compression_ratio is not None
+    assert video_views.jobs >= 1
+    assert by_name[Metric.__tablename__].compression_ratio is None
+
+
+def test_metrics_collector_cache(engine: Engine):
+    """Test scrapes within the cache interval reuse the previous collection"""
+    collector = MetricsCollector(engine, cache_seconds=60, models=[Metric])
+    first = collector.collect()
+    assert collector.collect() is first
+    forced = collector.collect(force=True)
+    assert forced is not first
+    assert forced.hypertables[0].ingest_rows_per_second is not None
+    assert "timescaledb_hypertable_chunks" in collector.render()
+
+    with pytest.raises(ValueError):
+        MetricsCollector(engine, cache_seconds=-1)
+
+
+def test_metrics_router(engine: Engine):
+    """Test the FastAPI router serves the Prometheus text format"""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from timescaledb.metrics.router import create_metrics_router
+
+    app = FastAPI()
+    app.include_router(create_metrics_router(MetricsCollector(engine)))
+    response = TestClient(app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "timescaledb_metrics_collect_seconds" in response.text
@@ -0,0 +1,122 @@
+import base64
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlmodel import Session
+
+from timescaledb.exceptions import InvalidCursor
+from timescaledb.pagination import Cursor, decode_cursor, encode_cursor, paginate
+from timescaledb.pagination.paginate import decode_page_cursor
+
+from .conftest import Metric
+
+
+def test_cursor_round_trip():
+    """Test cursors decode to the values they were encoded from"""
+    cursors = [
+        Cursor(time=datetime(2024, 1, 1, 12, tzinfo=timezone.utc), key=42),
+        Cursor(time=1_700_000_000, key=uuid.uuid4(), direction="previous"),
+        Cursor(time=datetime(2024, 1, 1, tzinfo=timezone.utc), key=Decimal("1.5")),
+    ]
+    types = [(datetime, int), (int, uuid.UUID), (datetime, Decimal)]
+    for cursor, (time_type, key_type) in zip(cursors, types):
+        token = encode_cursor(cursor)
+        assert "=" not in token
+        assert decode_cursor(token, time_type=time_type, key_type=key_type) == cursor
+
+
+def test_invalid_cursor():
+    """Test tampered or foreign cursors are rejected"""
+    token = encode_cursor(Cursor(time=datetime(2024, 1, 1, tzinfo=timezone.utc), key=1))
+    for value in ["", "not a cursor", token[:-4], "W10", "WyJ4IiwxLDFd"]:
+        with pytest.raises(InvalidCursor):
+            decode_cursor(value, time_type=datetime, key_type=int)
+
+
+def _raw_cursor(payload: list) -> str:
+    data = json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def test_cursor_values_of_wrong_type():
+    """Test well-formed cursors whose values do not fit the model are rejected"""
+    token = _raw_cursor(["n", "yesterday", "abc"])
+    assert decode_cursor(token).time == "yesterday"
+    with pytest.raises(InvalidCursor):
+        decode_page_cursor(Metric, token)
+
+    token = _raw_cursor(["n", "2024-01-01T00:00:00+00:00", 7])
+    assert decode_page_cursor(Metric, token) == Cursor(
+        time=datetime(2024, 1, 1, tzinfo=timezone.utc), key=7
+    )
+
+
+def test_pagination_params_rejects_wrong_types():
+    """Test the FastAPI dependency answers 400 before paginate would fail"""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+
+    from timescaledb.pagination import PageParams
+    from timescaledb.pagination.dependencies import pagination_params
+
+    app = FastAPI()
+
+    @app.get("/metrics/")
+    def list_metrics(page: PageParams = Depends(pagination_params(Metric))):
+        return {"cursor": page.cursor, "limit": page.limit}
+
+    client = TestClient(app)
+    response = client.get(
+        "/metrics/", params={"cursor": _raw_cursor(["n", "yesterday", "abc"])}
+    )
+    assert response.status_code == 400
+    cursor = _raw_cursor(["n", "2024-01-01T00:00:00+00:00", 7])
+    response = client.get("/metrics/", params={"cursor": cursor, "limit": 5})
+    assert response.json() == {"cursor": cursor, "limit": 5}
+
+
+def test_paginate(session: Session):
+    """Test paging forward and back visits every row once, with time ties"""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Three rows per timestamp, so page boundaries fall between ties
+    session.add_all(
+        Metric(sensor_id=i, value=float(i), time=base_time + timedelta(hours=i // 3))
+        for i in range(25)
+    )
+    session.commit()
+
+    pages = [paginate(session, Metric, limit=4)]
+    assert pages[0].previous_cursor is None
+    while pages[-1].next_cursor:
+        pages.append(paginate(session, Metric, cursor=pages[-1].next_cursor, limit=4))
+    assert len(pages) == 7
+
+    rows = [row for page in pages for row in page.items]
+    assert len(rows) == 25
+    assert len({row.id for row in rows}) == 25
+    assert rows == sorted(rows, key=lambda row: (row.time, row.id), reverse=True)
+
+    # Walking back from the last page returns the same pages
+    page = pages[-1]
+    for expected in reversed(pages[:-1]):
+        page = paginate(session, Metric, cursor=page.previous_cursor, limit=4)
+        assert page.items == expected.items
+    assert page.previous_cursor is None
+
+    oldest_first = paginate(
+        session,
+        Metric,
+        order="asc",
+        limit=5,
+        start=base_time + timedelta(hours=2),
+        columns=["value"],
+    )
+    assert [row.value for row in oldest_first.items] == [6.0, 7.0, 8.0, 9.0, 10.0]
+
+    with pytest.raises(ValueError):
+        paginate(session, Metric, limit=0)
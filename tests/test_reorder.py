@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from timescaledb.exceptions import InvalidReorderIndex
+from timescaledb.reorder import (
+    ReorderPolicySchema,
+    add_reorder_policy,
+    drop_reorder_policy,
+    list_reorder_policies,
+    reorder_chunks,
+    sync_reorder_policies,
+)
+from timescaledb.reorder.validators import resolve_reorder_index
+
+from .conftest import DeviceReading, Metric
+
+
+def test_resolve_reorder_index():
+    """Test __reorder_index__ resolves columns to the index declared on them"""
+    assert resolve_reorder_index(DeviceReading, "device_id") == (
+        "ix_devicereading_device_id"
+    )
+    assert resolve_reorder_index(DeviceReading, "ix_devicereading_device_id") == (
+        "ix_devicereading_device_id"
+    )
+    # Indexes created outside the model are passed through
+    assert resolve_reorder_index(DeviceReading, "devicereading_time_idx") == (
+        "devicereading_time_idx"
+    )
+
+    with pytest.raises(InvalidReorderIndex, match="No index on reading"):
+        resolve_reorder_index(DeviceReading, "reading")
+    with pytest.raises(InvalidReorderIndex, match="not found"):
+        resolve_reorder_index(DeviceReading, ("device_id", "missing"))
+
+
+def test_reorder_policy_created(session: Session):
+    """Test create_all adds a reorder policy for the declared index"""
+    policies = {
+        policy.hypertable_name: policy for policy in list_reorder_policies(session)
+    }
+
+    assert isinstance(policies["devicereading"], ReorderPolicySchema)
+    assert policies["devicereading"].index_name == "ix_devicereading_device_id"
+    assert Metric.__tablename__ not in policies
+
+
+def test_add_and_drop_reorder_policy(session: Session):
+    """Test adding and dropping a reorder policy by table name"""
+    add_reorder_policy(
+        session, table_name=Metric.__tablename__, index_name="ix_metric_sensor_id"
+    )
+    names = [policy.hypertable_name for policy in list_reorder_policies(session)]
+    assert Metric.__tablename__ in names
+
+    drop_reorder_policy(session, Metric.__tablename__)
+    names = [policy.hypertable_name for policy in list_reorder_policies(session)]
+    assert Metric.__tablename__ not in names
+
+
+def test_sync_reorder_policies_replaces_index(session: Session, monkeypatch):
+    """Test a changed __reorder_index__ replaces the existing policy"""
+    monkeypatch.setattr(DeviceReading, "__reorder_index__", "devicereading_time_idx")
+
+    sync_reorder_policies(session, DeviceReading)
+
+    [policy] = [
+        policy
+        for policy in list_reorder_policies(session)
+        if policy.hypertable_name == "devicereading"
+    ]
+    assert policy.index_name == "devicereading_time_idx"
+
+
+def test_reorder_chunks(session: Session, engine: Engine):
+    """Test reordering the chunks of a backfilled range"""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    readings = [
+        DeviceReading(
+            device_id=hour % 5,
+            reading=float(hour),
+            time=base_time + timedelta(hours=hour),
+        )
+        for hour in range(24 * 14)
+    ]
+    session.add_all(readings)
+    session.commit()
+
+    reordered = reorder_chunks(engine, DeviceReading)
+
+    assert len(reordered) > 0
+    assert all(name.startswith("_timescaledb_internal.") for name in reordered)
+    assert (
+        reorder_chunks(engine, DeviceReading, older_than=base_time - timedelta(days=1))
+        == []
+    )
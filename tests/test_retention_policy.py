@@ -7,10 +7,14 @@ from sqlmodel import Session
 from timescaledb import create_hypertable
 from timescaledb.hypertables.list import is_hypertable, list_hypertables
 from timescaledb.retention import (
+    RetentionPolicySchema,
     add_retention_policy,
     drop_retention_policy,
+    get_retention_policies,
+    get_retention_policy,
     list_retention_policies,
     sync_retention_policies,
+    update_retention_policy,
 )
 
 from .conftest import RetentionModel
@@ -178,3 +182,66 @@ def test_list_retention_policies_empty(engine):
         policies = list_retention_policies(session)
         print(f"Policies after clearing: {policies}")
         assert policies is None or len(policies) == 0
+
+
+def test_get_retention_policy_with_job_stats(session: Session):
+    """Test the retention policy is returned with its drop_after and job stats"""
+    policy = get_retention_policy(session, RetentionModel)
+
+    assert isinstance(policy, RetentionPolicySchema)
+    assert policy.hypertable_name == RetentionModel.__tablename__
+    assert policy.drop_after is not None
+    assert policy.job_id > 0
+    assert policy.total_failures in (None, 0)
+
+    names = [policy.hypertable_name for policy in get_retention_policies(session)]
+    assert RetentionModel.__tablename__ in names
+
+    drop_retention_policy(session, RetentionModel.__tablename__)
+    session.commit()
+    assert get_retention_policy(session, RetentionModel) is None
+
+
+def test_update_retention_policy(session: Session):
+    """Test a differing drop_after replaces the policy, an equal one does not"""
+    table_name = RetentionModel.__tablename__
+    drop_retention_policy(session, table_name)
+    add_retention_policy(session, table_name=table_name, drop_after="1 year")
+    session.commit()
+
+    change = update_retention_policy(
+        session, table_name=table_name, drop_after="12 months"
+    )
+    assert change.action == "unchanged"
+
+    change = update_retention_policy(
+        session, table_name=table_name, drop_after="2 years", dry_run=True
+    )
+    assert change.action == "replace"
+    assert change.dry_run
+    assert get_retention_policy(session, table_name=table_name).drop_after == ("1 year")
+
+    change = update_retention_policy(
+        session, table_name=table_name, drop_after="2 years"
+    )
+    assert change.action == "replace"
+    assert get_retention_policy(session, table_name=table_name).drop_after == (
+        "2 years"
+    )
+
+
+def test_sync_retention_policies_replaces_changed_drop_after(
+    session: Session, monkeypatch
+):
+    """Test changing __drop_after__ on a model takes effect on sync"""
+    monkeypatch.setattr(RetentionModel, "__drop_after__", "INTERVAL 5 years")
+
+    [dry_run] = sync_retention_policies(session, RetentionModel, dry_run=True)
+    assert dry_run.action == "replace"
+
+    [change] = sync_retention_policies(session, RetentionModel)
+    assert change.action == "replace"
+    assert get_retention_policy(session, RetentionModel).drop_after == "5 years"
+
+    [change] = sync_retention_policies(session, RetentionModel)
+    assert change.action == "unchanged"
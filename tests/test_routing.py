@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from timescaledb.engine import create_engine
+from timescaledb.hypertables import list_hypertables
+from timescaledb.queries import time_bucket_query
+from timescaledb.routing import (
+    PRIMARY,
+    REPLICA,
+    EngineRouter,
+    current_route,
+    on_primary,
+    read_only,
+    use_replica,
+)
+from timescaledb.utils import get_utc_now
+
+from .conftest import Metric
+
+
+def test_route_decorators():
+    """Test read-only helpers keep the route of an enclosing write helper"""
+
+    @read_only
+    def read():
+        return current_route()
+
+    @read_only
+    def read_many():
+        yield current_route()
+        yield current_route()
+
+    @on_primary
+    def write():
+        return read(), list(read_many())
+
+    assert current_route() is None
+    assert read() == REPLICA
+    assert write() == (PRIMARY, [PRIMARY, PRIMARY])
+
+    rows = read_many()
+    assert next(rows) == REPLICA
+    # The route does not leak to the caller between items
+    assert current_route() is None
+    assert list(rows) == [REPLICA]
+
+    with use_replica():
+        assert write() == (PRIMARY, [PRIMARY, PRIMARY])
+
+
+def _count_statements(engine: Engine) -> list:
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def test_engine_router(engine: Engine):
+    """Test reads go to the replica, writes and reads after writes to the primary"""
+    # A second pool on the same server stands in for the replica
+    replica = create_engine(engine.url)
+    router = EngineRouter(engine, [replica], max_lag_seconds=5, check_interval=60)
+    primary_statements = _count_statements(engine)
+    replica_statements = _count_statements(replica)
+
+    [status] = router.status()
+    assert status.healthy and status.lag_seconds == 0
+    replica_statements.clear()
+
+    with router.session() as session:
+        assert any(
+            hypertable.hypertable_name == Metric.__tablename__
+            for hypertable in list_hypertables(session)
+        )
+        assert replica_statements and not primary_statements
+
+        session.add(Metric(sensor_id=1, value=1.0, time=get_utc_now()))
+        session.flush()
+        replica_statements.clear()
+        # Uncommitted writes are only visible on the primary
+        time_bucket_query(
+            session,
+            Metric,
+            metric_field="value",
+            filters=[Metric.time > get_utc_now() - timedelta(hours=1)],
+        )
+        assert not replica_statements
+        session.commit()
+
+        primary_statements.clear()
+        rows = time_bucket_query(session, Metric, metric_field="value")
+        assert len(rows) == 1
+        assert replica_statements and not primary_statements
+    replica.dispose()
+
+
+def test_engine_router_fallback(engine: Engine):
+    """Test unreachable replicas are skipped"""
+    unreachable = create_engine(
+        engine.url.set(port=1), connect_args={"connect_timeout": 1}
+    )
+    router = EngineRouter(engine, [unreachable])
+    [status] = router.status()
+    assert not status.healthy and status.error
+    assert router.get_replica() is engine
+
+    with router.session() as session:
+        list_hypertables(session)
+    unreachable.dispose()
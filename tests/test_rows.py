@@ -0,0 +1,60 @@
+import dataclasses
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session
+
+from timescaledb.rows import field_index, row_class, select_rows, stream_rows
+
+from .conftest import Metric
+
+
+def test_row_class():
+    """Test row classes are frozen slots dataclasses built once per selection"""
+    cls = row_class(Metric)
+    assert cls is row_class(Metric)
+    assert dataclasses.is_dataclass(cls)
+    assert cls.__slots__ == ("id", "time", "sensor_id", "value")
+    assert row_class(Metric, ["sensor_id", Metric.value]).__slots__ == (
+        "sensor_id",
+        "value",
+    )
+    assert field_index(Metric, [Metric.value, "time"]) == {"value": 0, "time": 1}
+
+    row = cls(1, datetime(2024, 1, 1, tzinfo=timezone.utc), 1, 2.0)
+    assert not hasattr(row, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        row.value = 3.0
+    with pytest.raises(ValueError):
+        row_class(Metric, ["missing"])
+
+
+def test_select_and_stream_rows(session: Session):
+    """Test rows are read without ORM instances, in full and streamed"""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    session.add_all(
+        Metric(sensor_id=i % 2, value=float(i), time=base_time + timedelta(hours=i))
+        for i in range(10)
+    )
+    session.commit()
+    session.expunge_all()
+
+    rows = select_rows(
+        session, Metric, filters=[Metric.sensor_id == 1], order_by=[Metric.time]
+    )
+    assert [row.value for row in rows] == [1.0, 3.0, 5.0, 7.0, 9.0]
+    assert type(rows[0]) is row_class(Metric)
+    assert len(session.identity_map) == 0
+
+    tuples = select_rows(
+        session, Metric, columns=["time", "value"], as_tuples=True, limit=3
+    )
+    assert len(tuples) == 3
+    assert all(type(row) is tuple and len(row) == 2 for row in tuples)
+
+    streamed = list(stream_rows(session, Metric, order_by=[Metric.time], batch_size=3))
+    assert [row.value for row in streamed] == [float(i) for i in range(10)]
+    assert len(session.identity_map) == 0
+
+    with pytest.raises(ValueError):
+        list(stream_rows(session, Metric, batch_size=0))
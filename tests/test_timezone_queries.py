@@ -0,0 +1,142 @@
+import re
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+import timescaledb
+from timescaledb.hyperfunctions import time_bucket_gapfill
+
+from .conftest import Metric
+
+CHUNK_PATTERN = re.compile(r"_hyper_\d+_\d+_chunk")
+
+
+def _add_daily_metrics(session: Session, base_time: datetime, days: int):
+    metrics = [
+        Metric(sensor_id=1, value=float(day), time=base_time + timedelta(days=day))
+        for day in range(days)
+    ]
+    session.add_all(metrics)
+    session.commit()
+
+
+def _explain_last_select(session: Session, engine: Engine, run_query) -> set:
+    """Run a helper, then EXPLAIN the SELECT it sent and return the chunks scanned."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        run_query()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[-1]
+    plan = session.connection().exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return set(CHUNK_PATTERN.findall("\n".join(row[0] for row in plan)))
+
+
+def test_time_bucket_gapfill_keeps_timestamptz_bounds():
+    """Test gapfill bounds are typed from the time column and keep their offset."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    finish = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    bucket = time_bucket_gapfill("1 hour", Metric.time, start=start, finish=finish)
+
+    compiled = bucket.compile().string
+    assert "'2024-01-01 00:00:00+00:00'::timestamptz" in compiled
+    assert "::timestamp," not in compiled
+
+
+def test_time_bucket_gapfill_localizes_naive_bounds():
+    """Test naive gapfill bounds are interpreted in the given timezone."""
+    bucket = time_bucket_gapfill(
+        "1 day",
+        Metric.time,
+        timezone="America/New_York",
+        start=datetime(2024, 1, 1),
+        finish=datetime(2024, 1, 8),
+    )
+
+    compiled = bucket.compile().string
+    assert "'America/New_York'" in compiled
+    assert "'2024-01-01 00:00:00-05:00'::timestamptz" in compiled
+
+
+def test_time_bucket_query_local_day_boundaries(session: Session):
+    """Test daily buckets start at local midnight when a timezone is given."""
+    session.add(
+        Metric(
+            sensor_id=1,
+            value=1.0,
+            time=datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
+        )
+    )
+    session.commit()
+
+    results = timescaledb.queries.time_bucket_query(
+        session,
+        Metric,
+        interval="1 day",
+        metric_field="value",
+        timezone="America/New_York",
+    )
+
+    assert len(results) == 1
+    # Midnight in New York (EST) is 05:00 UTC
+    assert results[0]["bucket"] == datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc)
+
+
+def test_time_bucket_gapfill_query_with_timezone(session: Session):
+    """Test gapfill with a timezone keeps aware bounds and local buckets."""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    _add_daily_metrics(session, base_time, days=5)
+
+    results = timescaledb.queries.time_bucket_gapfill_query(
+        session,
+        Metric,
+        interval="1 day",
+        metric_field="value",
+        start=datetime(2024, 1, 1),
+        finish=datetime(2024, 1, 4),
+        timezone="Europe/Berlin",
+    )
+
+    assert len(results) == 3
+    # Midnight in Berlin (CET) is 23:00 UTC the day before
+    assert results[0]["bucket"] == datetime(2023, 12, 31, 23, 0, tzinfo=timezone.utc)
+
+
+def test_time_bucket_gapfill_query_excludes_chunks(session: Session, engine: Engine):
+    """Test the plan of a timezone-aware gapfill query only touches chunks in range."""
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    _add_daily_metrics(session, base_time, days=60)
+
+    total_chunks = session.execute(
+        text("SELECT count(*) FROM show_chunks(:table_name)"),
+        {"table_name": Metric.__tablename__},
+    ).scalar()
+    assert total_chunks > 2
+
+    start = base_time + timedelta(days=30)
+    scanned = _explain_last_select(
+        session,
+        engine,
+        lambda: timescaledb.queries.time_bucket_gapfill_query(
+            session,
+            Metric,
+            interval="1 hour",
+            metric_field="value",
+            start=start,
+            finish=start + timedelta(days=1),
+            timezone="Europe/Berlin",
+        ),
+    )
+
+    assert 0 < len(scanned) <= 2
+    assert len(scanned) < total_chunks
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from timescaledb import queries
+from timescaledb.queries import counter_agg_query, time_weight_query
+
+from .conftest import Metric
+
+
+@pytest.fixture(name="built_queries")
+def built_queries_fixture(monkeypatch):
+    """Capture the statements the query helpers would execute."""
+    built = []
+    monkeypatch.setattr(
+        queries,
+        "_fetch_mappings",
+        lambda session, query, model, operation: built.append(query) or [],
+    )
+    return built
+
+
+def compile_postgres(query):
+    return query.compile(dialect=postgresql.dialect())
+
+
+def test_counter_agg_query_sql(built_queries):
+    """Test counter_agg summaries are bounded to their bucket"""
+    assert (
+        counter_agg_query(
+            None,
+            Metric,
+            interval="5 minutes",
+            metric_field="value",
+            group_by="sensor_id",
+        )
+        == []
+    )
+
+    [query] = built_queries
+    compiled = compile_postgres(query)
+    bucket = "time_bucket('5 minutes'::interval, metric.time)"
+    bounded = (
+        f"counter_agg(metric.time, metric.value, "
+        f"tstzrange({bucket}, {bucket} + '5 minutes'::interval))"
+    )
+    assert f"{bucket} AS bucket" in compiled.string
+    assert "metric.sensor_id AS sensor_id" in compiled.string
+    assert f"rate({bounded}) AS rate" in compiled.string
+    assert f"delta({bounded}) AS delta" in compiled.string
+    assert f"extrapolated_rate({bounded}, " in compiled.string
+    assert "AS extrapolated_rate" in compiled.string
+    assert "prometheus" in compiled.params.values()
+    assert f"GROUP BY {bucket}, metric.sensor_id" in compiled.string
+
+
+def test_time_weight_query_sql(built_queries):
+    """Test time_weight averages use the requested method per bucket"""
+    time_weight_query(
+        None,
+        Metric,
+        interval="1 hour",
+        metric_field="value",
+        method="LOCF",
+        group_by="sensor_id",
+    )
+
+    [query] = built_queries
+    compiled = compile_postgres(query)
+    bucket = "time_bucket('1 hour'::interval, metric.time)"
+    assert f"{bucket} AS bucket" in compiled.string
+    assert "metric.sensor_id AS sensor_id" in compiled.string
+    assert "average(time_weight(" in compiled.string
+    assert "metric.time, metric.value)) AS average" in compiled.string
+    assert "LOCF" in compiled.params.values()
+    assert f"GROUP BY {bucket}, metric.sensor_id" in compiled.string
@@ -6,15 +6,17 @@ from sqlmodel import Field, SQLModel
 
 from timescaledb.exceptions import (
     InvalidChunkTimeInterval,
+    InvalidPartitionBy,
     InvalidTimeColumn,
     InvalidTimeColumnType,
 )
 from timescaledb.hypertables.validators import (
     validate_chunk_time_interval,
+    validate_partition_by,
     validate_time_column,
 )
 
-from .conftest import ManualHypertable, Metric, Record
+from .conftest import DeviceReading, ManualHypertable, Metric, Record
 
 
 def test_validate_time_column_valid():
@@ -87,3 +89,24 @@ def test_validate_chunk_time_interval_unsupported_type():
 
     with pytest.raises(InvalidChunkTimeInterval, match="Unsupported time column type"):
         validate_chunk_time_interval(UnsupportedTypeModel, "time", "INTERVAL 1 DAY")
+
+
+def test_validate_partition_by():
+    """Test validation of hash dimensions declared in __partition_by__"""
+    assert validate_partition_by(DeviceReading, "time", ("device_id", 4)) == [
+        ("device_id", 4)
+    ]
+    assert validate_partition_by(Metric, "time", None) == []
+
+    with pytest.raises(InvalidPartitionBy, match="not found"):
+        validate_partition_by(Metric, "time", ("device_id", 4))
+    with pytest.raises(InvalidPartitionBy, match="already the time column"):
+        validate_partition_by(Metric, "time", ("time", 4))
+    with pytest.raises(InvalidPartitionBy, match="more than once"):
+        validate_partition_by(Metric, "time", [("sensor_id", 2), ("sensor_id", 4)])
+    with pytest.raises(InvalidPartitionBy, match="Invalid number of partitions"):
+        validate_partition_by(Metric, "time", ("sensor_id", 0))
+    with pytest.raises(InvalidPartitionBy, match="Invalid partition by"):
+        validate_partition_by(Metric, "time", ["sensor_id"])
+    with pytest.raises(InvalidPartitionBy, match="missing from the primary key"):
+        validate_partition_by(Metric, "time", ("sensor_id", 4))